@@ -311,7 +311,7 @@ def scan(
     statistics_output: str | None = typer.Option(
         None,
         "--statistics-output",
-        help="Path for statistics JSON output file (default: auto-generated in output directory)",
+        help="Path for statistics JSON output file; a .msgpack suffix writes MessagePack (default: auto-generated in output directory)",
     ),
     # Confidence filtering
     min_confidence: float = typer.Option(
@@ -629,6 +629,7 @@ def scan(
         "xlsx": ".xlsx",
         "html": ".html",
         "sarif": ".sarif",
+        "statistics-msgpack": ".msgpack",
     }
     extension = extension_map.get(output_format, ".csv")
     output_file_path = output_dir + outslug + "_findings" + extension
@@ -38,18 +38,9 @@ if TYPE_CHECKING:
     from gliner import GLiNER
 
 from core import constants
+from core.file_stat import regular_file_size
 from core.resources import load_config_types
-
-
-@dataclass
-class NerStats:
-    """Statistics for NER processing."""
-
-    total_chunks_processed: int = 0
-    total_entities_found: int = 0
-    total_processing_time: float = 0.0
-    entities_by_type: dict[str, int] = field(default_factory=dict)
-    errors: int = 0
+from core.statistics import NerStats
 
 
 @dataclass
@@ -73,6 +64,22 @@ class ScanConfig:
     # Backpressure cap: limits the number of in-flight async file callbacks so
     # that the scanner does not exhaust OS file descriptors on deep directory trees.
     max_pending_futures: int = 512
+    # Threads listing directories concurrently during the walk.  Worth raising on
+    # NFS/SMB shares where every directory listing is a network round-trip; 1
+    # keeps the deterministic single-threaded os.walk order.
+    walk_workers: int = 1
+    # Process files whose data is already in the page cache first and defer
+    # cold ones until the walk is done (Linux >= 6.5, cachestat(2)); a no-op
+    # elsewhere.
+    prefer_warm_files: bool = False
+    # Chunks an iterator-based processor (PDF, MBOX, ZIP, ...) may extract ahead
+    # of the detection engines on a background thread; 0 extracts inline.
+    extraction_prefetch_chunks: int = 4
+    # Adjacent chunks of one document (PDF pages, slides, paragraphs) are merged
+    # up to this many characters before detection, so they don't each pay the
+    # engines' fixed per-call cost; separate records (table rows, mailbox
+    # messages, archive members) are never merged. 0 disables merging.
+    chunk_coalesce_chars: int = 1500
     # Glob patterns for files/directories to skip during scanning.
     exclude_patterns: list[str] = field(default_factory=list)
 
@@ -123,9 +130,10 @@ class ScanConfig:
             if not real_file.startswith(real_base + os.sep) and real_file != real_base:
                 return False, "Path traversal attempt detected"
 
-            # Check file size limit
-            if os.path.isfile(file_path):
-                file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+            # Check file size limit (regular files only)
+            file_size = regular_file_size(file_path)
+            if file_size is not None:
+                file_size_mb = file_size / (1024 * 1024)
                 if file_size_mb > self.max_file_size_mb:
                     return (
                         False,
@@ -405,8 +413,16 @@ class Config:
     max_processing_time_seconds: int = 300
     # Performance tuning
     # - max_pending_futures: bounds memory usage in FileScanner for async callbacks
+    # - walk_workers: threads listing directories concurrently (1 = sequential walk)
+    # - prefer_warm_files: process page-cache resident files before cold ones
     # - engine_concurrency_limits: per-engine concurrency caps (applied by engines that manage concurrency internally)
+    # - extraction_prefetch_chunks: text chunks extracted ahead of detection (0 = inline)
+    # - chunk_coalesce_chars: merge short chunks of one document up to this size (0 = off)
     max_pending_futures: int = 512
+    walk_workers: int = 1
+    prefer_warm_files: bool = False
+    extraction_prefetch_chunks: int = 4
+    chunk_coalesce_chars: int = 1500
     engine_concurrency_limits: dict[str, int] = field(default_factory=dict)
 
     # Tuning limits (configurable via settings file)
@@ -626,6 +642,25 @@ class Config:
         if isinstance(max_pending_futures, int) and max_pending_futures > 0:
             self.max_pending_futures = int(max_pending_futures)
 
+        walk_workers = settings.get("walk_workers")
+        if isinstance(walk_workers, int) and walk_workers > 0:
+            self.walk_workers = int(walk_workers)
+
+        prefer_warm_files = settings.get("prefer_warm_files")
+        if isinstance(prefer_warm_files, bool):
+            self.prefer_warm_files = prefer_warm_files
+
+        extraction_prefetch_chunks = settings.get("extraction_prefetch_chunks")
+        if (
+            isinstance(extraction_prefetch_chunks, int)
+            and extraction_prefetch_chunks >= 0
+        ):
+            self.extraction_prefetch_chunks = int(extraction_prefetch_chunks)
+
+        chunk_coalesce_chars = settings.get("chunk_coalesce_chars")
+        if isinstance(chunk_coalesce_chars, int) and chunk_coalesce_chars >= 0:
+            self.chunk_coalesce_chars = int(chunk_coalesce_chars)
+
         limits = settings.get("engine_concurrency_limits")
         if isinstance(limits, dict):
             cleaned: dict[str, int] = {}
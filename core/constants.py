@@ -9,6 +9,24 @@ VERSION: str = "1.0.0"
 # with meaningless matches.
 MIN_PDF_TEXT_LENGTH: int = 10
 
+# PDF text extraction backend: "pdfminer" (pdfminer.six, pure Python, always
+# installed) or "pdfium" (PDFium via the optional ``pypdfium2`` package, native and
+# over an order of magnitude faster; falls back to pdfminer when not installed).
+# The two lay out text slightly differently, hence opt-in. Overridable via the
+# ``PBD_PDF_BACKEND`` env var.
+PDF_BACKEND: str = "pdfminer"
+
+# Worker processes used to lay out the pages of a single PDF. pdfminer's layout
+# analysis is pure Python and holds the GIL, so only separate processes extract
+# pages in parallel. 1 keeps extraction sequential (the scanner already works on
+# several files at once); 0 uses one worker per CPU. Overridable via the
+# ``PBD_PDF_WORKERS`` env var.
+PDF_WORKERS: int = 1
+
+# PDFs with fewer pages than this are always extracted sequentially: starting the
+# worker processes costs more than laying out a handful of pages.
+PDF_PARALLEL_MIN_PAGES: int = 4
+
 # 0.5 is the GLiNER default threshold: below it the model's self-assessed confidence
 # is too low to trust as a PII finding; above it, precision is acceptable for audits.
 # Operators can lower the threshold (–-ner-threshold) to increase recall at the cost
@@ -539,8 +539,11 @@ class PydanticAIEngine:
             from file_processors.image_processor import ImageProcessor
 
             img_processor = ImageProcessor()
-            image_base64 = img_processor.get_image_base64(image_path)
+            # The MIME check is a dict lookup; do it before reading the image.
             image_mime = img_processor.get_image_mime_type(image_path)
+            image_base64 = (
+                img_processor.get_image_base64(image_path) if image_mime else None
+            )
         except Exception as e:
             self.config.logger.error(f"Failed to read image {image_path}: {e}")
             return []
@@ -552,6 +555,9 @@ class PydanticAIEngine:
             return []
 
         image_data_url = f"data:{image_mime};base64,{image_base64}"
+        # Only the data URL is needed from here on; don't keep a second copy of
+        # the encoded image alive for the duration of the request and retries.
+        del image_base64
 
         prompt = self._create_image_prompt(labels)
         system_prompt = (
@@ -0,0 +1,184 @@
+"""Cheap file metadata lookups for the scan hot path.
+
+Every candidate file is stat'ed for the size limit check. On NFS a plain
+``stat(2)`` revalidates attributes with the server, a network round trip per
+file. Linux's ``statx(2)`` accepts ``AT_STATX_DONT_SYNC``, which lets the
+kernel answer from its attribute cache instead. Slightly stale attributes are
+fine here: the size only gates the ``max_file_size_mb`` limit and the progress
+log.
+
+``statx`` is reached through the C library via ``ctypes`` (glibc >= 2.28 exports
+it), so no syscall numbers are hard-coded. Where it is unavailable (other
+platforms, musl, old glibc, seccomp-filtered containers) ``os.stat`` is used.
+
+:func:`page_cache_residency` uses ``cachestat(2)`` (Linux >= 6.5) to tell how
+much of a file is already in the page cache, so ``prefer_warm_files`` can
+process warm files first instead of stalling on cold disk reads. glibc has no
+wrapper yet, so it goes through ``syscall(2)``; the number is the same on every
+architecture that uses the generic syscall table.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import mmap
+import os
+import platform
+import stat
+import struct
+import sys
+from collections.abc import Callable
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_SIZE = 0x0200
+# struct statx is 256 bytes; only stx_mask, stx_mode and stx_size are read.
+_STATX_BUF_SIZE = 256
+_STX_MASK = struct.Struct("=I")  # offset 0
+_STX_MODE = struct.Struct("=H")  # offset 28
+_STX_SIZE = struct.Struct("=Q")  # offset 40
+
+
+def _load_statx() -> Callable[..., int] | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.statx
+    except (AttributeError, OSError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.c_char_p,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+_statx = _load_statx()
+
+
+def _stat_size(path: str) -> int | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+
+def _statx_size(path: str) -> int | None:
+    assert _statx is not None
+    buf = ctypes.create_string_buffer(_STATX_BUF_SIZE)
+    if (
+        _statx(
+            _AT_FDCWD,
+            os.fsencode(path),
+            _AT_STATX_DONT_SYNC,
+            _STATX_TYPE | _STATX_SIZE,
+            buf,
+        )
+        != 0
+    ):
+        # ENOSYS/EPERM (kernel or sandbox without statx) fall back to stat;
+        # anything else (ENOENT, EACCES, ...) would fail there too.
+        return _stat_size(path)
+    raw = buf.raw
+    (mask,) = _STX_MASK.unpack_from(raw, 0)
+    if mask & (_STATX_TYPE | _STATX_SIZE) != _STATX_TYPE | _STATX_SIZE:
+        return _stat_size(path)
+    (mode,) = _STX_MODE.unpack_from(raw, 28)
+    if not stat.S_ISREG(mode):
+        return None
+    (size,) = _STX_SIZE.unpack_from(raw, 40)
+    return int(size)
+
+
+def regular_file_size(path: str) -> int | None:
+    """Return the size in bytes of *path* if it is a regular file, else None.
+
+    Follows symlinks, like ``os.path.isfile``/``os.path.getsize``. Returns None
+    for directories, special files and paths that cannot be stat'ed.
+    """
+    if _statx is not None:
+        return _statx_size(path)
+    return _stat_size(path)
+
+
+_SYS_CACHESTAT = 451
+
+
+class _CachestatRange(ctypes.Structure):
+    _fields_ = [("off", ctypes.c_uint64), ("len", ctypes.c_uint64)]
+
+
+class _Cachestat(ctypes.Structure):
+    _fields_ = [
+        ("nr_cache", ctypes.c_uint64),
+        ("nr_dirty", ctypes.c_uint64),
+        ("nr_writeback", ctypes.c_uint64),
+        ("nr_evicted", ctypes.c_uint64),
+        ("nr_recently_evicted", ctypes.c_uint64),
+    ]
+
+
+def _load_syscall() -> Callable[..., int] | None:
+    # Alpha offsets the generic syscall numbers; everything else shares them.
+    if not sys.platform.startswith("linux") or platform.machine() == "alpha":
+        return None
+    try:
+        func = ctypes.CDLL(None, use_errno=True).syscall
+    except (AttributeError, OSError):
+        return None
+    func.restype = ctypes.c_long
+    return func
+
+
+_syscall = _load_syscall()
+# Cleared on the first ENOSYS/EPERM so unsupported kernels pay for one probe only.
+_cachestat_supported = _syscall is not None
+
+
+def page_cache_residency(path: str, size: int) -> float | None:
+    """Return the fraction (0.0-1.0) of *path*'s pages that are in the page cache.
+
+    Args:
+        path: File to check.
+        size: File size in bytes, used to compute the total page count.
+
+    Returns:
+        The cached fraction, or None when ``cachestat(2)`` is unavailable or the
+        file cannot be opened.
+    """
+    global _cachestat_supported
+    if not _cachestat_supported or _syscall is None:
+        return None
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    except OSError:
+        return None
+    try:
+        # len=0 means "to the end of the file".
+        cstat_range = _CachestatRange(0, 0)
+        cstat = _Cachestat()
+        if (
+            _syscall(
+                ctypes.c_long(_SYS_CACHESTAT),
+                ctypes.c_int(fd),
+                ctypes.byref(cstat_range),
+                ctypes.byref(cstat),
+                ctypes.c_uint(0),
+            )
+            != 0
+        ):
+            if ctypes.get_errno() in (errno.ENOSYS, errno.EPERM):
+                _cachestat_supported = False
+            return None
+    finally:
+        os.close(fd)
+    pages = max(1, -(-size // mmap.PAGESIZE))
+    return min(1.0, cstat.nr_cache / pages)
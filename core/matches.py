@@ -91,13 +91,15 @@ for conf in config_ainer:
     config_ainer_sorted[conf["term"]] = conf
 
 
-@dataclass
+@dataclass(slots=True)
 class PiiMatch:
     """A single PII finding produced by any detection engine.
 
     Instances are immutable after creation (engines must not mutate them).
     The ``severity`` field is auto-populated from the type label at creation
     time so that output writers always have a pre-classified value.
+    Slotted, since ``PiiMatchContainer.pii_matches`` keeps every match of a
+    scan in memory.
     """
 
     # The text that represents PII
@@ -0,0 +1,139 @@
+"""Background prefetching of extracted text chunks.
+
+Iterator-based file processors (PDF, CSV, SQLite, MBOX, ZIP) yield a document chunk by
+chunk.  Consumed inline, the worker thread alternates between I/O-bound extraction
+(reading pages, inflating archive members) and CPU-bound detection, so one side is
+always idle while the other runs.  :func:`prefetch` moves extraction onto a helper
+thread that fills a bounded queue, letting the next chunk be read while the current
+one is being analysed.
+
+The queue bound keeps memory flat: the producer blocks once ``maxsize`` chunks are
+waiting, so a fast extractor cannot run arbitrarily far ahead of slow engines.
+
+:func:`coalesce` complements it on the consuming side: processors that yield many
+tiny chunks of one document (one per short PDF page or slide) are merged into
+fewer, larger texts so each detection engine pays its fixed per-call cost (tokenizer
+setup, model invocation, lock round-trip) less often.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Generator, Iterable, Iterator
+from typing import TypeVar
+
+from core import skip_counters
+
+T = TypeVar("T")
+
+# Marks the end of the producer's output (normal exhaustion or error).
+_SENTINEL = object()
+# How often a blocked producer re-checks whether the consumer has gone away.
+_PUT_POLL_SECONDS = 0.05
+
+
+def prefetch(iterable: Iterable[T], maxsize: int) -> Generator[T, None, None]:
+    """Yield the items of *iterable*, producing them on a background thread.
+
+    Exceptions raised by *iterable* are re-raised in the consuming thread, in
+    order, once the items produced before them have been yielded.  Skip counts
+    recorded via :mod:`core.skip_counters` while producing are transferred to the
+    consuming thread, so ``TextProcessor``'s per-file drain still sees them.
+
+    Closing the returned generator early (``break`` out of the loop, per-file
+    timeout) stops the producer after its current item.
+
+    Args:
+        iterable: Source of items, typically a file processor's chunk generator.
+        maxsize: Maximum number of items buffered ahead of the consumer.  Values
+            <= 0 disable prefetching and iterate *iterable* inline.
+
+    Yields:
+        The items of *iterable*, in order.
+    """
+    if maxsize <= 0:
+        yield from iterable
+        return
+
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    skipped: dict[str, int] = {}
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not _put(item):
+                    break
+        except BaseException as exc:
+            errors.append(exc)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+            skipped.update(skip_counters.drain())
+            _put(_SENTINEL)
+
+    producer = threading.Thread(target=_produce, name="pbd-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _SENTINEL:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        producer.join()
+        for reason, count in skipped.items():
+            skip_counters.record_skip(reason, count)
+
+
+def coalesce(chunks: Iterable[str], max_chars: int) -> Iterator[str]:
+    """Merge adjacent short text chunks into texts of up to *max_chars* characters.
+
+    Chunks are joined with a newline so that no token straddles the seam, and
+    are never split: a chunk longer than *max_chars* is yielded on its own.
+    Blank chunks are dropped.  Offsets reported for a merged text are relative
+    to that text, which is also what ``TextProcessor`` passes as the match
+    source, so context extraction stays consistent.
+
+    Args:
+        chunks: Text chunks in document order.
+        max_chars: Target maximum size of a merged text.  Values <= 0 disable
+            merging (blank chunks are still dropped).
+
+    Yields:
+        Merged texts, in document order.
+    """
+    pending: list[str] = []
+    pending_len = 0
+    for chunk in chunks:
+        if not chunk or chunk.isspace():
+            continue
+        if pending and pending_len + 1 + len(chunk) > max_chars:
+            yield "\n".join(pending)
+            pending = []
+            pending_len = 0
+        if pending:
+            pending_len += 1
+        pending.append(chunk)
+        pending_len += len(chunk)
+    if pending:
+        yield "\n".join(pending)
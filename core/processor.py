@@ -33,21 +33,35 @@ that do not support concurrent inference (``thread_safe=False``).
 import re
 import threading
 import time
+from collections import Counter
 from collections.abc import Callable
-from contextlib import nullcontext
-
-import docx.opc.exceptions
+from contextlib import AbstractContextManager, nullcontext
 
 from core import skip_counters
 from core.config import Config
 from core.engines import EngineRegistry
 from core.engines.base import DetectionEngine
 from core.matches import PiiMatchContainer
+from core.pipeline import coalesce, prefetch
 from core.scanner import FileInfo
-from core.statistics import Statistics
-from file_processors import FileProcessorRegistry
+from core.statistics import NerStats, Statistics
+from file_processors import FileProcessingError, FileProcessorRegistry
 from file_processors.image_processor import ImageProcessor
 
+# Engines whose results are booked in NerStats (all AI/NER engines, not regex).
+_NER_STATS_ENGINES = frozenset(
+    {
+        "gliner",
+        "spacy-ner",
+        "ollama",
+        "openai-compatible",
+        "multimodal",
+        "pydantic-ai",
+    }
+)
+# Stateless and reusable: stands in for the lock of thread-safe engines.
+_NO_LOCK = nullcontext()
+
 _ASCII_CONTROL_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
 # Remove ASCII control chars (except \n, \t, \r). This is what typically breaks NLP.
 _ASCII_CONTROL_TRANSLATION = {
@@ -86,6 +100,12 @@ class TextProcessor:
         self.config = config
         self.match_container = match_container
         self.statistics = statistics
+        # Both stats holders track the same NER counters; share one object so
+        # each result is booked once.  The per-scan Statistics wins because it
+        # is the one reported, and a long-lived Config must not leak totals
+        # from earlier scans into it.
+        if statistics is not None:
+            config.ner_stats = statistics.ner_stats
 
         # Thread locks for thread-safe operations
         self._process_lock = threading.Lock()
@@ -95,6 +115,9 @@ class TextProcessor:
         # Initialize engines from registry (may be refreshed if config changes)
         self.engines: list[DetectionEngine] = []
         self._engine_locks: dict[str, threading.Lock] = {}
+        self._engine_dispatch: list[
+            tuple[DetectionEngine, AbstractContextManager, bool]
+        ] = []
         self._enabled_engine_names: list[str] = []
         self._init_engines()
 
@@ -121,6 +144,16 @@ class TextProcessor:
             for engine in self.engines
             if not getattr(engine, "thread_safe", False)
         }
+        # Per-engine (engine, lock context, tracks NER stats) resolved once here
+        # rather than per chunk in process_text.
+        self._engine_dispatch = [
+            (
+                engine,
+                self._engine_locks.get(engine.name) or _NO_LOCK,
+                engine.name in _NER_STATS_ENGINES,
+            )
+            for engine in self.engines
+        ]
 
     def _ensure_engines_current(self) -> None:
         """Refresh engines if config flags have changed since initialization.
@@ -160,21 +193,35 @@ class TextProcessor:
             engines.append("pydantic-ai")
         return engines
 
+    def _ner_stats_targets(self) -> tuple[NerStats, ...]:
+        """Return the distinct NER stats objects to update.
+
+        Normally a single object (see ``__init__``); two only if a caller has
+        since replaced ``config.ner_stats`` or ``statistics.ner_stats``.
+        """
+        config_stats = self.config.ner_stats
+        if self.statistics is None or self.statistics.ner_stats is config_stats:
+            return (config_stats,)
+        return (config_stats, self.statistics.ner_stats)
+
     @staticmethod
-    def _update_ner_stats(stats, processing_time: float, results: list) -> None:
+    def _update_ner_stats(
+        stats: NerStats,
+        processing_time: float,
+        entity_count: int,
+        entities_by_type: Counter[str],
+    ) -> None:
         """Update NER statistics for a single stats object.
 
         Callers MUST hold ``_process_lock`` before invoking this method.
-        It mutates *stats* in-place without its own locking.
+        It mutates *stats* in-place without its own locking.  The per-type
+        tally is built by the caller *before* taking the lock so the critical
+        section only has to merge it.
         """
         stats.total_chunks_processed += 1
         stats.total_processing_time += processing_time
-        stats.total_entities_found += len(results)
-        for result in results:
-            entity_type = result.entity_type
-            stats.entities_by_type[entity_type] = (
-                stats.entities_by_type.get(entity_type, 0) + 1
-            )
+        stats.total_entities_found += entity_count
+        stats.entities_by_type.update(entities_by_type)
 
     def _handle_engine_error(
         self, engine_name: str, file_path: str, error: Exception, level: str = "warning"
@@ -182,9 +229,8 @@ class TextProcessor:
         """Record an engine processing error in stats and logs."""
         if engine_name in ("gliner", "spacy-ner", "pydantic-ai"):
             with self._process_lock:
-                self.config.ner_stats.errors += 1
-                if self.statistics:
-                    self.statistics.ner_stats.errors += 1
+                for stats in self._ner_stats_targets():
+                    stats.errors += 1
         msg = f"Engine '{engine_name}' error for {file_path}: {type(error).__name__}: {error}"
         log_fn = getattr(self.config.logger, level, self.config.logger.warning)
         log_fn(msg, exc_info=self.config.verbose)
@@ -250,12 +296,14 @@ class TextProcessor:
             file_path: Path to the file containing the text
             _deadline: Optional monotonic deadline (internal, set by process_file)
         """
-        if not text.strip():
-            return
-
         # Ensure engines reflect current config flags
         self._ensure_engines_current()
 
+        # Nothing will consume the text (no engine enabled/available), or there is
+        # nothing to analyse: skip the O(n) cleanup pass below entirely.
+        if not self.engines or not text or text.isspace():
+            return
+
         # Vector triage pre-filter: skip chunk if no PII signal detected
         if self.config.use_vector_triage:
             if not self._vector_triage_pass(text):
@@ -265,9 +313,8 @@ class TextProcessor:
         # Fast path: if none are present, avoid O(n) Python-level filtering.
         if _ASCII_CONTROL_RE.search(text):
             text = text.translate(_ASCII_CONTROL_TRANSLATION)
-
-        if not text.strip():
-            return
+            if not text or text.isspace():
+                return
 
         if self.config.verbose:
             # Log a snippet of the text to debug extraction quality
@@ -286,8 +333,10 @@ class TextProcessor:
             text, chunk_size, chunk_overlap
         )
 
+        labels = self.config.ner_labels
+
         # Run all enabled engines
-        for engine in self.engines:
+        for engine, lock_ctx, track_ner_stats in self._engine_dispatch:
             # Check per-file deadline before starting the next engine
             if _deadline is not None and time.monotonic() > _deadline:
                 self.config.logger.warning(
@@ -299,37 +348,29 @@ class TextProcessor:
             try:
                 results = []
                 for chunk, base_offset in text_chunks:
-                    chunk_results = self._run_engine_detect(
-                        engine, chunk, labels=self.config.ner_labels
-                    )
+                    with lock_ctx:
+                        chunk_results = engine.detect(chunk, labels)
                     # Translate chunk-local offsets to document-global offsets so the
                     # match container's context extraction and gating use source_text
                     # (the full pre-chunk text) consistently.
                     if base_offset:
                         for r in chunk_results:
-                            if getattr(r, "offset", None) is not None:
-                                r.offset += base_offset
+                            offset = getattr(r, "offset", None)
+                            if offset is not None:
+                                r.offset = offset + base_offset
                     results.extend(chunk_results)
 
                 processing_time = time.time() - start_time
                 all_results.extend(results)
 
                 # Update statistics for all AI/NER engines
-                if engine.name in [
-                    "gliner",
-                    "spacy-ner",
-                    "ollama",
-                    "openai-compatible",
-                    "multimodal",
-                    "pydantic-ai",
-                ]:
+                if track_ner_stats:
+                    entity_count = len(results)
+                    by_type = Counter(r.entity_type for r in results)
                     with self._process_lock:
-                        self._update_ner_stats(
-                            self.config.ner_stats, processing_time, results
-                        )
-                        if self.statistics:
+                        for stats in self._ner_stats_targets():
                             self._update_ner_stats(
-                                self.statistics.ner_stats, processing_time, results
+                                stats, processing_time, entity_count, by_type
                             )
 
             except RuntimeError as e:
@@ -373,9 +414,7 @@ class TextProcessor:
         This helper is used for both text and image detection to avoid bypassing
         synchronization in the image path.
         """
-        engine_lock = self._engine_locks.get(engine.name)
-        lock_ctx = engine_lock if engine_lock is not None else nullcontext()
-        with lock_ctx:
+        with self._engine_locks.get(engine.name) or _NO_LOCK:
             if image_path is not None:
                 # Only ever called with the PydanticAI engine (see process_file),
                 # which is the sole DetectionEngine implementation accepting
@@ -427,8 +466,11 @@ class TextProcessor:
                     engine.set_current_file(full_path, _file_hash)
                     break
 
-        # Get appropriate processor for this file type
-        processor = FileProcessorRegistry.get_processor(ext, full_path, mime_type)
+        # Get appropriate processor for this file type (the scanner has usually
+        # resolved it already while checking eligibility).
+        processor = getattr(file_info, "processor", None)
+        if processor is None:
+            processor = FileProcessorRegistry.get_processor(ext, full_path, mime_type)
 
         if processor is None:
             if self.config.verbose:
@@ -486,30 +528,41 @@ class TextProcessor:
             # Calculate deadline for this file
             deadline = file_start_time + file_timeout if file_timeout > 0 else None
 
-            # Extract text: some processors yield chunks (PDF, SQLite, MBOX, ZIP),
-            # others return a single string.
+            # Extract text: some processors yield chunks (PDF, CSV, SQLite, MBOX, ZIP,
+            # MSG, ODS/ODT, PPTX), others return a single string.
             result = processor.extract_text(full_path)
             if isinstance(result, str):
                 if result.strip():
                     self.process_text(result, full_path, _deadline=deadline)
             else:
-                # Iterator-based processor (PDF, SQLite, MBOX, ZIP)
-                for text_chunk in result:
-                    if deadline and time.monotonic() > deadline:
-                        self.config.logger.warning(
-                            f"Per-file timeout ({file_timeout}s) reached during text extraction: {full_path}"
-                        )
-                        break
-                    if text_chunk.strip():
+                # Iterator-based processor (PDF, CSV, SQLite, MBOX, ZIP, ...): extract the
+                # next chunks on a helper thread while this one runs detection.
+                # Short chunks of one document (pages, slides) are merged so engines
+                # see fewer calls; separate records (rows, messages) never are.
+                chunks = prefetch(result, self.config.extraction_prefetch_chunks)
+                coalesce_chars = (
+                    self.config.chunk_coalesce_chars if processor.COALESCE_CHUNKS else 0
+                )
+                try:
+                    for text_chunk in coalesce(chunks, coalesce_chars):
+                        if deadline and time.monotonic() > deadline:
+                            self.config.logger.warning(
+                                f"Per-file timeout ({file_timeout}s) reached during text extraction: {full_path}"
+                            )
+                            break
                         self.process_text(text_chunk, full_path, _deadline=deadline)
+                finally:
+                    chunks.close()
 
             if self.config.verbose:
                 self.config.logger.debug(f"Successfully processed: {full_path}")
 
             return True
 
-        except docx.opc.exceptions.PackageNotFoundError:
-            error_msg = "DOCX Empty Or Protected"
+        except FileProcessingError as excpt:
+            # e.g. "DOCX Empty Or Protected"; raised by the processor so this
+            # module does not import python-docx for the exception type
+            error_msg = str(excpt)
             self.config.logger.warning(f"{error_msg}: {full_path}")
             self._add_error(error_msg, full_path, error_callback)
             return False
@@ -6,11 +6,19 @@ so code does not depend on the current working directory.
 
 from __future__ import annotations
 
-import json
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    # Optional: orjson parses straight from bytes and is several times faster.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+# Resolved once at import time rather than on every cache miss.
+_CONFIG_TYPES_PATH = Path(__file__).resolve().parent / "config_types.json"
+
 
 @lru_cache(maxsize=1)
 def load_config_types() -> dict[str, Any]:
@@ -21,16 +29,15 @@ def load_config_types() -> dict[str, Any]:
     2) Packaged resource via ``importlib.resources`` (wheel installs)
     """
     # Direct path sibling: works for editable installs and direct source runs
-    sibling = Path(__file__).resolve().parent / "config_types.json"
-    if sibling.exists():
-        return json.loads(sibling.read_text(encoding="utf-8"))
+    if _CONFIG_TYPES_PATH.exists():
+        return _json_loads(_CONFIG_TYPES_PATH.read_bytes())
 
     try:
         # Python 3.9+: `importlib.resources.files`
         import importlib.resources as resources
 
         data = resources.files("core").joinpath("config_types.json").read_bytes()
-        return json.loads(data.decode("utf-8"))
+        return _json_loads(data)
     except Exception as e:  # pragma: no cover
         raise FileNotFoundError(
             "Could not locate 'config_types.json' (core/ or packaged resource)."
@@ -463,8 +463,11 @@ def write_statistics_output(
 
     from core.writers import PrivacyStatisticsWriter
 
-    stats_writer = PrivacyStatisticsWriter(statistics_file_path)
     try:
+        stats_writer = PrivacyStatisticsWriter(
+            statistics_file_path,
+            use_msgpack=statistics_file_path.lower().endswith(".msgpack"),
+        )
         stats_writer.finalize(
             metadata={
                 "statistics": aggregated_stats,
@@ -285,6 +285,8 @@ class ScanRunner:
 
             if statistics_aggregator:
                 with _stats_lock:
+                    # Bucketed by path suffix, like add_match; FileInfo.extension
+                    # may be inferred by magic detection and would split the stats.
                     statistics_aggregator.add_file_scanned(
                         file_info.path, was_analyzed=True
                     )
@@ -1,19 +1,45 @@
 """File scanner for discovering and validating files."""
 
+import concurrent.futures
 import fnmatch
+import logging
 import os
+import queue
 import threading
-from collections.abc import Callable
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 
 from tqdm import tqdm
 
 from core.config import Config
+from core.file_stat import page_cache_residency, regular_file_size
 from core.file_type_detector import FileTypeDetector
-from file_processors import FileProcessorRegistry
+from file_processors import BaseFileProcessor, FileProcessorRegistry
 
+# Number of files between progress-bar postfix refreshes.
+_PROGRESS_POSTFIX_EVERY = 256
+# With prefer_warm_files, files with less of their data cached are deferred.
+_WARM_RESIDENCY = 0.5
+# Marks the end of a parallel walk in the batch queue.
+_WALK_DONE = object()
+# How often a walk worker blocked on a full queue re-checks for cancellation.
+_WALK_PUT_POLL_SECONDS = 0.05
 
-@dataclass
+
+def _extension_of(name: str) -> str:
+    """Return the lower-cased extension of file *name* (``os.path.splitext`` rules).
+
+    Works on the bare name from ``DirEntry.name``, so only the basename is
+    scanned; leading dots (``.bashrc``) do not start an extension.
+    """
+    head, sep, tail = name.rpartition(".")
+    if not sep or not head.strip("."):
+        return ""
+    return "." + tail.lower()
+
+
+@dataclass(slots=True)
 class ScanResult:
     """Results from file scanning operation."""
 
@@ -44,14 +70,22 @@ class ScanResult:
         self.skipped_files[reason].append(file_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
-    """Information about a file to be processed."""
+    """Information about a file to be processed.
+
+    Slotted: one instance is created per eligible file, so dropping the
+    per-instance ``__dict__`` matters on trees with millions of files.
+
+    ``processor`` is the processor the walk already resolved to decide
+    eligibility; consumers reuse it instead of repeating the registry lookup.
+    """
 
     path: str
     extension: str
     size_mb: float | None = None
     mime_type: str | None = None
+    processor: BaseFileProcessor | None = None
 
 
 class FileScanner:
@@ -80,15 +114,22 @@ class FileScanner:
         self.config = config
         self.scan_config = config.scan
         self.runtime_config = config.runtime
-        self._error_lock = threading.Lock()
-        self._extension_counts: dict[str, int] = {}
-        self._errors: dict[str, list[str]] = {}
+        # Owned by the thread running scan(): walk workers only list
+        # directories, and callback futures are drained (and their errors
+        # recorded) on the scanning thread, so these need no lock.
+        self._extension_counts: Counter[str] = Counter()
+        self._errors: defaultdict[str, list[str]] = defaultdict(list)
+        # Extension -> "has a processor" for the magic-fallback decision. The
+        # registry only caches hits, so without this every file with an
+        # unsupported extension would be tried against every processor.
+        self._extension_supported: dict[str, bool] = {}
 
         # Initialize file type detector if enabled
         use_magic = self.scan_config.use_magic_detection
         self.file_type_detector = (
             FileTypeDetector(enabled=use_magic) if use_magic else None
         )
+        self._magic_fallback = bool(self.scan_config.magic_detection_fallback)
 
     def _is_excluded(self, file_path: str) -> bool:
         """Return True if *file_path* matches any configured exclude pattern.
@@ -121,6 +162,128 @@ class FileScanner:
                 return True
         return False
 
+    def _list_dir(self, top: str) -> tuple[list[os.DirEntry[str]], list[str]]:
+        """List *top* once, splitting it into file entries and subdirectories to visit.
+
+        Subdirectories matching an exclude pattern and directory symlinks are
+        left out (they are neither files nor descended into, as with
+        ``os.walk``).  An unreadable directory yields whatever was listed
+        before the error, or nothing.
+        """
+        files: list[os.DirEntry[str]] = []
+        subdirs: list[str] = []
+        try:
+            scandir_it = os.scandir(top)
+        except OSError:
+            return files, subdirs
+        append_file = files.append
+        with scandir_it:
+            try:
+                for entry in scandir_it:
+                    # is_dir() answers from the dirent's d_type on Linux, so
+                    # plain files cost no extra syscall here.
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        append_file(entry)
+                    elif not entry.is_symlink() and not self._is_excluded(entry.path):
+                        subdirs.append(entry.path)
+            except OSError:
+                # Listing failed part-way: keep what was read.
+                pass
+        return files, subdirs
+
+    def _iter_files(self, path: str) -> Iterator[os.DirEntry[str]]:
+        """Yield an entry for every non-directory under *path*.
+
+        With a single walk worker, directories are visited in the same top-down
+        order as ``os.walk`` (all files of a directory, then its subdirectories
+        in listing order).  Built on ``os.scandir`` so callers get
+        ``entry.path``/``entry.name`` without re-joining or re-splitting paths,
+        and ``entry.stat()`` caches its result.  Unreadable directories are
+        skipped silently, as with ``os.walk``.
+        """
+        workers = self.scan_config.walk_workers
+        if workers > 1:
+            yield from self._iter_files_parallel(path, workers)
+            return
+
+        pending = [path]
+        while pending:
+            files, subdirs = self._list_dir(pending.pop())
+            yield from files
+            # Reversed so that popping from the stack keeps listing order.
+            pending.extend(reversed(subdirs))
+
+    def _iter_files_parallel(
+        self, path: str, workers: int
+    ) -> Iterator[os.DirEntry[str]]:
+        """Like :meth:`_iter_files`, but list directories on *workers* threads.
+
+        On NFS and other high-latency filesystems each directory listing is a
+        blocking round-trip; listing many directories concurrently hides that
+        latency.  Every directory is a pool task that lists itself and submits
+        its subdirectories as new tasks, handing its file entries to the calling
+        thread through a bounded queue (so the walk cannot run arbitrarily far
+        ahead of file processing).  Files arrive grouped by directory, but
+        directory order is not deterministic.
+
+        Closing the generator early (``stop_count`` reached) stops the walk.
+        """
+        batches: queue.Queue = queue.Queue(maxsize=workers * 4)
+        stop = threading.Event()
+        pending_lock = threading.Lock()
+        # Directories submitted but not yet fully listed; the walk is complete
+        # when this drops to zero.
+        pending = 1
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="pbd-walk"
+        )
+
+        def _put(item: object) -> None:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=_WALK_PUT_POLL_SECONDS)
+                    return
+                except queue.Full:
+                    continue
+
+        def _walk_dir(top: str) -> None:
+            nonlocal pending
+            try:
+                if stop.is_set():
+                    return
+                files, subdirs = self._list_dir(top)
+                for subdir in subdirs:
+                    with pending_lock:
+                        pending += 1
+                    try:
+                        executor.submit(_walk_dir, subdir)
+                    except RuntimeError:
+                        # Pool already shut down: the consumer has stopped.
+                        return
+                if files:
+                    _put(files)
+            finally:
+                with pending_lock:
+                    pending -= 1
+                    finished = pending == 0
+                if finished:
+                    _put(_WALK_DONE)
+
+        executor.submit(_walk_dir, path)
+        try:
+            while True:
+                batch = batches.get()
+                if batch is _WALK_DONE:
+                    break
+                yield from batch
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def scan(
         self,
         path: str,
@@ -138,9 +301,6 @@ class FileScanner:
         Returns:
             ScanResult with statistics and errors
         """
-        # Lazy import avoids overhead in the common sequential (no-callback) case.
-        import concurrent.futures
-
         total_files_found = 0
         # "Processed" counts only files that are eligible for processing, i.e.
         # supported by a registered file processor (extension/mime-type based).
@@ -152,222 +312,230 @@ class FileScanner:
         # submits to a ThreadPoolExecutor and returns futures.
         max_pending_futures = self.scan_config.max_pending_futures
 
-        # Estimate total files for progress bar (if verbose and no stop_count)
-        # This can double runtime on huge directory trees, so it's opt-in.
-        # Enable via env var: PII_TOOLKIT_PROGRESS_ESTIMATE=1
-        total_files_estimate = None
-        if (
-            not stop_count
-            and self.runtime_config.verbose
-            and os.environ.get("PII_TOOLKIT_PROGRESS_ESTIMATE") == "1"
-        ):
-            self.runtime_config.logger.debug(
-                "Counting files for progress estimation..."
-            )
-            try:
-                total_files_estimate = sum(len(files) for _, _, files in os.walk(path))
-                self.runtime_config.logger.debug(
-                    f"Estimated total files: {total_files_estimate}"
-                )
-            except Exception as e:
-                self.runtime_config.logger.warning(f"Failed to count files: {e}")
-
         # Initialize progress bar (verbose-only).
         # Note: tqdm telemetry is disabled by default in recent versions.
         # For additional privacy, set TQDM_DISABLE_TELEMETRY=1 environment variable.
         progress_bar = None
+        estimate_stop: threading.Event | None = None
         if self.runtime_config.verbose:
+            # Let tqdm coalesce redraws itself: on trees of tiny files, rendering
+            # the bar per file (a stderr write each time) dominates the scan.
             progress_bar = tqdm(
-                total=total_files_estimate if total_files_estimate else None,
+                total=None,
                 desc="Processing files",
                 unit="file",
+                miniters=100,
+                mininterval=0.25,
+                smoothing=0.1,
             )
+            # Counting the tree up front would double the metadata I/O before
+            # any work starts, so it is opt-in and runs alongside the scan; the
+            # bar gains its total once the count finishes.
+            # Enable via env var: PII_TOOLKIT_PROGRESS_ESTIMATE=1
+            if (
+                not stop_count
+                and os.environ.get("PII_TOOLKIT_PROGRESS_ESTIMATE") == "1"
+            ):
+                estimate_stop = self._start_progress_estimate(path, progress_bar)
+
+        # Per-file loop invariants, read once instead of once per file.
+        logger = self.runtime_config.logger
+        verbose = self.runtime_config.verbose
+        log_debug = verbose and logger.isEnabledFor(logging.DEBUG)
+        validate_file_path = self.scan_config.validate_file_path
+        file_type_detector = self.file_type_detector
+        extension_counts = self._extension_counts
+
+        def dispatch(file_info: FileInfo) -> bool:
+            """Hand *file_info* to the callback; return True once stop_count is hit."""
+            nonlocal files_processed, pending_futures
+            full_path = file_info.path
+            if file_callback:
+                try:
+                    ret = file_callback(file_info)
+                    files_processed += 1
+                    # If the callback returns a Future, wait for it before
+                    # returning from scan, otherwise the CLI may finalize
+                    # output before processing completes.
+                    if isinstance(ret, concurrent.futures.Future):
+                        pending_futures.append(ret)
+                        future_to_path[ret] = full_path
+                        # Bound memory usage: periodically drain completed futures.
+                        if len(pending_futures) >= max_pending_futures:
+                            try:
+                                done, not_done = concurrent.futures.wait(
+                                    pending_futures,
+                                    return_when=concurrent.futures.FIRST_COMPLETED,
+                                )
+                                pending_futures = list(not_done)
+                                # Surface unexpected exceptions as scan errors (best-effort).
+                                for fut in done:
+                                    try:
+                                        fut.result()
+                                    except Exception as e:
+                                        fpath = future_to_path.get(fut, "<unknown>")
+                                        error_msg = f"Callback async error: {type(e).__name__}: {str(e)}"
+                                        self.runtime_config.logger.error(
+                                            f"{error_msg}: {fpath}",
+                                            exc_info=self.runtime_config.verbose,
+                                        )
+                                        if fpath != "<unknown>":
+                                            self._add_error(error_msg, fpath)
+                                        else:
+                                            self._add_error(error_msg, "")
+                            except Exception as drain_exc:
+                                # Keep scanning even if draining fails, but log for debuggability.
+                                self.runtime_config.logger.warning(
+                                    "Failed to drain pending futures: %s: %s",
+                                    type(drain_exc).__name__,
+                                    drain_exc,
+                                    exc_info=self.runtime_config.verbose,
+                                )
+                except Exception as e:
+                    error_msg = f"Callback error: {type(e).__name__}: {str(e)}"
+                    self.runtime_config.logger.error(
+                        f"{error_msg}: {full_path}",
+                        exc_info=self.runtime_config.verbose,
+                    )
+                    self._add_error(error_msg, full_path)
+            else:
+                files_processed += 1
 
-        try:
-            # Walk all files and subdirectories
-            for root, dirs, files in os.walk(path):
-                # Prune excluded subdirectories in-place (prevents descent)
-                dirs[:] = [
-                    d for d in dirs if not self._is_excluded(os.path.join(root, d))
-                ]
-
-                for filename in files:
-                    total_files_found += 1
+            # Update progress bar
+            if progress_bar is not None:
+                progress_bar.update(1)
+                # Formatting the postfix is not free either; refresh it
+                # periodically and let the next throttled redraw show it.
+                if progress_bar.n % _PROGRESS_POSTFIX_EVERY == 0:
+                    self._set_progress_postfix(progress_bar, files_processed)
 
-                    full_path = os.path.join(root, filename)
+            # Check stop count
+            return bool(stop_count and files_processed >= stop_count)
 
-                    # Skip files matching exclude patterns
-                    if self._is_excluded(full_path):
-                        continue
+        # Files whose data is not in the page cache, when prefer_warm_files is set.
+        prefer_warm_files = self.scan_config.prefer_warm_files
+        deferred: list[FileInfo] = []
+        stopped = False
 
-                    ext = os.path.splitext(full_path)[1].lower()
+        try:
+            # Walk all files and subdirectories (excluded directories are pruned)
+            for entry in self._iter_files(path):
+                total_files_found += 1
 
-                    # Count extension (thread-safe)
-                    with self._error_lock:
-                        self._extension_counts[ext] = (
-                            self._extension_counts.get(ext, 0) + 1
-                        )
+                full_path = entry.path
 
-                    # Validate file path
-                    is_valid, error_msg = self.scan_config.validate_file_path(full_path)
-                    if not is_valid:
-                        if error_msg:
-                            if "Path traversal" in error_msg:
-                                self.runtime_config.logger.warning(
-                                    f"Security: {error_msg} - {full_path}"
-                                )
-                            else:
-                                self.runtime_config.logger.warning(
-                                    f"{error_msg} - {full_path}"
-                                )
-                            self._add_error(error_msg, full_path)
-                        continue
+                # Skip files matching exclude patterns
+                if self._is_excluded(full_path):
+                    continue
 
-                    # Get file size if possible
-                    file_size_mb = None
-                    try:
-                        file_size_mb = os.path.getsize(full_path) / (1024 * 1024)
-                    except OSError as e:
-                        self.runtime_config.logger.debug(
-                            "Could not determine file size for %s: %s", full_path, e
-                        )
+                ext = _extension_of(entry.name)
 
-                    # Detect MIME type using magic numbers if enabled
-                    mime_type = None
-                    if self.file_type_detector:
-                        # Use magic detection if:
-                        # 1. File has no extension, OR
-                        # 2. magic_detection_fallback is enabled AND the extension is unsupported
-                        magic_fallback = self.scan_config.magic_detection_fallback
-                        ext_supported = bool(ext) and (
-                            FileProcessorRegistry.get_processor(ext) is not None
-                        )
-                        should_detect = (not ext) or (
-                            bool(magic_fallback) and not ext_supported
-                        )
-                        if should_detect:
-                            mime_type = self.file_type_detector.detect_type(full_path)
-                            if mime_type and self.runtime_config.verbose:
-                                self.runtime_config.logger.debug(
-                                    f"Detected MIME type for {full_path}: {mime_type}"
-                                )
-                            # If file has no extension but we detected a type, update extension
-                            if not ext and mime_type:
-                                detected_ext = (
-                                    self.file_type_detector.get_extension_from_mime(
-                                        mime_type
-                                    )
-                                )
-                                if detected_ext:
-                                    ext = detected_ext
-                                    if self.runtime_config.verbose:
-                                        self.runtime_config.logger.debug(
-                                            f"Inferred extension from MIME type: {ext}"
-                                        )
+                # Count extension
+                extension_counts[ext] += 1
 
-                    # Determine whether the file is eligible (supported) before invoking callback.
-                    # This keeps "files_processed" aligned with "qualified/analyzed" semantics.
-                    mime_type_str = mime_type or ""
-                    processor = FileProcessorRegistry.get_processor(
-                        ext, full_path, mime_type_str
+                # Validate file path
+                is_valid, error_msg = validate_file_path(full_path)
+                if not is_valid:
+                    if error_msg:
+                        if "Path traversal" in error_msg:
+                            logger.warning("Security: %s - %s", error_msg, full_path)
+                        else:
+                            logger.warning("%s - %s", error_msg, full_path)
+                        self._add_error(error_msg, full_path)
+                    continue
+
+                # Detect MIME type using magic numbers if enabled
+                mime_type = None
+                if file_type_detector:
+                    # Use magic detection if:
+                    # 1. File has no extension, OR
+                    # 2. magic_detection_fallback is enabled AND the extension is unsupported
+                    should_detect = (not ext) or (
+                        self._magic_fallback and not self._is_supported_extension(ext)
                     )
-                    if processor is None:
-                        # Unsupported file type: skip processing (but keep extension counts).
-                        continue
-
-                    # Log file processing in verbose mode
-                    if self.runtime_config.verbose:
-                        if file_size_mb is not None:
-                            self.runtime_config.logger.debug(
-                                f"Processing file {total_files_found}: {full_path} ({file_size_mb:.2f} MB)"
+                    if should_detect:
+                        mime_type = file_type_detector.detect_type(full_path)
+                        if mime_type and log_debug:
+                            logger.debug(
+                                "Detected MIME type for %s: %s", full_path, mime_type
                             )
-                        else:
-                            self.runtime_config.logger.debug(
-                                f"Processing file {total_files_found}: {full_path} (size unknown)"
+                        # If file has no extension but we detected a type, update extension
+                        if not ext and mime_type:
+                            detected_ext = file_type_detector.get_extension_from_mime(
+                                mime_type
                             )
+                            if detected_ext:
+                                ext = detected_ext
+                                if log_debug:
+                                    logger.debug(
+                                        "Inferred extension from MIME type: %s", ext
+                                    )
 
-                    # Create FileInfo and call callback
-                    file_info = FileInfo(
-                        path=full_path,
-                        extension=ext,
-                        size_mb=file_size_mb,
-                        mime_type=mime_type_str or None,
-                    )
-
-                    if file_callback:
-                        try:
-                            ret = file_callback(file_info)
-                            files_processed += 1
-                            # If the callback returns a Future, wait for it before
-                            # returning from scan, otherwise the CLI may finalize
-                            # output before processing completes.
-                            if isinstance(ret, concurrent.futures.Future):
-                                pending_futures.append(ret)
-                                future_to_path[ret] = full_path
-                                # Bound memory usage: periodically drain completed futures.
-                                if len(pending_futures) >= max_pending_futures:
-                                    try:
-                                        done, not_done = concurrent.futures.wait(
-                                            pending_futures,
-                                            return_when=concurrent.futures.FIRST_COMPLETED,
-                                        )
-                                        pending_futures = list(not_done)
-                                        # Surface unexpected exceptions as scan errors (best-effort).
-                                        for fut in done:
-                                            try:
-                                                fut.result()
-                                            except Exception as e:
-                                                fpath = future_to_path.get(
-                                                    fut, "<unknown>"
-                                                )
-                                                error_msg = f"Callback async error: {type(e).__name__}: {str(e)}"
-                                                self.runtime_config.logger.error(
-                                                    f"{error_msg}: {fpath}",
-                                                    exc_info=self.runtime_config.verbose,
-                                                )
-                                                if fpath != "<unknown>":
-                                                    self._add_error(error_msg, fpath)
-                                                else:
-                                                    self._add_error(error_msg, "")
-                                    except Exception as drain_exc:
-                                        # Keep scanning even if draining fails, but log for debuggability.
-                                        self.runtime_config.logger.warning(
-                                            "Failed to drain pending futures: %s: %s",
-                                            type(drain_exc).__name__,
-                                            drain_exc,
-                                            exc_info=self.runtime_config.verbose,
-                                        )
-                        except Exception as e:
-                            error_msg = f"Callback error: {type(e).__name__}: {str(e)}"
-                            self.runtime_config.logger.error(
-                                f"{error_msg}: {full_path}",
-                                exc_info=self.runtime_config.verbose,
-                            )
-                            self._add_error(error_msg, full_path)
+                # Determine whether the file is eligible (supported) before invoking callback.
+                # This keeps "files_processed" aligned with "qualified/analyzed" semantics.
+                mime_type_str = mime_type or ""
+                processor = FileProcessorRegistry.get_processor(
+                    ext, full_path, mime_type_str
+                )
+                if processor is None:
+                    # Unsupported file type: skip processing (but keep extension counts).
+                    continue
+
+                # Get file size if possible (only for files that will be processed,
+                # which in typical trees are the minority).
+                file_size_mb = None
+                file_size = regular_file_size(full_path)
+                if file_size is not None:
+                    file_size_mb = file_size / (1024 * 1024)
+                else:
+                    logger.debug("Could not determine file size for %s", full_path)
+
+                # Log file processing in verbose mode; formatting is left to the
+                # logging handler so nothing is built for discarded records.
+                if log_debug:
+                    if file_size_mb is not None:
+                        logger.debug(
+                            "Processing file %d: %s (%.2f MB)",
+                            total_files_found,
+                            full_path,
+                            file_size_mb,
+                        )
                     else:
-                        files_processed += 1
-
-                    # Update progress bar
-                    if progress_bar is not None:
-                        progress_bar.update(1)
-                        progress_bar.set_postfix(
-                            {
-                                "processed": files_processed,
-                                "errors": len(self._errors),
-                            }
+                        logger.debug(
+                            "Processing file %d: %s (size unknown)",
+                            total_files_found,
+                            full_path,
                         )
 
-                    # Check stop count
-                    if stop_count and files_processed >= stop_count:
-                        break
+                # Create FileInfo and call callback
+                file_info = FileInfo(
+                    path=full_path,
+                    extension=ext,
+                    size_mb=file_size_mb,
+                    mime_type=mime_type_str or None,
+                    processor=processor,
+                )
 
-                # Check stop count (break outer loop)
-                if stop_count and files_processed >= stop_count:
+                if prefer_warm_files and self._is_cold(full_path, file_size):
+                    # Read it after the walk, once the warm files are done.
+                    deferred.append(file_info)
+                    continue
+
+                if dispatch(file_info):
+                    stopped = True
                     break
 
+            if not stopped:
+                for file_info in deferred:
+                    if dispatch(file_info):
+                        break
+
         finally:
+            if estimate_stop is not None:
+                estimate_stop.set()
             # Close progress bar
             if progress_bar is not None:
+                self._set_progress_postfix(progress_bar, files_processed)
                 progress_bar.close()
 
         # Ensure any async processing has completed before we return.
@@ -404,21 +572,76 @@ class FileScanner:
         return ScanResult(
             total_files_found=total_files_found,
             files_processed=files_processed,
-            extension_counts=self._extension_counts.copy(),
-            errors=self._errors.copy(),
+            extension_counts=dict(self._extension_counts),
+            errors=dict(self._errors),
+        )
+
+    def _start_progress_estimate(
+        self, path: str, progress_bar: tqdm
+    ) -> threading.Event:
+        """Count the files under *path* on a background thread.
+
+        When the count completes, it becomes *progress_bar*'s total. Set the
+        returned event to abandon the count, e.g. once the scan itself has
+        finished.
+        """
+        stop = threading.Event()
+
+        def _count() -> None:
+            self.runtime_config.logger.debug(
+                "Counting files for progress estimation..."
+            )
+            total = 0
+            try:
+                for _, _, files in os.walk(path):
+                    if stop.is_set():
+                        return
+                    total += len(files)
+            except Exception as e:
+                self.runtime_config.logger.warning(f"Failed to count files: {e}")
+                return
+            if not stop.is_set():
+                self.runtime_config.logger.debug(f"Estimated total files: {total}")
+                progress_bar.total = total
+
+        threading.Thread(
+            target=_count, name="pbd-progress-estimate", daemon=True
+        ).start()
+        return stop
+
+    def _is_cold(self, path: str, size: int | None) -> bool:
+        """Return True if less than half of *path*'s data is in the page cache.
+
+        Unknown residency (no ``cachestat`` support, unreadable file) and empty
+        files count as warm, so they are processed in walk order.
+        """
+        if not size:
+            return False
+        residency = page_cache_residency(path, size)
+        return residency is not None and residency < _WARM_RESIDENCY
+
+    def _is_supported_extension(self, ext: str) -> bool:
+        """Return whether a registered processor claims *ext* (cached per scanner)."""
+        supported = self._extension_supported.get(ext)
+        if supported is None:
+            supported = FileProcessorRegistry.get_processor(ext) is not None
+            self._extension_supported[ext] = supported
+        return supported
+
+    def _set_progress_postfix(self, progress_bar: tqdm, files_processed: int) -> None:
+        """Attach processed/error counts to *progress_bar* without forcing a redraw."""
+        progress_bar.set_postfix_str(
+            f"processed={files_processed}, errors={len(self._errors)}",
+            refresh=False,
         )
 
     def _add_error(self, msg: str, path: str) -> None:
         """Add an error message for a specific file path.
 
-        Thread-safe error tracking.
+        Must be called from the scanning thread (see ``__init__``).
 
         Args:
             msg: Error message describing the type of error
             path: File path where the error occurred
         """
-        with self._error_lock:
-            if msg not in self._errors:
-                self._errors[msg] = [path]
-            else:
-                self._errors[msg].append(path)
+        self._errors[msg].append(path)
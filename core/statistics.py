@@ -1,9 +1,17 @@
 """Statistics tracking for PII analysis."""
 
 import datetime
+from collections import Counter
 from dataclasses import dataclass, field
 
 
+def _most_common_first(counts: dict[str, int]) -> dict[str, int]:
+    """Return *counts* as a dict ordered by descending count (ties keep insertion order)."""
+    if not isinstance(counts, Counter):
+        counts = Counter(counts)
+    return dict(counts.most_common())
+
+
 @dataclass
 class NerStats:
     """Statistics for NER processing."""
@@ -11,7 +19,7 @@ class NerStats:
     total_chunks_processed: int = 0
     total_entities_found: int = 0
     total_processing_time: float = 0.0
-    entities_by_type: dict[str, int] = field(default_factory=dict)
+    entities_by_type: Counter[str] = field(default_factory=Counter)
     errors: int = 0
 
 
@@ -164,12 +172,15 @@ class Statistics:
         """
         self.total_files_found = total_files
         self.files_processed = files_processed
-        self.extension_counts = extension_counts.copy()
+        # Copied into a Counter so it can be ranked with most_common().
+        self.extension_counts = Counter(extension_counts)
 
         # Count errors (count files, not error types)
-        for error_type, file_list in errors.items():
-            self.errors_by_type[error_type] = len(file_list)
-            self.total_errors += len(file_list)
+        error_counts = {
+            error_type: len(file_list) for error_type, file_list in errors.items()
+        }
+        self.errors_by_type.update(error_counts)
+        self.total_errors += sum(error_counts.values())
 
     def get_summary_dict(self) -> dict:
         """Get summary as dictionary for output.
@@ -181,33 +192,15 @@ class Statistics:
             "files_scanned": self.total_files_found,
             "files_analyzed": self.files_processed,
             "matches_found": self.matches_found,
-            "matches_by_engine": dict(
-                sorted(
-                    self.matches_by_engine.items(),
-                    key=lambda item: item[1],
-                    reverse=True,
-                )
-            )
+            "matches_by_engine": _most_common_first(self.matches_by_engine)
             if self.matches_by_engine
             else None,
             "errors": self.total_errors,
-            "skipped_content": dict(
-                sorted(
-                    self.skipped_content.items(),
-                    key=lambda item: item[1],
-                    reverse=True,
-                )
-            )
+            "skipped_content": _most_common_first(self.skipped_content)
             if self.skipped_content
             else None,
             "throughput_files_per_sec": self.files_per_second,
-            "file_extensions": dict(
-                sorted(
-                    self.extension_counts.items(),
-                    key=lambda item: item[1],
-                    reverse=True,
-                )
-            ),
+            "file_extensions": _most_common_first(self.extension_counts),
             "ner_statistics": (
                 {
                     "chunks_processed": self.ner_stats.total_chunks_processed,
@@ -5,7 +5,8 @@ without storing individual PII instances or file paths.
 """
 
 import os
-from collections import defaultdict
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from typing import Any
 
 from core.matches import PiiMatch
@@ -15,6 +16,45 @@ from core.privacy_dimensions import (
     get_sensitivity_level,
 )
 
+# Summary risk counter for each sensitivity level ("variable" is not counted).
+_RISK_COUNT_KEYS = {
+    "very_high": "very_high_risk_count",
+    "high": "high_risk_count",
+    "medium": "medium_risk_count",
+    "low": "low_risk_count",
+}
+
+# Confidence distribution buckets: [..0.5), [0.5..0.7), [0.7..0.9), [0.9..].
+_CONFIDENCE_LABELS = ("0.0-0.5", "0.5-0.7", "0.7-0.9", "0.9-1.0")
+_CONFIDENCE_EDGES = (0.5, 0.7, 0.9)
+
+
+class _FileBitmap:
+    """Set of small non-negative integer ids stored as a growable bitmap.
+
+    One bit per id instead of a hash-table slot (plus key) per member; only
+    ``add`` and ``len`` are needed for the unique-file counts.
+    """
+
+    __slots__ = ("_bits", "_count")
+
+    def __init__(self) -> None:
+        self._bits = bytearray()
+        self._count = 0
+
+    def add(self, item: int) -> None:
+        index = item >> 3
+        mask = 1 << (item & 7)
+        bits = self._bits
+        if index >= len(bits):
+            bits.extend(bytes(max(index + 1, 2 * len(bits)) - len(bits)))
+        if not bits[index] & mask:
+            bits[index] |= mask
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
 
 class StatisticsAggregator:
     """Aggregates PII matches by dimension, module, and file type.
@@ -33,26 +73,23 @@ class StatisticsAggregator:
                     keeping identifiers per file.
         """
         self.strict = strict
-        # Statistics by dimension
-        self._by_dimension: dict[str, dict] = defaultdict(
-            lambda: {
-                "total_count": 0,
-                "by_module": defaultdict(int),
-                "by_type": defaultdict(int),
-                "files_affected": set() if not self.strict else None,
-                "sensitivity_level": None,
-            }
-        )
+        # Statistics by dimension. A plain dict filled by _new_dimension_stats()
+        # on first sight: only dimensions that actually occur are reported.
+        self._by_dimension: dict[str, dict] = {}
 
         # Statistics by module
         self._by_module: dict[str, dict] = defaultdict(
             lambda: {
                 "total_matches": 0,
-                "types_detected": set(),
-                "files_processed": set() if not self.strict else None,
+                "types_detected": 0,  # bitmask, see _new_type_info()
+                "files_processed": _FileBitmap() if not self.strict else None,
                 "files_processed_count": 0 if self.strict else None,
-                "files_with_matches": set() if not self.strict else None,
-                "confidence_scores": [],  # For calculating avg confidence
+                "files_with_matches": _FileBitmap() if not self.strict else None,
+                # Running confidence totals: nothing per score is retained, so
+                # memory stays flat however many scored matches arrive.
+                "confidence_sum": 0.0,
+                "confidence_count": 0,
+                "confidence_buckets": [0] * len(_CONFIDENCE_LABELS),
             }
         )
 
@@ -62,24 +99,95 @@ class StatisticsAggregator:
                 "files_scanned": 0,
                 "files_analyzed": 0,
                 "matches_found": 0,
-                "dimensions_detected": set(),
+                "dimensions_detected": 0,  # bitmask of dimension "bit"s
             }
         )
 
-        # Track all unique files with matches (for summary) unless strict mode is enabled
-        self._all_files_with_matches: set[str] | None = (
-            set() if not self.strict else None
+        # Unique-file counters. Each distinct path gets a small integer id once;
+        # the per-dimension/per-module/global "files" trackers are bitmaps over
+        # those ids rather than sets each holding every path (unless strict
+        # mode is enabled, in which case no paths are kept at all).
+        self._file_ids: dict[str, int] | None = {} if not self.strict else None
+        self._all_files_with_matches: _FileBitmap | None = (
+            _FileBitmap() if not self.strict else None
         )
 
-        # Track all unique types detected
-        self._all_types_detected: set[str] = set()
+        # Detection types and dimensions are few and recur on every match, so
+        # "seen" sets are kept as int bitmasks: each distinct value gets a bit
+        # on first sight and recording it is a single OR. The same table caches
+        # each type's dimension, so add_match resolves both with one lookup.
+        self._type_info: dict[str, tuple[int, str]] = {}
+        self._dimension_order: list[str] = []
+
+        # Track all unique types detected (bitmask)
+        self._all_types_detected = 0
+
+        # Summary totals, maintained by add_match so _get_summary() does not
+        # have to re-walk every dimension.
+        self._total_matches = 0
+        self._risk_counts = dict.fromkeys(_RISK_COUNT_KEYS.values(), 0)
+        # Very-high-sensitivity dimension with the most matches (earliest seen
+        # wins ties) and its stats entry.
+        self._highest_risk_dimension: str | None = None
+        self._highest_risk_stats: dict | None = None
+
+        # Matches arrive grouped by file, so remember the extension of the last
+        # path seen instead of re-splitting the same path for every match.
+        self._last_match_path: str | None = None
+        self._last_match_ext = ""
+        self._last_match_id = -1
+
+        # Sensitivity level of every known dimension, resolved once up front.
+        self._sensitivity_levels: dict[str, str] = {
+            dimension: get_sensitivity_level(dimension)
+            for dimension in get_all_dimensions()
+        }
 
-        # Initialize sensitivity levels for dimensions
-        for dimension in get_all_dimensions():
-            if dimension in self._by_dimension:
-                self._by_dimension[dimension]["sensitivity_level"] = (
-                    get_sensitivity_level(dimension)
-                )
+    def _new_dimension_stats(self, dimension: str) -> dict:
+        """Create (and register) the statistics entry for *dimension*."""
+        sensitivity_level = self._sensitivity_levels.get(dimension)
+        if sensitivity_level is None:
+            sensitivity_level = get_sensitivity_level(dimension)
+        dim_stats = {
+            "total_count": 0,
+            "by_module": Counter(),
+            "by_type": Counter(),
+            "files_affected": _FileBitmap() if not self.strict else None,
+            "sensitivity_level": sensitivity_level,
+            "risk_count_key": _RISK_COUNT_KEYS.get(sensitivity_level),
+            "bit": 1 << len(self._dimension_order),
+            "order": len(self._dimension_order),
+        }
+        self._dimension_order.append(dimension)
+        self._by_dimension[dimension] = dim_stats
+        return dim_stats
+
+    def _track_highest_risk(self, dimension: str, dim_stats: dict) -> None:
+        """Update the highest-risk dimension after *dimension*'s count grew."""
+        best = self._highest_risk_stats
+        if best is not None and best is not dim_stats:
+            if dim_stats["total_count"] < best["total_count"] or (
+                dim_stats["total_count"] == best["total_count"]
+                and dim_stats["order"] > best["order"]
+            ):
+                return
+        self._highest_risk_dimension = dimension
+        self._highest_risk_stats = dim_stats
+
+    def _new_type_info(self, detection_type: str) -> tuple[int, str]:
+        """Assign a bitmask bit to *detection_type* and cache its dimension."""
+        info = (1 << len(self._type_info), get_dimension(detection_type))
+        self._type_info[detection_type] = info
+        return info
+
+    def _file_id(self, file_path: str) -> int:
+        """Return the bitmap id of *file_path* (non-strict mode only)."""
+        assert self._file_ids is not None
+        file_id = self._file_ids.get(file_path)
+        if file_id is None:
+            file_id = len(self._file_ids)
+            self._file_ids[file_path] = file_id
+        return file_id
 
     def add_match(self, match: PiiMatch) -> None:
         """Add a match to aggregation.
@@ -90,41 +198,60 @@ class StatisticsAggregator:
         detection_type = match.type
         engine = match.engine or "unknown"
         file_path = match.file
-
-        # Get dimension for this detection type
-        dimension = get_dimension(detection_type)
+        if file_path != self._last_match_path:
+            self._last_match_path = file_path
+            self._last_match_ext = self._extract_extension(file_path)
+            if not self.strict:
+                self._last_match_id = self._file_id(file_path)
+        file_id = self._last_match_id
+
+        # Get bitmask bit and dimension for this detection type
+        type_info = self._type_info.get(detection_type)
+        if type_info is None:
+            type_info = self._new_type_info(detection_type)
+        type_bit, dimension = type_info
 
         # Update dimension statistics
-        dim_stats = self._by_dimension[dimension]
+        dim_stats = self._by_dimension.get(dimension)
+        if dim_stats is None:
+            dim_stats = self._new_dimension_stats(dimension)
         dim_stats["total_count"] += 1
+        self._total_matches += 1
+        risk_count_key = dim_stats["risk_count_key"]
+        if risk_count_key is not None:
+            self._risk_counts[risk_count_key] += 1
+            if dim_stats["sensitivity_level"] == "very_high":
+                self._track_highest_risk(dimension, dim_stats)
         dim_stats["by_module"][engine] += 1
         dim_stats["by_type"][detection_type] += 1
         if not self.strict:
-            dim_stats["files_affected"].add(file_path)
-        if dim_stats["sensitivity_level"] is None:
-            dim_stats["sensitivity_level"] = get_sensitivity_level(dimension)
+            dim_stats["files_affected"].add(file_id)
 
         # Update module statistics
         module_stats = self._by_module[engine]
         module_stats["total_matches"] += 1
-        module_stats["types_detected"].add(detection_type)
+        module_stats["types_detected"] |= type_bit
         if not self.strict:
-            module_stats["files_with_matches"].add(file_path)
+            module_stats["files_with_matches"].add(file_id)
         if match.ner_score is not None:
-            module_stats["confidence_scores"].append(match.ner_score)
+            score = match.ner_score
+            module_stats["confidence_sum"] += score
+            module_stats["confidence_count"] += 1
+            module_stats["confidence_buckets"][
+                bisect_right(_CONFIDENCE_EDGES, score)
+            ] += 1
 
         # Update file type statistics
-        # Extract file extension from path
-        file_ext = self._extract_extension(file_path)
+        file_ext = self._last_match_ext
         if file_ext:
             file_type_stats = self._by_file_type[file_ext]
             file_type_stats["matches_found"] += 1
-            file_type_stats["dimensions_detected"].add(dimension)
+            file_type_stats["dimensions_detected"] |= dim_stats["bit"]
 
         # Track globally
         if self._all_files_with_matches is not None:
-            self._all_files_with_matches.add(file_path)
-        self._all_types_detected.add(detection_type)
+            self._all_files_with_matches.add(file_id)
+        self._all_types_detected |= type_bit
 
     def add_file_scanned(self, file_path: str, was_analyzed: bool = False) -> None:
         """Record that a file was scanned (and optionally analyzed).
@@ -151,7 +278,7 @@ class StatisticsAggregator:
             if self.strict:
                 self._by_module[engine]["files_processed_count"] += 1
             else:
-                self._by_module[engine]["files_processed"].add(file_path)
+                self._by_module[engine]["files_processed"].add(self._file_id(file_path))
 
     def get_statistics(self) -> dict:
         """Get aggregated statistics as dictionary.
@@ -182,19 +309,16 @@ class StatisticsAggregator:
 
         # Process module statistics
         for module, module_stats in self._by_module.items():
-            confidence_scores = module_stats["confidence_scores"]
+            confidence_count = module_stats["confidence_count"]
             avg_confidence = (
-                sum(confidence_scores) / len(confidence_scores)
-                if confidence_scores
+                module_stats["confidence_sum"] / confidence_count
+                if confidence_count
                 else None
             )
 
-            # Calculate confidence distribution
-            confidence_dist = self._calculate_confidence_distribution(confidence_scores)
-
             stats["statistics_by_module"][module] = {
                 "total_matches": module_stats["total_matches"],
-                "types_detected": len(module_stats["types_detected"]),
+                "types_detected": module_stats["types_detected"].bit_count(),
                 "files_processed": (
                     len(module_stats["files_processed"])
                     if not self.strict
@@ -209,8 +333,8 @@ class StatisticsAggregator:
                 stats["statistics_by_module"][module]["avg_confidence"] = round(
                     avg_confidence, 3
                 )
-                stats["statistics_by_module"][module]["confidence_distribution"] = (
-                    confidence_dist
+                stats["statistics_by_module"][module]["confidence_distribution"] = dict(
+                    zip(_CONFIDENCE_LABELS, module_stats["confidence_buckets"])
                 )
 
         # Process file type statistics
@@ -220,7 +344,7 @@ class StatisticsAggregator:
                 "files_analyzed": file_type_stats["files_analyzed"],
                 "matches_found": file_type_stats["matches_found"],
                 "top_dimensions": sorted(
-                    file_type_stats["dimensions_detected"],
+                    self._dimensions_in(file_type_stats["dimensions_detected"]),
                     key=lambda d: self._by_dimension.get(d, {}).get("total_count", 0),
                     reverse=True,
                 )[:5],  # Top 5 dimensions
@@ -234,42 +358,8 @@ class StatisticsAggregator:
         Returns:
             Dictionary with summary information
         """
-        total_matches = sum(
-            dim_stats["total_count"] for dim_stats in self._by_dimension.values()
-        )
-
-        # Calculate risk assessment
-        risk_counts = {
-            "very_high_risk_count": 0,
-            "high_risk_count": 0,
-            "medium_risk_count": 0,
-            "low_risk_count": 0,
-        }
-
-        for dimension, dim_stats in self._by_dimension.items():
-            sensitivity = dim_stats["sensitivity_level"]
-            count = dim_stats["total_count"]
-
-            if sensitivity == "very_high":
-                risk_counts["very_high_risk_count"] += count
-            elif sensitivity == "high":
-                risk_counts["high_risk_count"] += count
-            elif sensitivity == "medium":
-                risk_counts["medium_risk_count"] += count
-            elif sensitivity == "low":
-                risk_counts["low_risk_count"] += count
-
-        # Find highest risk dimension
-        highest_risk_dimension = None
-        highest_risk_count = 0
-        for dimension, dim_stats in self._by_dimension.items():
-            if dim_stats["sensitivity_level"] == "very_high":
-                if dim_stats["total_count"] > highest_risk_count:
-                    highest_risk_count = dim_stats["total_count"]
-                    highest_risk_dimension = dimension
-
         return {
-            "total_matches": total_matches,
+            "total_matches": self._total_matches,
             "unique_files_with_matches": (
                 len(self._all_files_with_matches)
                 if self._all_files_with_matches is not None
@@ -277,32 +367,17 @@ class StatisticsAggregator:
             ),
             "dimensions_detected": len(self._by_dimension),
             "modules_used": len(self._by_module),
-            "highest_risk_dimension": highest_risk_dimension,
-            "risk_assessment": risk_counts,
+            "highest_risk_dimension": self._highest_risk_dimension,
+            "risk_assessment": dict(self._risk_counts),
         }
 
-    def _calculate_confidence_distribution(self, scores: list[float]) -> dict[str, int]:
-        """Calculate confidence score distribution.
-
-        Args:
-            scores: List of confidence scores
-
-        Returns:
-            Dictionary with distribution counts
-        """
-        dist = {"0.0-0.5": 0, "0.5-0.7": 0, "0.7-0.9": 0, "0.9-1.0": 0}
-
-        for score in scores:
-            if score < 0.5:
-                dist["0.0-0.5"] += 1
-            elif score < 0.7:
-                dist["0.5-0.7"] += 1
-            elif score < 0.9:
-                dist["0.7-0.9"] += 1
-            else:
-                dist["0.9-1.0"] += 1
-
-        return dist
+    def _dimensions_in(self, bits: int) -> list[str]:
+        """Decode a dimension bitmask into dimension names."""
+        return [
+            dimension
+            for index, dimension in enumerate(self._dimension_order)
+            if bits >> index & 1
+        ]
 
     def _extract_extension(self, file_path: str) -> str:
         """Extract file extension from path.
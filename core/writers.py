@@ -9,7 +9,7 @@ import json
 import logging
 import os
 import shutil
-from typing import TYPE_CHECKING, Any, TextIO
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO
 
 if TYPE_CHECKING:
     import _csv
@@ -24,6 +24,97 @@ _logger = logging.getLogger(__name__)
 _JSON_MERGE_CHUNK_SIZE = 1024 * 1024
 
 
+def _append_file(out: BinaryIO, src_path: str) -> None:
+    """Append the contents of *src_path* to the binary file *out*.
+
+    Uses ``os.copy_file_range`` where available, so the kernel copies the data
+    (or shares extents on CoW filesystems) without a round trip through user
+    space. Falls back to a chunked ``shutil.copyfileobj`` when the call is
+    unsupported, e.g. across filesystems on older kernels.
+    """
+    with open(src_path, "rb") as src:
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is not None:
+            out.flush()
+            try:
+                while copy_file_range(
+                    src.fileno(), out.fileno(), _JSON_MERGE_CHUNK_SIZE
+                ):
+                    pass
+                return
+            except OSError:
+                # Both offsets advance together, so the fallback below picks
+                # up wherever the kernel copy stopped.
+                pass
+            finally:
+                out.seek(0, os.SEEK_END)
+        shutil.copyfileobj(src, out, _JSON_MERGE_CHUNK_SIZE)
+
+
+# Write buffer for CSV output (the io default is only 8 KiB).
+_CSV_BUFFER_SIZE = 1024 * 1024
+# Rows CsvWriter.write_match() collects before one writerows() call.
+_CSV_BATCH_ROWS = 1024
+
+# JsonlWriter collects encoded lines until this many bytes are pending, so a
+# scan with many small findings issues one write per batch instead of per line.
+_JSONL_FLUSH_BYTES = 1024 * 1024
+
+# Excel's hard limit on rows per worksheet (header included).
+_XLSX_MAX_ROWS = 1_048_576
+
+try:
+    # Optional: orjson serializes straight to UTF-8 bytes in C, which matters
+    # when a scan writes millions of findings.
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    def _json_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:  # pragma: no cover - depends on installed extras
+
+    def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode(
+            "utf-8"
+        )
+
+    def _json_line(obj: Any) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _match_payload(match: PiiMatch) -> dict[str, Any]:
+    """Return the JSON object written for *match* by the JSON/JSONL writers.
+
+    Built explicitly rather than serializing the dataclass itself: the output
+    names ``ner_score`` as ``score`` and omits unset context fields. (An
+    orjson ``default=`` hook around this was measured slower than calling it
+    directly.)
+    """
+    payload: dict[str, Any] = {
+        "text": match.text,
+        "file": match.file,
+        "type": match.type,
+        "score": match.ner_score,
+        "engine": match.engine,
+        "severity": match.severity,
+        "metadata": match.metadata,
+    }
+    if match.context_before is not None:
+        payload["context_before"] = match.context_before
+    if match.context_after is not None:
+        payload["context_after"] = match.context_after
+    if match.char_offset is not None:
+        payload["char_offset"] = match.char_offset
+    return payload
+
+
 class OutputWriter(abc.ABC):
     """Abstract base class for output writers."""
 
@@ -56,16 +147,84 @@ class OutputWriter(abc.ABC):
         return None
 
 
+def _stream_name(stream: Any) -> str:
+    """Return a display name for a caller-supplied output stream."""
+    name = getattr(stream, "name", None)
+    return name if isinstance(name, str) else "<stream>"
+
+
+class _FlushEvery:
+    """File proxy that flushes after every *n* writes.
+
+    ``csv.writer`` issues exactly one ``write()`` per row, so this flushes
+    every *n* rows no matter whether they come from ``CsvWriter.write_match``
+    or from the raw writer returned by ``get_writer()``.
+    """
+
+    def __init__(self, file: TextIO, n: int):
+        self._file = file
+        self._n = n
+        self._pending = 0
+
+    def write(self, s: str) -> int:
+        written = self._file.write(s)
+        self._pending += 1
+        if self._pending >= self._n:
+            self._file.flush()
+            self._pending = 0
+        return written
+
+
 class CsvWriter(OutputWriter):
-    """Writes findings to a CSV file."""
+    """Writes findings to a CSV file.
 
-    def __init__(self, file_path: str, include_header: bool = True):
-        super().__init__(file_path, include_header)
+    The file is opened with a ``_CSV_BUFFER_SIZE`` write buffer, so rows reach
+    the disk in large blocks rather than every few kilobytes. The cost is that
+    up to one buffer of findings is lost if the process dies before
+    ``finalize()``; pass ``flush_every=N`` to flush after every N rows when
+    partial output must survive a crash.
+
+    Quoting is left to ``csv.writer``: its C row formatter is faster than
+    escaping fields in Python, even for short all-string PII rows.
+
+    Rows from ``write_match()`` are collected and handed to ``writerows()`` in
+    batches of ``_CSV_BATCH_ROWS`` (unless ``flush_every`` is set). Callers
+    should use either ``write_match()`` or the raw ``get_writer()``, not both,
+    or rows may appear out of order.
+
+    *file_path* may also be an open text stream (e.g. ``sys.stdout`` or a
+    ``gzip.open(..., "wt", newline="")`` handle). It is written as-is, without
+    a second buffer, and is flushed but not closed by ``finalize()``.
+    """
+
+    def __init__(
+        self,
+        file_path: str | TextIO,
+        include_header: bool = True,
+        flush_every: int | None = None,
+    ):
+        self._owns_file = isinstance(file_path, str)
+        super().__init__(
+            file_path if isinstance(file_path, str) else _stream_name(file_path),
+            include_header,
+        )
+        self._batch: list[list[Any]] = []
+        self._batch_size = 1 if flush_every else _CSV_BATCH_ROWS
         try:
-            self._file: TextIO | None = open(
-                file_path, "w", newline="", encoding="utf-8"
+            self._file: TextIO | None = (
+                open(
+                    file_path,
+                    "w",
+                    newline="",
+                    encoding="utf-8",
+                    buffering=_CSV_BUFFER_SIZE,
+                )
+                if isinstance(file_path, str)
+                else file_path
+            )
+            self._writer = csv.writer(
+                _FlushEvery(self._file, flush_every) if flush_every else self._file
             )
-            self._writer = csv.writer(self._file)
             if self.include_header:
                 self._writer.writerow(
                     ["Match", "File", "Type", "Score", "Engine", "Severity"]
@@ -82,11 +241,21 @@ class CsvWriter(OutputWriter):
             match.engine,
             match.severity,
         ]
-        self._writer.writerow(row)
+        batch = self._batch
+        batch.append(row)
+        if len(batch) >= self._batch_size:
+            self._writer.writerows(batch)
+            batch.clear()
 
     def finalize(self, metadata: dict | None = None) -> None:
         if self._file:
-            self._file.close()
+            if self._batch:
+                self._writer.writerows(self._batch)
+                self._batch.clear()
+            if self._owns_file:
+                self._file.close()
+            else:
+                self._file.flush()
             self._file = None
 
     @property
@@ -108,57 +277,48 @@ class JsonWriter(OutputWriter):
     memory usage stays constant regardless of how many findings a scan
     produces. Metadata is only known at ``finalize()`` time (after the scan
     completes) and must appear before the ``findings`` array in the output,
-    so finalize() merges the temporary body into the final file by copying
-    it in fixed-size chunks rather than loading it into memory as a whole.
+    so finalize() appends the temporary body to the final file with an
+    in-kernel copy (see ``_append_file``) rather than loading it into memory.
 
     Output structure is unchanged from previous versions::
 
         {"metadata": {...}, "findings": [{...}, {...}, ...]}
+
+    Objects are written compactly by default; indentation roughly doubles the
+    file size for no benefit to programmatic consumers. Pass ``pretty=True``
+    to indent each object by two spaces.
     """
 
-    def __init__(self, file_path: str, include_header: bool = True):
+    def __init__(
+        self, file_path: str, include_header: bool = True, pretty: bool = False
+    ):
         super().__init__(file_path, include_header)
+        self._pretty = pretty
         self._count = 0
         self._body_path = file_path + ".findings.tmp"
         try:
-            self._body_file = open(self._body_path, "w", encoding="utf-8")
+            self._body_file = open(self._body_path, "wb")
         except OSError as e:
             raise OutputError(f"Failed to open output file: {e}")
 
     def write_match(self, match: PiiMatch) -> None:
-        match_dict = {
-            "text": match.text,
-            "file": match.file,
-            "type": match.type,
-            "score": match.ner_score,
-            "engine": match.engine,
-            "severity": match.severity,
-            "metadata": match.metadata,
-        }
-        if match.context_before is not None:
-            match_dict["context_before"] = match.context_before
-        if match.context_after is not None:
-            match_dict["context_after"] = match.context_after
-        if match.char_offset is not None:
-            match_dict["char_offset"] = match.char_offset
-
-        prefix = ",\n" if self._count > 0 else ""
-        self._body_file.write(prefix + json.dumps(match_dict, ensure_ascii=False))
+        if self._count > 0:
+            self._body_file.write(b",\n")
+        self._body_file.write(_json_bytes(_match_payload(match), indent=self._pretty))
         self._count += 1
 
     def finalize(self, metadata: dict | None = None) -> None:
         try:
             self._body_file.close()
-            with open(self.file_path, "w", encoding="utf-8") as out:
+            with open(self.file_path, "wb") as out:
                 out.write(
-                    '{"metadata": '
-                    + json.dumps(metadata or {}, ensure_ascii=False)
-                    + ', "findings": ['
+                    b'{"metadata": '
+                    + _json_bytes(metadata or {}, indent=self._pretty)
+                    + b', "findings": ['
                 )
                 if self._count > 0:
-                    with open(self._body_path, encoding="utf-8") as body:
-                        shutil.copyfileobj(body, out, _JSON_MERGE_CHUNK_SIZE)
-                out.write("]}")
+                    _append_file(out, self._body_path)
+                out.write(b"]}")
         except OSError as e:
             raise OutputError(f"Failed to write JSON output: {e}")
         finally:
@@ -193,24 +353,8 @@ class StreamingJsonWriter(OutputWriter):
             raise OutputError(f"Failed to open output file: {e}")
 
     def write_match(self, match: PiiMatch) -> None:
-        payload = {
-            "text": match.text,
-            "file": match.file,
-            "type": match.type,
-            "score": match.ner_score,
-            "engine": match.engine,
-            "severity": match.severity,
-            "metadata": match.metadata,
-        }
-        if match.context_before is not None:
-            payload["context_before"] = match.context_before
-        if match.context_after is not None:
-            payload["context_after"] = match.context_after
-        if match.char_offset is not None:
-            payload["char_offset"] = match.char_offset
-
         prefix = ",\n" if self._count > 0 else ""
-        self._file.write(prefix + json.dumps(payload, ensure_ascii=False))
+        self._file.write(prefix + json.dumps(_match_payload(match), ensure_ascii=False))
         self._count += 1
 
     def finalize(self, metadata: dict | None = None) -> None:
@@ -252,41 +396,53 @@ class JsonlWriter(OutputWriter):
     Each match is written as one JSON object per line for streaming and easy
     incremental processing. Metadata is appended as a final line with the key
     "_metadata".
+
+    Lines are batched in memory and written once ``_JSONL_FLUSH_BYTES`` are
+    pending, so the file on disk lags behind by at most one batch until
+    ``finalize()``. Each line is serialized with its trailing newline in one
+    call and appended to the same batch buffer; no per-match text or
+    concatenated copy is created.
+
+    *file_path* may also be an open binary stream (e.g. ``sys.stdout.buffer``
+    or a ``gzip.GzipFile``), which is flushed but not closed by ``finalize()``.
+    The batch buffer is handed to it directly.
     """
 
-    def __init__(self, file_path: str, include_header: bool = True):
-        super().__init__(file_path, include_header)
+    def __init__(self, file_path: str | BinaryIO, include_header: bool = True):
+        self._owns_file = isinstance(file_path, str)
+        super().__init__(
+            file_path if isinstance(file_path, str) else _stream_name(file_path),
+            include_header,
+        )
+        self._buf = bytearray()
         try:
-            self._file: TextIO | None = open(file_path, "w", encoding="utf-8")
+            self._file: BinaryIO | None = (
+                open(file_path, "wb") if isinstance(file_path, str) else file_path
+            )
         except OSError as e:
             raise OutputError(f"Failed to open output file: {e}")
 
+    def _flush_buffer(self) -> None:
+        if self._buf and self._file:
+            self._file.write(self._buf)
+            self._buf.clear()
+
     def write_match(self, match: PiiMatch) -> None:
         assert self._file is not None
-        payload: dict[str, Any] = {
-            "text": match.text,
-            "file": match.file,
-            "type": match.type,
-            "score": match.ner_score,
-            "engine": match.engine,
-            "severity": match.severity,
-            "metadata": match.metadata,
-        }
-        if match.context_before is not None:
-            payload["context_before"] = match.context_before
-        if match.context_after is not None:
-            payload["context_after"] = match.context_after
-        if match.char_offset is not None:
-            payload["char_offset"] = match.char_offset
-        self._file.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        buf = self._buf
+        buf += _json_line(_match_payload(match))
+        if len(buf) >= _JSONL_FLUSH_BYTES:
+            self._flush_buffer()
 
     def finalize(self, metadata: dict | None = None) -> None:
         if metadata and self._file:
-            self._file.write(
-                json.dumps({"_metadata": metadata}, ensure_ascii=False) + "\n"
-            )
+            self._buf += _json_line({"_metadata": metadata})
+        self._flush_buffer()
         if self._file:
-            self._file.close()
+            if self._owns_file:
+                self._file.close()
+            else:
+                self._file.flush()
             self._file = None
 
     @property
@@ -294,31 +450,107 @@ class JsonlWriter(OutputWriter):
         return True
 
     @property
-    def file_handle(self) -> TextIO | None:
+    def file_handle(self) -> BinaryIO | None:
         return self._file
 
 
 class XlsxWriter(OutputWriter):
-    """Writes findings to an Excel file (streaming, write-only workbook)."""
+    """Writes findings to an Excel file (streaming, constant memory).
+
+    Uses ``xlsxwriter`` in ``constant_memory`` mode when it is installed (the
+    ``speedups`` extra): rows are flushed to a temporary file as they are
+    written and the workbook is assembled in ``finalize()``, which is an order
+    of magnitude faster than openpyxl for large scans. Falls back to an
+    openpyxl write-only workbook otherwise.
+
+    Findings are split across sheets ("Findings", "Findings 2", ...) once a
+    sheet holds ``chunk_rows`` data rows, each sheet repeating the header.
+    The default fills sheets up to Excel's row limit, beyond which rows would
+    otherwise be dropped (xlsxwriter) or produce a file Excel refuses to open
+    (openpyxl).
+
+    *file_path* may also be a seekable binary stream (e.g. ``io.BytesIO``);
+    the workbook is written to it in ``finalize()`` and the stream is left
+    open.
+    """
 
-    def __init__(self, file_path: str, include_header: bool = True):
-        super().__init__(file_path, include_header)
+    def __init__(
+        self,
+        file_path: str | BinaryIO,
+        include_header: bool = True,
+        chunk_rows: int | None = None,
+    ):
+        super().__init__(
+            file_path if isinstance(file_path, str) else _stream_name(file_path),
+            include_header,
+        )
+        self._target = file_path
+        self._wb: Any
+        self._ws: Any
+        self._row = 0
+        self._sheets = 0
+        header_rows = 1 if include_header else 0
+        max_rows = _XLSX_MAX_ROWS - header_rows
+        if chunk_rows is not None and chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        self._sheet_rows = header_rows + min(chunk_rows or max_rows, max_rows)
+        self._use_xlsxwriter = False
+        self._save_errors: tuple[type[Exception], ...] = (OSError,)
         try:
-            import openpyxl
+            import xlsxwriter
+            from xlsxwriter.exceptions import FileCreateError
         except ImportError:
-            raise OutputError(
-                "openpyxl is required for XLSX output but is not installed."
-            )
+            try:
+                import openpyxl
+            except ImportError:
+                raise OutputError(
+                    "openpyxl or xlsxwriter is required for XLSX output but "
+                    "neither is installed."
+                )
 
-        # Use write_only mode to avoid holding all rows in memory.
-        self._openpyxl = openpyxl
-        self._wb = openpyxl.Workbook(write_only=True)
-        self._ws = self._wb.create_sheet("Findings")
+            # Use write_only mode to avoid holding all rows in memory.
+            self._wb = openpyxl.Workbook(write_only=True)
+        else:
+            self._use_xlsxwriter = True
+            self._save_errors = (OSError, FileCreateError)
+            self._wb = xlsxwriter.Workbook(
+                self._target,
+                {
+                    "constant_memory": True,
+                    # Findings are data: never turn matched text into links
+                    # or formulas.
+                    "strings_to_urls": False,
+                    "strings_to_formulas": False,
+                    "nan_inf_to_errors": True,
+                },
+            )
+        self._add_sheet()
+
+    def _add_sheet(self) -> None:
+        self._sheets += 1
+        name = "Findings" if self._sheets == 1 else f"Findings {self._sheets}"
+        if self._use_xlsxwriter:
+            self._ws = self._wb.add_worksheet(name)
+        else:
+            self._ws = self._wb.create_sheet(name)
+        self._row = 0
         if self.include_header:
-            self._ws.append(["Match", "File", "Type", "Score", "Engine", "Severity"])
+            self._write_row(["Match", "File", "Type", "Score", "Engine", "Severity"])
+
+    def _write_row(self, row: list[Any]) -> None:
+        if self._use_xlsxwriter:
+            self._ws.write_row(self._row, 0, row)
+        else:
+            self._ws.append(row)
+        self._row += 1
+
+    def _append(self, row: list[Any]) -> None:
+        if self._row >= self._sheet_rows:
+            self._add_sheet()
+        self._write_row(row)
 
     def write_match(self, match: PiiMatch) -> None:
-        self._ws.append(
+        self._append(
             [
                 match.text,
                 match.file,
@@ -332,17 +564,28 @@ class XlsxWriter(OutputWriter):
     def finalize(self, metadata: dict | None = None) -> None:
         # Add metadata sheet
         if metadata:
-            ws_meta = self._wb.create_sheet("Metadata")
-            ws_meta.append(["Key", "Value"])
-            # Flatten metadata if needed or just dump top level
+            rows: list[list[Any]] = [["Key", "Value"]]
+            # Dump top level only; nested values go into one cell as JSON.
+            # Scalars are written as-is.
             for k, v in metadata.items():
                 if isinstance(v, (dict, list)):
-                    v = json.dumps(v)
-                ws_meta.append([k, v])
+                    v = _json_bytes(v).decode("utf-8")
+                rows.append([k, v])
+            if self._use_xlsxwriter:
+                ws_meta = self._wb.add_worksheet("Metadata")
+                for row_idx, row in enumerate(rows):
+                    ws_meta.write_row(row_idx, 0, row)
+            else:
+                ws_meta = self._wb.create_sheet("Metadata")
+                for row in rows:
+                    ws_meta.append(row)
 
         try:
-            self._wb.save(self.file_path)
-        except OSError as e:
+            if self._use_xlsxwriter:
+                self._wb.close()
+            else:
+                self._wb.save(self._target)
+        except self._save_errors as e:
             raise OutputError(f"Failed to save Excel file: {e}")
 
     @property
@@ -351,14 +594,36 @@ class XlsxWriter(OutputWriter):
 
 
 class PrivacyStatisticsWriter(OutputWriter):
-    """Writes privacy-focused statistics to a JSON file.
+    """Writes privacy-focused statistics to a JSON or MessagePack file.
 
     This writer generates aggregated statistics by privacy dimensions and
     detection modules without storing individual PII instances or file paths.
+
+    The JSON is compact unless ``pretty=True`` asks for two-space indentation.
+    ``use_msgpack=True`` writes the same structure as MessagePack instead
+    (requires the ``msgpack`` extra), which is smaller and cheaper to encode
+    for the number-heavy statistics dictionaries.
     """
 
-    def __init__(self, file_path: str, include_header: bool = True):
+    def __init__(
+        self,
+        file_path: str,
+        include_header: bool = True,
+        pretty: bool = False,
+        use_msgpack: bool = False,
+    ):
         super().__init__(file_path, include_header)
+        self._pretty = pretty
+        self._msgpack: Any = None
+        if use_msgpack:
+            try:
+                import msgpack
+            except ImportError:
+                raise OutputError(
+                    "msgpack is required for MessagePack statistics output but "
+                    "is not installed."
+                )
+            self._msgpack = msgpack
         # This writer doesn't collect matches, but we need to implement write_match
         # for compatibility with the abstract base class
         self._match_count = 0
@@ -375,7 +640,7 @@ class PrivacyStatisticsWriter(OutputWriter):
         self._match_count += 1
 
     def finalize(self, metadata: dict | None = None) -> None:
-        """Write aggregated statistics to JSON file.
+        """Write aggregated statistics to the output file.
 
         Args:
             metadata: Dictionary containing:
@@ -399,11 +664,15 @@ class PrivacyStatisticsWriter(OutputWriter):
             "performance_metrics": metadata.get("performance_metrics", {}),
         }
 
+        if self._msgpack is not None:
+            payload = self._msgpack.packb(output_data, use_bin_type=True)
+        else:
+            payload = _json_bytes(output_data, indent=self._pretty)
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            with open(self.file_path, "wb") as f:
+                f.write(payload)
         except OSError as e:
-            raise OutputError(f"Failed to write statistics JSON output: {e}")
+            raise OutputError(f"Failed to write statistics output: {e}")
 
     @property
     def supports_streaming(self) -> bool:
@@ -411,22 +680,41 @@ class PrivacyStatisticsWriter(OutputWriter):
 
 
 class HtmlWriter(OutputWriter):
-    """Writes findings to a self-contained HTML report with interactive dashboard."""
+    """Writes findings to a self-contained HTML report with interactive dashboard.
+
+    Table rows are rendered as matches arrive and appended to a temporary file,
+    like ``JsonWriter``'s body file, so memory stays flat however many findings
+    a scan produces. The summary cards above the table need the final counts,
+    so ``finalize()`` writes the page head and then copies the rows after it.
+    """
 
     def __init__(self, file_path: str, include_header: bool = True):
         super().__init__(file_path, include_header)
-        self.matches: list[dict] = []
+        self._count = 0
+        self._sev_counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
+        self._rows_path = file_path + ".rows.tmp"
+        try:
+            self._rows_file = open(self._rows_path, "w", encoding="utf-8")
+        except OSError as e:
+            raise OutputError(f"Failed to open output file: {e}")
 
     def write_match(self, match: PiiMatch) -> None:
-        self.matches.append(
-            {
-                "text": match.text,
-                "file": match.file,
-                "type": match.type,
-                "score": match.ner_score,
-                "engine": match.engine,
-                "severity": match.severity,
-            }
+        severity = match.severity
+        sev_counts = self._sev_counts
+        if severity in sev_counts:
+            sev_counts[severity] += 1
+        self._count += 1
+        escape = html.escape
+        sev = escape(str(severity))
+        self._rows_file.write(
+            "<tr>"
+            f"<td>{escape(str(match.file))}</td>"
+            f"<td>{escape(str(match.type))}</td>"
+            f'<td class="match-text">{escape(str(match.text))}</td>'
+            f"<td>{escape(str(match.engine))}</td>"
+            f'<td><span class="badge sev-{sev}" onclick="filterSev(\'{sev}\')">{sev}</span></td>'
+            f"<td>{escape(str(match.ner_score))}</td>"
+            "</tr>\n"
         )
 
     def finalize(self, metadata: dict | None = None) -> None:
@@ -434,30 +722,10 @@ class HtmlWriter(OutputWriter):
         start_time = html.escape(str(meta.get("start_time", "N/A")))
         duration = html.escape(str(meta.get("duration", "N/A")))
         files_scanned = html.escape(str(meta.get("files_scanned", "N/A")))
-        total_findings = len(self.matches)
-
-        sev_counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
-        for m in self.matches:
-            sev = m.get("severity", "LOW")
-            if sev in sev_counts:
-                sev_counts[sev] += 1
-
-        # Build table rows
-        rows_html = ""
-        for m in self.matches:
-            sev = html.escape(str(m.get("severity", "")))
-            rows_html += (
-                "<tr>"
-                f"<td>{html.escape(str(m.get('file', '')))}</td>"
-                f"<td>{html.escape(str(m.get('type', '')))}</td>"
-                f'<td class="match-text">{html.escape(str(m.get("text", "")))}</td>'
-                f"<td>{html.escape(str(m.get('engine', '')))}</td>"
-                f'<td><span class="badge sev-{sev}" onclick="filterSev(\'{sev}\')">{sev}</span></td>'
-                f"<td>{html.escape(str(m.get('score', '')))}</td>"
-                "</tr>\n"
-            )
+        total_findings = self._count
+        sev_counts = self._sev_counts
 
-        page = f"""<!DOCTYPE html>
+        page_head = f"""<!DOCTYPE html>
 <html lang="en"><head><meta charset="utf-8">
 <title>PII Scan Report</title>
 <style>
@@ -517,30 +785,38 @@ tr:hover{{background:#f0f4ff}}
 <th onclick="sortTable(4)">Severity</th>
 <th onclick="sortTable(5)">Score</th>
 </tr></thead><tbody id="tbody">
-{rows_html}</tbody></table>
+"""
+        page_tail = """</tbody></table>
 <script>
 let sortCol=-1,sortAsc=true;
-function sortTable(c){{if(sortCol===c)sortAsc=!sortAsc;else{{sortCol=c;sortAsc=true}}
+function sortTable(c){if(sortCol===c)sortAsc=!sortAsc;else{sortCol=c;sortAsc=true}
 const tb=document.getElementById('tbody');
 const rows=Array.from(tb.rows);
-rows.sort((a,b)=>{{let va=a.cells[c].textContent,vb=b.cells[c].textContent;
-if(c===5){{va=parseFloat(va)||0;vb=parseFloat(vb)||0;return sortAsc?va-vb:vb-va}}
-return sortAsc?va.localeCompare(vb):vb.localeCompare(va)}});
-rows.forEach(r=>tb.appendChild(r))}}
-function applyFilters(){{const q=document.getElementById('search').value.toLowerCase();
+rows.sort((a,b)=>{let va=a.cells[c].textContent,vb=b.cells[c].textContent;
+if(c===5){va=parseFloat(va)||0;vb=parseFloat(vb)||0;return sortAsc?va-vb:vb-va}
+return sortAsc?va.localeCompare(vb):vb.localeCompare(va)});
+rows.forEach(r=>tb.appendChild(r))}
+function applyFilters(){const q=document.getElementById('search').value.toLowerCase();
 const sev=document.getElementById('sevFilter').value;
 const rows=document.getElementById('tbody').rows;
-for(let r of rows){{const txt=r.textContent.toLowerCase();
+for(let r of rows){const txt=r.textContent.toLowerCase();
 const rSev=r.cells[4].textContent.trim();
-r.style.display=(txt.includes(q)&&(!sev||rSev===sev))?'':'none'}}}}
-function filterSev(s){{document.getElementById('sevFilter').value=s;applyFilters()}}
+r.style.display=(txt.includes(q)&&(!sev||rSev===sev))?'':'none'}}
+function filterSev(s){document.getElementById('sevFilter').value=s;applyFilters()}
 </script></body></html>"""
 
         try:
+            self._rows_file.close()
             with open(self.file_path, "w", encoding="utf-8") as f:
-                f.write(page)
+                f.write(page_head)
+                with open(self._rows_path, encoding="utf-8") as rows:
+                    shutil.copyfileobj(rows, f, _JSON_MERGE_CHUNK_SIZE)
+                f.write(page_tail)
         except OSError as e:
             raise OutputError(f"Failed to write HTML output: {e}")
+        finally:
+            if os.path.exists(self._rows_path):
+                os.remove(self._rows_path)
 
     @property
     def supports_streaming(self) -> bool:
@@ -645,6 +921,8 @@ def create_output_writer(
         return SarifWriter(file_path, include_header)
     elif output_format == "statistics":
         return PrivacyStatisticsWriter(file_path, include_header)
+    elif output_format == "statistics-msgpack":
+        return PrivacyStatisticsWriter(file_path, include_header, use_msgpack=True)
 
     # Default to CSV
     return CsvWriter(file_path, include_header)
@@ -1,5 +1,8 @@
 """File processors for extracting text from different file formats."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from file_processors.base_processor import (
     BaseFileProcessor,
     CorruptedFileError,
@@ -10,30 +13,63 @@ from file_processors.base_processor import (
     read_text_with_fallback,
 )
 from file_processors.csv_processor import CsvProcessor
-from file_processors.docx_processor import DocxProcessor
-from file_processors.eml_processor import EmlProcessor
-from file_processors.html_processor import HtmlProcessor
 from file_processors.ical_processor import IcalProcessor
 from file_processors.image_processor import ImageProcessor
 from file_processors.json_processor import JsonProcessor
 from file_processors.markdown_processor import MarkdownProcessor
 from file_processors.mbox_processor import MboxProcessor
-from file_processors.msg_processor import MsgProcessor
-from file_processors.ods_processor import OdsProcessor
-from file_processors.odt_processor import OdtProcessor
-from file_processors.pdf_processor import PdfProcessor
-from file_processors.pptx_processor import PptProcessor, PptxProcessor
 from file_processors.properties_processor import PropertiesProcessor
-from file_processors.registry import FileProcessorRegistry
-from file_processors.rtf_processor import RtfProcessor
+from file_processors.registry import FileProcessorRegistry, LazyFileProcessor
 from file_processors.sqlite_processor import SqliteProcessor
 from file_processors.text_processor import TextProcessor
 from file_processors.vcf_processor import VcfProcessor
 from file_processors.xlsx_processor import XlsProcessor, XlsxProcessor
 from file_processors.xml_processor import XmlProcessor
-from file_processors.yaml_processor import YamlProcessor
 from file_processors.zip_processor import ZipProcessor
 
+if TYPE_CHECKING:
+    from file_processors.docx_processor import DocxProcessor
+    from file_processors.eml_processor import EmlProcessor
+    from file_processors.html_processor import HtmlProcessor
+    from file_processors.msg_processor import MsgProcessor
+    from file_processors.ods_processor import OdsProcessor
+    from file_processors.odt_processor import OdtProcessor
+    from file_processors.pdf_processor import PdfProcessor
+    from file_processors.pptx_processor import PptProcessor, PptxProcessor
+    from file_processors.rtf_processor import RtfProcessor
+    from file_processors.yaml_processor import YamlProcessor
+
+# Processors backed by heavy third-party imports: class name -> (module,
+# extensions). They are registered as LazyFileProcessor stand-ins and their
+# classes are exported lazily via __getattr__ below, so importing this package
+# does not import pdfminer, python-docx, extract-msg, etc.
+_LAZY_PROCESSORS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "PdfProcessor": ("file_processors.pdf_processor", (".pdf",)),
+    "DocxProcessor": ("file_processors.docx_processor", (".docx",)),
+    "HtmlProcessor": ("file_processors.html_processor", (".html", ".htm")),
+    "RtfProcessor": ("file_processors.rtf_processor", (".rtf",)),
+    "OdtProcessor": ("file_processors.odt_processor", (".odt",)),
+    "EmlProcessor": ("file_processors.eml_processor", (".eml",)),
+    "MsgProcessor": ("file_processors.msg_processor", (".msg",)),
+    "OdsProcessor": ("file_processors.ods_processor", (".ods",)),
+    "PptxProcessor": ("file_processors.pptx_processor", (".pptx",)),
+    "PptProcessor": ("file_processors.pptx_processor", (".ppt",)),
+    "YamlProcessor": ("file_processors.yaml_processor", (".yaml", ".yml")),
+}
+
+
+def __getattr__(name: str) -> type:
+    if name in _LAZY_PROCESSORS:
+        module, _ = _LAZY_PROCESSORS[name]
+        return getattr(importlib.import_module(module), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lazy(class_name: str) -> LazyFileProcessor:
+    module, extensions = _LAZY_PROCESSORS[class_name]
+    return LazyFileProcessor(module, class_name, extensions)
+
+
 __all__ = [
     "BaseFileProcessor",
     "FileProcessingError",
@@ -43,6 +79,7 @@ __all__ = [
     "decode_with_fallback",
     "read_text_with_fallback",
     "FileProcessorRegistry",
+    "LazyFileProcessor",
     "PdfProcessor",
     "DocxProcessor",
     "HtmlProcessor",
@@ -72,25 +109,26 @@ __all__ = [
 
 # Auto-register all processors
 # This allows new processors to be automatically discovered
-# Simply import them above and they will be registered here
-_registered_processors = [
-    PdfProcessor(),
-    DocxProcessor(),
-    HtmlProcessor(),
+# Simply import them above (or add them to _LAZY_PROCESSORS) and register them
+# here; list order is dispatch priority.
+_registered_processors: list[BaseFileProcessor] = [
+    _lazy("PdfProcessor"),
+    _lazy("DocxProcessor"),
+    _lazy("HtmlProcessor"),
     TextProcessor(),
     CsvProcessor(),
     JsonProcessor(),
-    RtfProcessor(),
-    OdtProcessor(),
-    EmlProcessor(),
+    _lazy("RtfProcessor"),
+    _lazy("OdtProcessor"),
+    _lazy("EmlProcessor"),
     XlsxProcessor(),
     XlsProcessor(),
     XmlProcessor(),
-    MsgProcessor(),
-    OdsProcessor(),
-    PptxProcessor(),
-    PptProcessor(),
-    YamlProcessor(),
+    _lazy("MsgProcessor"),
+    _lazy("OdsProcessor"),
+    _lazy("PptxProcessor"),
+    _lazy("PptProcessor"),
+    _lazy("YamlProcessor"),
     ImageProcessor(),
     ZipProcessor(),
     SqliteProcessor(),
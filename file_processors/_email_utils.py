@@ -0,0 +1,62 @@
+"""MIME helpers shared by the e-mail processors."""
+
+import logging
+from collections.abc import Iterator
+from email.message import Message
+
+_logger = logging.getLogger(__name__)
+
+_TEXT_TYPES = ("text/plain", "text/html")
+
+
+def iter_text_parts(msg: Message) -> Iterator[Message]:
+    """Yield the text/plain and text/html leaf parts of *msg* in order.
+
+    A multipart/alternative holds several renderings of the same content. When
+    one of them is text/plain, only that one is yielded; converting the HTML
+    rendering (typically a multipart/related around text/html) to text would
+    just scan the same words twice.
+
+    Args:
+        msg: Message or MIME part, under any email policy
+
+    Yields:
+        The text parts to extract the body from
+    """
+    if not msg.is_multipart():
+        if msg.get_content_type() in _TEXT_TYPES:
+            yield msg
+        return
+    # A multipart payload is always the list of its subparts.
+    subparts: list[Message] = msg.get_payload()  # type: ignore[assignment]
+    if msg.get_content_type() == "multipart/alternative":
+        plain = [p for p in subparts if p.get_content_type() == "text/plain"]
+        if plain:
+            subparts = plain
+    for part in subparts:
+        yield from iter_text_parts(part)
+
+
+def decode_text_part(part: Message) -> str:
+    """Return the decoded payload of a text part as a string.
+
+    The declared charset is used when Python knows it, UTF-8 otherwise (also
+    when none is declared); undecodable bytes are replaced rather than
+    dropping the part.
+
+    Args:
+        part: Non-multipart message or MIME part
+
+    Returns:
+        The text, or an empty string when the part has no byte payload
+    """
+    payload = part.get_payload(decode=True)
+    if not isinstance(payload, bytes):
+        return ""
+    charset = part.get_content_charset() or "utf-8"
+    try:
+        return payload.decode(charset, errors="replace")
+    except (UnicodeDecodeError, LookupError) as exc:
+        # Unknown/unsupported charset name: fall back to utf-8
+        _logger.debug("Falling back to utf-8 for charset %r: %s", charset, exc)
+        return payload.decode("utf-8", errors="replace")
@@ -0,0 +1,36 @@
+"""Text extraction helpers shared by the OpenDocument (ODS/ODT) processors."""
+
+from xml.dom import Node
+
+# odfpy's DOM uses the standard node type codes.
+_TEXT_NODE = Node.TEXT_NODE
+
+
+def element_text(element) -> str:
+    """Return the text of all text nodes below an odfpy element.
+
+    The text nodes are joined with a space, in document order.
+
+    Args:
+        element: odfpy element (table cell, paragraph, heading, ...)
+
+    Returns:
+        Extracted text content
+    """
+    text_parts: list[str] = []
+    _collect_text(element, text_parts)
+    return " ".join(text_parts)
+
+
+def _collect_text(element, text_parts: list[str]) -> None:
+    # Dispatching on nodeType is a plain class attribute read; the former
+    # hasattr(child, "data") / hasattr(child, "childNodes") probes each went
+    # through a failed attribute lookup for half of the nodes. An explicit
+    # stack of child iterators measured slower than these (shallow) recursive
+    # calls.
+    for child in element.childNodes:
+        if child.nodeType == _TEXT_NODE:
+            if child.data:
+                text_parts.append(child.data)
+        elif child.childNodes:
+            _collect_text(child, text_parts)
@@ -7,10 +7,13 @@ to extract plain text from that format.  All processors share the same interface
 Iterator vs. string return type
 --------------------------------
 ``extract_text`` returns either a ``str`` or an ``Iterator[str]``.  The Iterator
-variant is preferred for large files (PDFs, mailboxes, ZIP archives, databases)
-because it allows the scanner to process text chunk by chunk without loading the
-entire file into memory.  Processors that return a single string are fine for small,
-memory-safe formats (HTML, Markdown, plain text).
+variant is preferred for large files (PDFs, CSV exports, mailboxes, ZIP archives,
+databases, Outlook messages, OpenDocument and PowerPoint files) because it allows the
+scanner to process text chunk by chunk without loading the entire file into memory;
+yield each part as it is read rather than collecting it first.  Processors that
+return a single string are fine for small, memory-safe formats (HTML, Markdown, plain
+text); build that string with ``str.join`` over a list, which measures faster than
+writing the parts to an ``io.StringIO``.
 
 Exception hierarchy
 -------------------
@@ -20,6 +23,7 @@ update statistics by failure category.  Using a flat ``Exception`` everywhere wo
 hide whether a file was skipped due to corruption or encryption.
 """
 
+import io
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
@@ -79,6 +83,24 @@ class BaseFileProcessor(ABC):
         generic exceptions.
     """
 
+    # Processors are stateless singletons: without an instance __dict__ each
+    # registered processor is smaller and attribute lookups on it skip the
+    # dict probe. Subclasses declare ``__slots__ = ()`` as well, otherwise
+    # they get a __dict__ again.
+    __slots__ = ()
+
+    # Lower-case extensions the processor claims by extension alone, as listed by
+    # FileProcessorRegistry.get_supported_extensions(). can_process may also
+    # accept other files by MIME type or content.
+    SUPPORTED_EXTENSIONS: frozenset[str] = frozenset()
+
+    # Whether the chunks an iterator-based extract_text yields are parts of one
+    # document (pages, slides, paragraphs) that TextProcessor may merge into
+    # larger texts. False for separate records (table rows, mailbox messages,
+    # archive members): a merged text would let context checks and NER spans
+    # reach across unrelated records.
+    COALESCE_CHUNKS: bool = False
+
     @abstractmethod
     def extract_text(self, file_path: str) -> str | Iterator[str]:
         """Extract text content from a file.
@@ -177,6 +199,10 @@ def read_text_with_fallback(
 ) -> str:
     """Read a text file trying multiple encodings.
 
+    The file is read from disk once; each encoding is then tried on the bytes
+    in memory, so a non-UTF-8 file no longer costs one full read per failed
+    encoding. Newlines are translated as in text-mode ``open()``.
+
     Args:
         file_path: Path to the text file.
         encodings: Tuple of encoding names to try in order.
@@ -189,11 +215,13 @@ def read_text_with_fallback(
         FileNotFoundError: If the file does not exist.
         PermissionError: If the file cannot be accessed.
     """
+    with open(file_path, "rb") as fh:
+        data = fh.read()
+
     last_error: UnicodeDecodeError | None = None
     for enc in encodings:
         try:
-            with open(file_path, encoding=enc) as fh:
-                return fh.read()
+            return io.TextIOWrapper(io.BytesIO(data), encoding=enc).read()
         except UnicodeDecodeError as exc:
             last_error = exc
             continue
@@ -2,9 +2,13 @@
 
 import csv
 import io
+from collections.abc import Iterator
 
 from file_processors.base_processor import BaseFileProcessor, read_text_with_fallback
-from file_processors.xlsx_processor import _format_sheet_rows
+from file_processors.xlsx_processor import _iter_text_rows
+
+# Candidate delimiters, in tie-break order (comma wins ties and empty samples).
+_DELIMITERS = (",", ";", "\t", "|")
 
 
 class CsvProcessor(BaseFileProcessor):
@@ -15,7 +19,10 @@ class CsvProcessor(BaseFileProcessor):
     Extracts all cell values as text for PII detection.
     """
 
-    def extract_text(self, file_path: str) -> str:
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".csv"})
+
+    def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from a CSV file.
 
         Attempts to detect the delimiter automatically by trying common delimiters.
@@ -24,11 +31,14 @@ class CsvProcessor(BaseFileProcessor):
         (e.g. a value under an "IBAN" column).  One line per record preserves row
         boundaries so entities from different records do not fuse.
 
+        Lines are yielded as the rows are parsed, so no per-cell list of the
+        whole file is built; the scanner merges them into detection chunks.
+
         Args:
             file_path: Path to the CSV file
 
-        Returns:
-            Extracted text content from all cells as a string
+        Yields:
+            One text line per non-empty record, header line first when detected
 
         Raises:
             UnicodeDecodeError: If file encoding cannot be decoded
@@ -38,18 +48,15 @@ class CsvProcessor(BaseFileProcessor):
         """
         content = read_text_with_fallback(file_path)
 
-        # Detect delimiter from first 1024 chars
+        # Detect delimiter from first 1024 chars; max() keeps the first of
+        # equal counts, so a sample without any candidate falls back to ",".
         sample = content[:1024]
-        delimiters = [",", ";", "\t", "|"]
-        delimiter_counts = {d: sample.count(d) for d in delimiters}
-        detected_delimiter = ","
-        if max(delimiter_counts.values()) > 0:
-            detected_delimiter = max(
-                delimiter_counts, key=lambda d: delimiter_counts[d]
-            )
+        detected_delimiter = max(_DELIMITERS, key=sample.count)
 
         reader = csv.reader(io.StringIO(content), delimiter=detected_delimiter)
-        return "\n".join(_format_sheet_rows(reader))
+        # csv yields str cells, so skip the generic None/str() conversion and
+        # strip each cell once at C speed.
+        yield from _iter_text_rows(list(map(str.strip, row)) for row in reader)
 
     @staticmethod
     def can_process(extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
@@ -7,7 +7,10 @@ import tempfile
 from email.policy import default
 
 from core import skip_counters
+from file_processors._email_utils import decode_text_part, iter_text_parts
+from file_processors._html_utils import strip_html
 from file_processors.base_processor import BaseFileProcessor
+from file_processors.registry import LazyFileProcessor
 
 _logger = logging.getLogger(__name__)
 
@@ -28,6 +31,9 @@ class EmlProcessor(BaseFileProcessor):
     is scanned for PII just like a standalone file).
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".eml"})
+
     def extract_text(self, file_path: str, *, _depth: int = 0) -> str:
         """Extract text from an EML file.
 
@@ -164,6 +170,10 @@ class EmlProcessor(BaseFileProcessor):
             processor = registry.get_processor(ext, tmp_path, content_type)
             if processor is None:
                 return ""
+            # The default registry holds a lazy stand-in for EmlProcessor;
+            # unwrap it so the isinstance check below still sees nested mail.
+            if isinstance(processor, LazyFileProcessor):
+                processor = processor.load()
 
             # Nested .eml: pass recursion depth to enforce the depth limit.
             if isinstance(processor, EmlProcessor):
@@ -198,62 +208,20 @@ class EmlProcessor(BaseFileProcessor):
 
         if msg.is_multipart():
             # Handle multipart messages (may contain both plain text and HTML)
-            for part in msg.walk():
-                content_type = part.get_content_type()
-
-                if content_type == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    if isinstance(payload, bytes):
-                        try:
-                            # Try to decode with charset from part
-                            charset = part.get_content_charset() or "utf-8"
-                            text = payload.decode(charset, errors="replace")
-                            text_parts.append(text)
-                        except (UnicodeDecodeError, LookupError):
-                            # Fallback to utf-8 with error replacement
-                            text = payload.decode("utf-8", errors="replace")
-                            text_parts.append(text)
-
-                elif content_type == "text/html":
-                    # Extract text from HTML (simple approach - just get the text)
-                    payload = part.get_payload(decode=True)
-                    if isinstance(payload, bytes):
-                        try:
-                            charset = part.get_content_charset() or "utf-8"
-                            html_content = payload.decode(charset, errors="replace")
-                        except (UnicodeDecodeError, LookupError) as exc:
-                            # Unknown/unsupported charset name: fall back to utf-8
-                            # rather than silently dropping the whole HTML body,
-                            # matching the text/plain branch above.
-                            _logger.debug(
-                                "Falling back to utf-8 for text/html part (charset=%r): %s",
-                                charset,
-                                exc,
-                            )
-                            html_content = payload.decode("utf-8", errors="replace")
-                        # Simple HTML tag removal (basic approach)
-                        # For better results, could use BeautifulSoup, but keeping it simple
-                        import re
-
-                        # Remove HTML tags
-                        text = re.sub(r"<[^>]+>", " ", html_content)
-                        # Clean up whitespace
-                        text = " ".join(text.split())
-                        if text.strip():
-                            text_parts.append(text)
+            for part in iter_text_parts(msg):
+                if part.get_content_type() == "text/plain":
+                    text_parts.append(decode_text_part(part))
+                else:
+                    text = strip_html(decode_text_part(part))
+                    # Clean up whitespace
+                    text = " ".join(text.split())
+                    if text:
+                        text_parts.append(text)
         else:
             # Single part message
-            payload = msg.get_payload(decode=True)
-            if isinstance(payload, bytes):
-                try:
-                    charset = msg.get_content_charset() or "utf-8"
-                    text = payload.decode(charset, errors="replace")
-                    text_parts.append(text)
-                except (UnicodeDecodeError, LookupError):
-                    text = payload.decode("utf-8", errors="replace")
-                    text_parts.append(text)
+            text_parts.append(decode_text_part(msg))
 
-        return " ".join(text_parts)
+        return " ".join(filter(None, text_parts))
 
     @staticmethod
     def can_process(extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
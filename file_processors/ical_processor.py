@@ -1,11 +1,46 @@
 """iCalendar (ICS) file processor for extracting calendar data."""
 
 import logging
+import re
 
 from file_processors.base_processor import BaseFileProcessor
 
 _logger = logging.getLogger(__name__)
 
+# RFC 5545 3.1: a long line is folded by inserting a line break followed by a
+# single space or tab; unfolding removes exactly that pair.
+_FOLD_RE = re.compile(r"\r?\n[ \t]")
+# Properties that may contain PII
+_PROPS = frozenset(
+    {
+        "SUMMARY",
+        "DESCRIPTION",
+        "LOCATION",
+        "ORGANIZER",
+        "ATTENDEE",
+        "CONTACT",
+        "ATTACH",
+        "COMMENT",
+        "RESOURCES",
+        "URL",
+        "UID",
+        "CREATED",
+        "LAST-MODIFIED",
+    }
+)
+# Content line (RFC 5545 3.1): name, ";"-separated parameters and value. The
+# value starts at the first ":" outside a double-quoted parameter value.
+_LINE_RE = re.compile(r'([^;:"]+)((?:;(?:[^:"]|"[^"]*")*)?):(.*)')
+_PARAM_RE = re.compile(r';([^;="]+)=((?:[^;"]|"[^"]*")*)')
+# Parameters whose values name or address a person (RFC 5545 3.2), e.g. the
+# CN in ORGANIZER;CN=Erika Musterfrau:mailto:...
+_PARAMS = frozenset(
+    {"CN", "SENT-BY", "DIR", "DELEGATED-FROM", "DELEGATED-TO", "MEMBER", "ALTREP"}
+)
+# RFC 5545 3.3.11 TEXT escapes
+_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+_UNESCAPED = {"\\": "\\", ";": ";", ",": ",", "n": "\n", "N": "\n"}
+
 
 class IcalProcessor(BaseFileProcessor):
     """Processor for iCalendar (ICS) files.
@@ -14,6 +49,9 @@ class IcalProcessor(BaseFileProcessor):
     locations, descriptions, and notes which may contain PII.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".ics", ".ical", ".ifb"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from iCalendar file.
 
@@ -31,66 +69,25 @@ class IcalProcessor(BaseFileProcessor):
         with open(file_path, encoding="utf-8", errors="replace") as f:
             content = f.read()
 
-        # iCalendar format is text-based with line continuation
-        # Lines ending with semicolon or comma continue on next line
-        lines = content.split("\n")
-        cleaned_lines = []
-        current_line = ""
-
-        for line in lines:
-            # Remove line continuation (lines ending with semicolon or comma)
-            if line.endswith(";") or line.endswith(","):
-                current_line += line.rstrip(";,")
-                continue
-            else:
-                current_line += line
-                cleaned_lines.append(current_line)
-                current_line = ""
-
-        # Extract relevant properties that may contain PII
-        # Properties: SUMMARY, DESCRIPTION, LOCATION, ORGANIZER, ATTENDEE, CONTACT, etc.
-        relevant_properties = [
-            "SUMMARY",
-            "DESCRIPTION",
-            "LOCATION",
-            "ORGANIZER",
-            "ATTENDEE",
-            "CONTACT",
-            "ATTACH",
-            "COMMENT",
-            "RESOURCES",
-            "URL",
-            "UID",
-            "CREATED",
-            "LAST-MODIFIED",
-        ]
-
         extracted = []
-        for line in cleaned_lines:
-            line_upper = line.upper()
-            for prop in relevant_properties:
-                if line_upper.startswith(prop + ":"):
-                    # Extract value after colon
-                    if ":" in line:
-                        value = line.split(":", 1)[1]
-                        # Unescape iCalendar escaping
-                        value = (
-                            value.replace("\\n", "\n")
-                            .replace("\\,", ",")
-                            .replace("\\\\", "\\")
-                        )
-                        # Remove property parameters (e.g., ORGANIZER;CN=Name:email@example.com)
-                        if ";" in value:
-                            # Keep the part after last semicolon if it contains @ (email)
-                            parts = value.split(";")
-                            for part in reversed(parts):
-                                if "@" in part or "=" in part:
-                                    value = (
-                                        part.split(":", 1)[-1] if ":" in part else part
-                                    )
-                                    break
-                        extracted.append(f"{prop}: {value}")
-                    break
+        for line in _FOLD_RE.sub("", content).splitlines():
+            match = _LINE_RE.match(line)
+            if match is None:
+                continue
+            name, params, value = match.groups()
+            name = name.upper()
+            if name in _PROPS:
+                if "\\" in value:
+                    value = _ESCAPE_RE.sub(lambda m: _UNESCAPED[m[1]], value)
+                # Keep person-related parameter values such as the CN name
+                kept = [
+                    param_value.replace('"', "")
+                    for param_name, param_value in _PARAM_RE.findall(params)
+                    if param_value and param_name.upper() in _PARAMS
+                ]
+                if kept:
+                    value = " ".join((*kept, value))
+                extracted.append(f"{name}: {value}")
 
         return "\n".join(extracted)
 
@@ -106,7 +103,7 @@ class IcalProcessor(BaseFileProcessor):
         Returns:
             True if file is an iCalendar file, False otherwise
         """
-        if extension.lower() in [".ics", ".ical", ".ifb"]:
+        if extension.lower() in IcalProcessor.SUPPORTED_EXTENSIONS:
             return True
 
         if mime_type:
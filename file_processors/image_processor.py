@@ -2,12 +2,23 @@
 
 import base64
 import logging
-import os
+import mmap
 
 from file_processors.base_processor import BaseFileProcessor
 
 _logger = logging.getLogger(__name__)
 
+_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+    ".tiff": "image/tiff",
+    ".tif": "image/tiff",
+    ".webp": "image/webp",
+}
+
 
 class ImageProcessor(BaseFileProcessor):
     """Processor for image files.
@@ -16,7 +27,10 @@ class ImageProcessor(BaseFileProcessor):
     Supports: JPEG, PNG, GIF, BMP, TIFF, WebP
     """
 
-    SUPPORTED_EXTENSIONS = [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"]
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset(
+        {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"}
+    )
 
     def extract_text(self, file_path: str) -> str:
         """Extract image data as base64 for multimodal processing.
@@ -35,23 +49,43 @@ class ImageProcessor(BaseFileProcessor):
         # The engine will read the file directly
         return ""
 
-    def get_image_base64(self, file_path: str) -> str | None:
-        """Get base64-encoded image data.
+    def get_image_base64_bytes(self, file_path: str) -> bytes | None:
+        """Get base64-encoded image data as ASCII bytes.
+
+        The file is memory-mapped and encoded straight from the mapping, so
+        the raw image is never copied onto the heap.
 
         Args:
             file_path: Path to image file
 
         Returns:
-            Base64-encoded string or None if error
+            Base64-encoded bytes or None if error
         """
         try:
             with open(file_path, "rb") as img_file:
-                img_data = img_file.read()
-                return base64.b64encode(img_data).decode("utf-8")
+                try:
+                    mapped = mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty file: nothing to map.
+                    return b""
+                with mapped:
+                    return base64.b64encode(mapped)
         except (OSError, ValueError) as e:
             _logger.warning("Failed to read image file %s: %s", file_path, e)
             return None
 
+    def get_image_base64(self, file_path: str) -> str | None:
+        """Get base64-encoded image data.
+
+        Args:
+            file_path: Path to image file
+
+        Returns:
+            Base64-encoded string or None if error
+        """
+        data = self.get_image_base64_bytes(file_path)
+        return None if data is None else data.decode("ascii")
+
     def get_image_mime_type(self, file_path: str) -> str | None:
         """Get MIME type for image.
 
@@ -61,18 +95,10 @@ class ImageProcessor(BaseFileProcessor):
         Returns:
             MIME type string or None
         """
-        ext = os.path.splitext(file_path)[1].lower()
-        mime_types = {
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".gif": "image/gif",
-            ".bmp": "image/bmp",
-            ".tiff": "image/tiff",
-            ".tif": "image/tiff",
-            ".webp": "image/webp",
-        }
-        return mime_types.get(ext)
+        _, dot, suffix = file_path.rpartition(".")
+        if not dot:
+            return None
+        return _MIME_TYPES.get("." + suffix.lower())
 
     @staticmethod
     def can_process(extension: str, file_path: str = "", mime_type: str = "") -> bool:
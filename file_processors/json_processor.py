@@ -1,25 +1,40 @@
-"""JSON file processor using Python's built-in json module."""
+"""JSON file processor using orjson or Python's built-in json module."""
 
 import json
 import logging
 import os
+import re
+from collections.abc import Iterator
+from itertools import chain
 from typing import Any
 
 from file_processors.base_processor import BaseFileProcessor
 
+try:
+    # Optional: orjson parses straight from bytes and is several times faster.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 _logger = logging.getLogger(__name__)
 
 _JSON_MEMORY_WARNING_MB = 50
+# Quoted strings in malformed JSON, e.g. "key": "value" or 'key': 'value'
+_QUOTED_STRING_RE = re.compile(r'["\']([^"\']+)["\']')
 
 
 class JsonProcessor(BaseFileProcessor):
     """Processor for JSON files.
 
-    Extracts text from JSON files using Python's built-in json module.
+    Extracts text from JSON files using orjson when it is installed (the
+    ``speedups`` extra) and Python's built-in json module otherwise.
     Recursively extracts all string values (both keys and values) for PII detection.
     Handles nested structures, arrays, and objects.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".json"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from a JSON file.
 
@@ -47,49 +62,64 @@ class JsonProcessor(BaseFileProcessor):
                 file_path,
             )
 
-        text_parts: list[str] = []
+        with open(file_path, "rb") as jsonfile:
+            raw = jsonfile.read()
 
-        with open(file_path, encoding="utf-8", errors="replace") as jsonfile:
+        try:
+            data: Any = _json_loads(raw)
+        except ValueError:
+            # Invalid JSON or invalid UTF-8: decode leniently and retry, which
+            # recovers documents with a few undecodable bytes.
+            content = raw.decode("utf-8", errors="replace")
             try:
-                data: Any = json.load(jsonfile)
-                self._extract_strings(data, text_parts)
+                data = json.loads(content)
             except json.JSONDecodeError:
-                # If JSON is invalid, try to read as text and extract strings
-                # This handles malformed JSON files that might still contain PII
-                jsonfile.seek(0)
-                content = jsonfile.read()
-                # Extract potential string values using simple heuristics
-                # Look for patterns like "key": "value" or 'key': 'value'
-                import re
-
-                string_pattern = r'["\']([^"\']+)["\']'
-                matches = re.findall(string_pattern, content)
-                text_parts.extend(matches)
+                # If JSON is invalid, extract potential string values using
+                # simple heuristics. This handles malformed JSON files that
+                # might still contain PII
+                return " ".join(_QUOTED_STRING_RE.findall(content))
 
+        text_parts: list[str] = []
+        self._extract_strings(data, text_parts)
         return " ".join(text_parts)
 
     def _extract_strings(self, obj: Any, text_parts: list[str]) -> None:
-        """Recursively extract all string values from a JSON object.
+        """Extract all string keys and values from a JSON object, in order.
+
+        Walks an explicit stack instead of recursing, so deeply nested input
+        cannot hit the recursion limit. JSON parsers only produce plain
+        dict/list/str objects, hence the exact ``type() is`` checks.
 
         Args:
             obj: The JSON object (dict, list, or primitive)
             text_parts: List to accumulate extracted strings
         """
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                # Extract key if it's a string
-                if isinstance(key, str) and key.strip():
-                    text_parts.append(key.strip())
-                # Recursively process value
-                self._extract_strings(value, text_parts)
-        elif isinstance(obj, list):
-            for item in obj:
-                self._extract_strings(item, text_parts)
-        elif isinstance(obj, str):
-            # Extract string value
-            if obj.strip():
-                text_parts.append(obj.strip())
-        # Numbers, booleans, None are ignored as they're not useful for PII detection
+        append = text_parts.append
+        from_items = chain.from_iterable
+        # Local names for the per-item type checks
+        str_type, dict_type, list_type = str, dict, list
+        # One iterator per open container; the innermost is on top.
+        stack: list[Iterator[Any]] = [iter((obj,))]
+        while stack:
+            for item in stack[-1]:
+                item_type = type(item)
+                if item_type is str_type:
+                    # strip() returns the string itself when there is nothing
+                    # to strip, so this does not copy
+                    item = item.strip()
+                    if item:
+                        append(item)
+                elif item_type is dict_type:
+                    # Keys and values interleaved, in document order
+                    stack.append(from_items(item.items()))
+                    break
+                elif item_type is list_type:
+                    stack.append(iter(item))
+                    break
+                # Numbers, booleans, None are ignored as they're not useful for
+                # PII detection
+            else:
+                stack.pop()
 
     @staticmethod
     def can_process(extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
@@ -4,6 +4,50 @@ import re
 
 from file_processors.base_processor import BaseFileProcessor
 
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```|~~~[\s\S]*?~~~")
+# All inline and line-level syntax in one alternation, so extract_text walks
+# the text once instead of once per construct. The leading lookahead lets the
+# scanner skip ordinary characters cheaply. At any position the first
+# alternative that matches wins: rules before list markers (``***`` is not a
+# bullet) and line markers before emphasis (``* item`` is not italic).
+_MARKUP_RE = re.compile(
+    r"(?=[`*_!\[<]|^)(?:"
+    r"(?P<line>^(?:#{1,6}\s+(?=.)|---+$|\*\*\*+$|\s*[-*+]\s+|\s*\d+\.\s+|>\s+))"
+    r"|(?P<html><[^>]+>)"
+    r"|(?P<code>`(?P<code_text>[^`]+)`)"
+    r"|(?P<bold_italic>\*\*\*(?P<bold_italic_text>[^*]+)\*\*\*)"
+    r"|(?P<bold>\*\*(?P<bold_text>[^*]+)\*\*)"
+    r"|(?P<italic>\*(?P<italic_text>[^*]+)\*)"
+    r"|(?P<bold_italic_alt>___(?P<bold_italic_alt_text>[^_]+)___)"
+    r"|(?P<bold_alt>__(?P<bold_alt_text>[^_]+)__)"
+    r"|(?P<italic_alt>_(?P<italic_alt_text>[^_]+)_)"
+    r"|(?P<image>!\[(?P<image_alt>[^\]]*)\]\((?P<image_url>[^)]+)\))"
+    r"|(?P<link>\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\)))",
+    re.MULTILINE,
+)
+# Characters that can start nested inline markup (``**[a](b)**``)
+_NESTED_MARKUP_RE = re.compile(r"[`*_!\[<]")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _strip_nested(text: str) -> str:
+    if _NESTED_MARKUP_RE.search(text):
+        return _MARKUP_RE.sub(_replace_markup, text)
+    return text
+
+
+def _replace_markup(match: re.Match[str]) -> str:
+    kind = match.lastgroup
+    if kind == "line" or kind == "html":
+        return ""
+    if kind == "code":
+        return match["code_text"]
+    if kind == "image":
+        return f"{match['image_alt']} {match['image_url']}"
+    if kind == "link":
+        return f"{_strip_nested(match['link_text'])} {match['link_url']}"
+    return _strip_nested(match[f"{kind}_text"])
+
 
 class MarkdownProcessor(BaseFileProcessor):
     """Processor for Markdown files with enhanced text extraction.
@@ -12,6 +56,9 @@ class MarkdownProcessor(BaseFileProcessor):
     Handles code blocks separately as they may contain sensitive data.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".md", ".markdown", ".mdown", ".mkd"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from Markdown file.
 
@@ -29,56 +76,21 @@ class MarkdownProcessor(BaseFileProcessor):
         with open(file_path, encoding="utf-8", errors="replace") as f:
             content = f.read()
 
-        # Extract code blocks first (they may contain sensitive data)
-        code_blocks = []
-        code_block_pattern = r"```[\s\S]*?```|~~~[\s\S]*?~~~"
-        code_matches = re.finditer(code_block_pattern, content)
-
-        for match in code_matches:
-            code_blocks.append(match.group())
-            # Replace with placeholder
-            content = content.replace(
-                match.group(), f"[CODE_BLOCK_{len(code_blocks)}]", 1
+        # Code blocks are kept verbatim (they may contain sensitive data);
+        # only the text between them is stripped of Markdown syntax.
+        parts = []
+        last_end = 0
+        for match in _CODE_BLOCK_RE.finditer(content):
+            parts.append(
+                _MARKUP_RE.sub(_replace_markup, content[last_end : match.start()])
             )
-
-        # Remove inline code (keep content)
-        content = re.sub(r"`([^`]+)`", r"\1", content)
-
-        # Remove headers but keep text
-        content = re.sub(r"^#{1,6}\s+(.+)$", r"\1", content, flags=re.MULTILINE)
-
-        # Remove bold/italic markers but keep text
-        content = re.sub(r"\*\*([^*]+)\*\*", r"\1", content)  # Bold
-        content = re.sub(r"\*([^*]+)\*", r"\1", content)  # Italic
-        content = re.sub(r"__([^_]+)__", r"\1", content)  # Bold (alt)
-        content = re.sub(r"_([^_]+)_", r"\1", content)  # Italic (alt)
-
-        # Remove links but keep text and URL
-        content = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1 \2", content)
-
-        # Remove images but keep alt text and URL
-        content = re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", r"\1 \2", content)
-
-        # Remove horizontal rules
-        content = re.sub(r"^---+$", "", content, flags=re.MULTILINE)
-        content = re.sub(r"^\*\*\*+$", "", content, flags=re.MULTILINE)
-
-        # Remove list markers but keep text
-        content = re.sub(r"^\s*[-*+]\s+", "", content, flags=re.MULTILINE)
-        content = re.sub(r"^\s*\d+\.\s+", "", content, flags=re.MULTILINE)
-
-        # Remove blockquotes but keep text
-        content = re.sub(r"^>\s+", "", content, flags=re.MULTILINE)
-
-        # Remove HTML tags if any
-        content = re.sub(r"<[^>]+>", "", content)
-
-        # Restore code blocks
-        for i, code_block in enumerate(code_blocks):
-            content = content.replace(f"[CODE_BLOCK_{i + 1}]", f"\n{code_block}\n")
+            parts.append(f"\n{match.group()}\n")
+            last_end = match.end()
+        parts.append(_MARKUP_RE.sub(_replace_markup, content[last_end:]))
+        content = "".join(parts)
 
         # Clean up multiple blank lines
-        content = re.sub(r"\n{3,}", "\n\n", content)
+        content = _BLANK_LINES_RE.sub("\n\n", content)
 
         return content.strip()
 
@@ -94,7 +106,7 @@ class MarkdownProcessor(BaseFileProcessor):
         Returns:
             True if file is a Markdown file, False otherwise
         """
-        if extension.lower() in [".md", ".markdown", ".mdown", ".mkd"]:
+        if extension.lower() in MarkdownProcessor.SUPPORTED_EXTENSIONS:
             return True
 
         if mime_type:
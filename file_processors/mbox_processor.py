@@ -2,13 +2,48 @@
 
 import email
 import logging
+import mmap
 from collections.abc import Iterator
+from typing import BinaryIO
 
 from core import skip_counters
+from file_processors._email_utils import decode_text_part, iter_text_parts
+from file_processors._html_utils import strip_html
 from file_processors.base_processor import BaseFileProcessor
 
 _logger = logging.getLogger(__name__)
 
+# A message starts at every line beginning with "From " (the mbox separator).
+_FROM_LINE = b"\nFrom "
+
+
+def _iter_messages(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the raw bytes of each message in the open mbox file *f*.
+
+    Message boundaries are found with ``mmap.find`` on the mapped file rather
+    than by iterating lines in Python; only one message is copied out at a
+    time. Anything before the first "From " line is yielded as its own chunk.
+    """
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Empty file: nothing to map.
+        return
+    with mapped:
+        # The mapping is scanned once, front to back: ask for aggressive
+        # readahead (and early reclaim) on multi-GB mailboxes.
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        start = 0
+        while True:
+            pos = mapped.find(_FROM_LINE, start)
+            if pos < 0:
+                break
+            yield mapped[start : pos + 1]
+            start = pos + 1
+        if start < len(mapped):
+            yield mapped[start:]
+
 
 class MboxProcessor(BaseFileProcessor):
     """Processor for MBOX mailbox files.
@@ -17,6 +52,9 @@ class MboxProcessor(BaseFileProcessor):
     Used by Thunderbird, Gmail exports, and other mail clients.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".mbox"})
+
     def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from MBOX mailbox file.
 
@@ -32,37 +70,13 @@ class MboxProcessor(BaseFileProcessor):
             FileNotFoundError: If file does not exist
         """
         with open(file_path, "rb") as f:
-            # MBOX format: emails separated by "From " lines
-            current_message: list[bytes] = []
-
-            for line in f:
-                # Check if this is a new message delimiter
-                if line.startswith(b"From "):
-                    # Process previous message if exists
-                    if current_message:
-                        try:
-                            msg_text = self._process_message(b"".join(current_message))
-                            if msg_text:
-                                yield msg_text
-                        except Exception as exc:
-                            # Skip messages that can't be parsed
-                            _logger.debug(
-                                "Skipping unparseable message in MBOX: %s: %s",
-                                file_path,
-                                exc,
-                            )
-                            skip_counters.record_skip("mbox_message_unparseable")
-                        current_message = []
-
-                current_message.append(line)
-
-            # Process last message
-            if current_message:
+            for message_bytes in _iter_messages(f):
                 try:
-                    msg_text = self._process_message(b"".join(current_message))
+                    msg_text = self._process_message(message_bytes)
                     if msg_text:
                         yield msg_text
                 except Exception as exc:
+                    # Skip messages that can't be parsed
                     _logger.debug(
                         "Skipping unparseable message in MBOX: %s: %s",
                         file_path,
@@ -94,52 +108,20 @@ class MboxProcessor(BaseFileProcessor):
             body_parts = []
 
             if msg.is_multipart():
-                for part in msg.walk():
-                    content_type = part.get_content_type()
-                    if content_type == "text/plain":
-                        payload = part.get_payload(decode=True)
-                        if isinstance(payload, bytes):
-                            try:
-                                charset = part.get_content_charset() or "utf-8"
-                                body_parts.append(
-                                    payload.decode(charset, errors="replace")
-                                )
-                            except Exception as exc:
-                                _logger.debug(
-                                    "Failed to decode text/plain part: %s", exc
-                                )
-                    elif content_type == "text/html":
-                        # Extract text from HTML (simple approach)
-                        payload = part.get_payload(decode=True)
-                        if isinstance(payload, bytes):
-                            try:
-                                charset = part.get_content_charset() or "utf-8"
-                                html_text = payload.decode(charset, errors="replace")
-                                # Simple HTML tag removal
-                                import re
-
-                                html_text = re.sub(r"<[^>]+>", "", html_text)
-                                body_parts.append(html_text)
-                            except Exception as exc:
-                                _logger.debug(
-                                    "Failed to decode text/html part: %s", exc
-                                )
+                for part in iter_text_parts(msg):
+                    if part.get_content_type() == "text/plain":
+                        body_parts.append(decode_text_part(part))
+                    else:
+                        body_parts.append(strip_html(decode_text_part(part)))
             else:
                 # Single part message
-                payload = msg.get_payload(decode=True)
-                if isinstance(payload, bytes):
-                    try:
-                        charset = msg.get_content_charset() or "utf-8"
-                        body_parts.append(payload.decode(charset, errors="replace"))
-                    except Exception as exc:
-                        _logger.debug(
-                            "Failed to decode single-part message body: %s", exc
-                        )
+                body_parts.append(decode_text_part(msg))
 
             # Combine headers and body
             result = "\n".join(headers)
-            if body_parts:
-                result += "\n\n" + "\n".join(body_parts)
+            body = "\n".join(filter(None, body_parts))
+            if body:
+                result += "\n\n" + body
 
             return result
         except Exception as exc:
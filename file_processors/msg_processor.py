@@ -1,6 +1,8 @@
 """MSG file processor using extract-msg library."""
 
 import re
+from collections.abc import Iterator
+from html import unescape
 
 from file_processors.base_processor import BaseFileProcessor
 
@@ -9,6 +11,49 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     extract_msg = None  # type: ignore[assignment]
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Message properties read for PII, in output order: the headers come before the
+# body, the sender/representing addresses after the attachments.
+_HEADER_PROPS = (
+    "from",
+    "to",
+    "cc",
+    "bcc",
+    "replyTo",
+    "subject",
+    "returnPath",
+    "sender",
+    "receivedRepresentingName",
+    "displayTo",
+    "displayCc",
+    "displayBcc",
+)
+_ADDRESS_PROPS = (
+    "senderEmail",
+    "senderEmailAddress",
+    "senderName",
+    "receivedRepresentingEmail",
+    "receivedRepresentingEmailAddress",
+    "sentRepresentingEmail",
+    "sentRepresentingEmailAddress",
+)
+
+
+def _iter_property_text(msg, names: tuple[str, ...]) -> Iterator[str]:
+    """Yield the non-empty values of the named message properties as strings.
+
+    A list-valued property (e.g. several recipients) yields each non-empty item.
+    """
+    for name in names:
+        value = getattr(msg, name, None)
+        if not value:
+            continue
+        if type(value) is list:
+            yield from map(str, filter(None, value))
+        else:
+            yield str(value)
+
 
 class MsgProcessor(BaseFileProcessor):
     """Processor for MSG (Microsoft Outlook Message) files.
@@ -18,7 +63,11 @@ class MsgProcessor(BaseFileProcessor):
     and attachment metadata for PII detection.
     """
 
-    def extract_text(self, file_path: str) -> str:
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".msg"})
+    COALESCE_CHUNKS = True
+
+    def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from an MSG file.
 
         Extracts:
@@ -29,8 +78,8 @@ class MsgProcessor(BaseFileProcessor):
         Args:
             file_path: Path to the MSG file
 
-        Returns:
-            Extracted text content from headers, body, and attachments
+        Yields:
+            Text of each header, body, attachment name and address property
 
         Raises:
             ImportError: If extract-msg is not installed
@@ -53,93 +102,14 @@ class MsgProcessor(BaseFileProcessor):
                     "Install it with: pip install extract-msg"
                 ) from e
 
-        text_parts: list[str] = []
-
         try:
             # Open MSG file
             msg = extract_msg.Message(file_path)
-
-            # Extract headers (these often contain PII)
-            headers_to_extract = [
-                "from",
-                "to",
-                "cc",
-                "bcc",
-                "replyTo",
-                "subject",
-                "returnPath",
-                "sender",
-                "receivedRepresentingName",
-                "displayTo",
-                "displayCc",
-                "displayBcc",
-            ]
-
-            for header_name in headers_to_extract:
-                header_value = getattr(msg, header_name, None)
-                if header_value:
-                    # Handle both string and list values
-                    if isinstance(header_value, list):
-                        text_parts.extend([str(v) for v in header_value if v])
-                    else:
-                        text_parts.append(str(header_value))
-
-            # Extract body content
-            # Try plain text first
-            if hasattr(msg, "body") and msg.body:
-                body_text = msg.body
-                if body_text.strip():
-                    text_parts.append(body_text.strip())
-
-            # Try HTML body if available
-            if hasattr(msg, "htmlBody") and msg.htmlBody:
-                # extract-msg returns the HTML body as raw bytes.
-                raw_html_body = msg.htmlBody
-                html_body = (
-                    raw_html_body.decode("utf-8", errors="replace")
-                    if isinstance(raw_html_body, bytes)
-                    else str(raw_html_body)
-                )
-                # Extract text from HTML (remove tags)
-                text = self._extract_text_from_html(html_body)
-                if text.strip():
-                    text_parts.append(text.strip())
-
-            # Extract attachment metadata (filenames may contain PII)
-            if hasattr(msg, "attachments") and msg.attachments:
-                for attachment in msg.attachments:
-                    # Extract attachment filename
-                    if hasattr(attachment, "longFilename") and attachment.longFilename:
-                        text_parts.append(attachment.longFilename)
-                    elif (
-                        hasattr(attachment, "shortFilename")
-                        and attachment.shortFilename
-                    ):
-                        text_parts.append(attachment.shortFilename)
-
-                    # Extract attachment display name if available
-                    if hasattr(attachment, "displayName") and attachment.displayName:
-                        text_parts.append(attachment.displayName)
-
-            # Extract other properties that might contain PII
-            # Email addresses from various properties
-            email_properties = [
-                "senderEmail",
-                "senderEmailAddress",
-                "senderName",
-                "receivedRepresentingEmail",
-                "receivedRepresentingEmailAddress",
-                "sentRepresentingEmail",
-                "sentRepresentingEmailAddress",
-            ]
-
-            for prop_name in email_properties:
-                prop_value = getattr(msg, prop_name, None)
-                if prop_value:
-                    text_parts.append(str(prop_value))
-
-            # Close the message file
-            msg.close()
+            try:
+                yield from self._iter_message_text(msg)
+            finally:
+                # Close the message file even if the caller stops early
+                msg.close()
 
         except FileNotFoundError:
             raise
@@ -151,13 +121,64 @@ class MsgProcessor(BaseFileProcessor):
             # Re-raise with context
             raise Exception(f"Error processing MSG file: {str(e)}") from e
 
-        return " ".join(text_parts)
+    def _iter_message_text(self, msg) -> Iterator[str]:
+        """Yield the PII-relevant text of an open MSG message, part by part.
+
+        Args:
+            msg: Open ``extract_msg`` message
+
+        Yields:
+            Text of each header, body, attachment name and address property
+        """
+        # Extract headers (these often contain PII)
+        yield from _iter_property_text(msg, _HEADER_PROPS)
+
+        # Extract body content
+        # Try plain text first
+        body_text = getattr(msg, "body", None)
+        if body_text:
+            body_text = body_text.strip()
+            if body_text:
+                yield body_text
+
+        # Try HTML body if available
+        raw_html_body = getattr(msg, "htmlBody", None)
+        if raw_html_body:
+            # extract-msg returns the HTML body as raw bytes.
+            html_body = (
+                raw_html_body.decode("utf-8", errors="replace")
+                if isinstance(raw_html_body, bytes)
+                else str(raw_html_body)
+            )
+            # Extract text from HTML (remove tags); whitespace is already collapsed
+            text = self._extract_text_from_html(html_body)
+            if text:
+                yield text
+
+        # Extract attachment metadata (filenames may contain PII)
+        for attachment in getattr(msg, "attachments", None) or ():
+            # Extract attachment filename
+            filename = getattr(attachment, "longFilename", None) or getattr(
+                attachment, "shortFilename", None
+            )
+            if filename:
+                yield filename
+
+            # Extract attachment display name if available
+            display_name = getattr(attachment, "displayName", None)
+            if display_name:
+                yield display_name
+
+        # Extract other properties that might contain PII
+        # Email addresses from various properties
+        yield from _iter_property_text(msg, _ADDRESS_PROPS)
 
     def _extract_text_from_html(self, html_content: str) -> str:
         """Extract plain text from HTML content.
 
         Removes HTML tags and extracts text content.
-        Uses simple regex approach for basic HTML tag removal.
+        Uses simple regex approach for basic HTML tag removal, followed by
+        entity decoding and whitespace collapse.
 
         Args:
             html_content: HTML content as string
@@ -168,25 +189,11 @@ class MsgProcessor(BaseFileProcessor):
         if not html_content:
             return ""
 
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", " ", html_content)
-
-        # Decode HTML entities (basic ones)
-        html_entities = {
-            "&nbsp;": " ",
-            "&amp;": "&",
-            "&lt;": "<",
-            "&gt;": ">",
-            "&quot;": '"',
-            "&apos;": "'",
-        }
-        for entity, char in html_entities.items():
-            text = text.replace(entity, char)
-
-        # Clean up whitespace
-        text = " ".join(text.split())
-
-        return text
+        # Remove HTML tags, then decode all named and numeric entities
+        text = unescape(_HTML_TAG_RE.sub(" ", html_content))
+
+        # Clean up whitespace (including the U+00A0 that &nbsp; decodes to)
+        return " ".join(text.split())
 
     @staticmethod
     def can_process(extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
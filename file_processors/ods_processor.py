@@ -1,7 +1,9 @@
 """ODS file processor using odfpy library."""
 
 import logging
+from collections.abc import Iterator
 
+from file_processors._odf_utils import element_text
 from file_processors.base_processor import BaseFileProcessor
 
 _logger = logging.getLogger(__name__)
@@ -24,7 +26,10 @@ class OdsProcessor(BaseFileProcessor):
     Similar structure to XLSX but uses OpenDocument format.
     """
 
-    def extract_text(self, file_path: str) -> str:
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".ods"})
+
+    def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from an ODS file.
 
         Extracts all cell values from all worksheets in the workbook.
@@ -32,8 +37,8 @@ class OdsProcessor(BaseFileProcessor):
         Args:
             file_path: Path to the ODS file
 
-        Returns:
-            Extracted text content from all cells as a string
+        Yields:
+            The text of each non-empty cell
 
         Raises:
             PermissionError: If file cannot be accessed
@@ -46,8 +51,6 @@ class OdsProcessor(BaseFileProcessor):
                 "Install it with: pip install odfpy"
             )
 
-        text_parts: list[str] = []
-
         try:
             doc = load(file_path)
 
@@ -55,9 +58,16 @@ class OdsProcessor(BaseFileProcessor):
             for table in doc.getElementsByType(Table):
                 for row in table.getElementsByType(TableRow):
                     for cell in row.getElementsByType(TableCell):
-                        cell_text = self._extract_text_from_element(cell)
-                        if cell_text and cell_text.strip():
-                            text_parts.append(cell_text.strip())
+                        # odfpy keeps a run of identical cells (or rows) as one
+                        # element carrying table:number-columns-repeated
+                        # (number-rows-repeated), so blank padding up to the
+                        # sheet's full size costs one iteration per run; the
+                        # repeated text itself only needs scanning once.
+                        if not cell.childNodes:
+                            continue
+                        cell_text = element_text(cell).strip()
+                        if cell_text:
+                            yield cell_text
 
         except FileNotFoundError:
             raise
@@ -67,37 +77,6 @@ class OdsProcessor(BaseFileProcessor):
             # Re-raise with context
             raise Exception(f"Error processing ODS file: {str(e)}") from e
 
-        return " ".join(text_parts)
-
-    def _extract_text_from_element(self, element) -> str:
-        """Recursively extract text from an ODS element.
-
-        Args:
-            element: ODS element to extract text from
-
-        Returns:
-            Extracted text content
-        """
-        text_parts: list[str] = []
-
-        # Get direct text content (for TextNode elements)
-        if hasattr(element, "data") and element.data:
-            text_parts.append(str(element.data))
-
-        # Recursively process child nodes
-        if hasattr(element, "childNodes"):
-            for child in element.childNodes:
-                # Text nodes have data attribute
-                if hasattr(child, "data") and child.data:
-                    text_parts.append(str(child.data))
-                # Element nodes have childNodes
-                elif hasattr(child, "childNodes"):
-                    child_text = self._extract_text_from_element(child)
-                    if child_text:
-                        text_parts.append(child_text)
-
-        return " ".join(text_parts)
-
     @staticmethod
     def can_process(extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
         """Check if this processor can handle ODS files."""
@@ -1,19 +1,46 @@
 """ODT file processor using odfpy library."""
 
+from collections.abc import Iterator
+from xml.dom import Node
+
+from file_processors._odf_utils import element_text
 from file_processors.base_processor import BaseFileProcessor
 
 try:
     from odf.opendocument import load
-    from odf.table import Table, TableCell, TableRow
+    from odf.table import TableCell
     from odf.text import H, P
 except Exception:  # pragma: no cover - optional dependency
     load = None
-    Table = None
     TableCell = None
-    TableRow = None
     H = None
     P = None
 
+_ELEMENT_NODE = Node.ELEMENT_NODE
+
+# Qualified names of the elements whose text is yielded as one unit.
+_TEXT_QNAMES: frozenset[tuple[str, str]] = (
+    frozenset(factory(check_grammar=False).qname for factory in (P, H, TableCell))
+    if load is not None
+    else frozenset()
+)
+
+
+def _iter_text_elements(element) -> Iterator:
+    """Yield the paragraphs, headings and table cells below *element*.
+
+    Elements come in document order. The walk does not descend into a
+    yielded element, so a paragraph inside a table cell is only read as
+    part of that cell.
+    """
+    for child in element.childNodes:
+        if child.nodeType != _ELEMENT_NODE:
+            continue
+        if child.qname in _TEXT_QNAMES:
+            yield child
+        elif child.childNodes:
+            yield from _iter_text_elements(child)
+
 
 class OdtProcessor(BaseFileProcessor):
     """Processor for ODT (OpenDocument Text) files.
@@ -23,14 +50,19 @@ class OdtProcessor(BaseFileProcessor):
     Similar structure to DOCX but uses OpenDocument format.
     """
 
-    def extract_text(self, file_path: str) -> str:
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".odt"})
+    COALESCE_CHUNKS = True
+
+    def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from an ODT file.
 
         Args:
             file_path: Path to the ODT file
 
-        Returns:
-            Extracted text content from paragraphs, headings, and tables
+        Yields:
+            The text of each non-empty paragraph, heading and table cell,
+            in document order
 
         Raises:
             PermissionError: If file cannot be accessed
@@ -43,30 +75,15 @@ class OdtProcessor(BaseFileProcessor):
                 "Install it with: pip install odfpy"
             )
 
-        text_parts: list[str] = []
-
         try:
             doc = load(file_path)
 
-            # Extract text from paragraphs and headings
-            for paragraph in doc.getElementsByType(P):
-                text = self._extract_text_from_element(paragraph)
-                if text and text.strip():
-                    text_parts.append(text.strip())
-
-            # Extract text from headings
-            for heading in doc.getElementsByType(H):
-                text = self._extract_text_from_element(heading)
-                if text and text.strip():
-                    text_parts.append(text.strip())
-
-            # Extract text from tables
-            for table in doc.getElementsByType(Table):
-                for row in table.getElementsByType(TableRow):
-                    for cell in row.getElementsByType(TableCell):
-                        cell_text = self._extract_text_from_element(cell)
-                        if cell_text and cell_text.strip():
-                            text_parts.append(cell_text.strip())
+            # One walk over the tree instead of a pass per element type
+            # plus nested Table/TableRow/TableCell searches.
+            for element in _iter_text_elements(doc.topnode):
+                text = element_text(element).strip()
+                if text:
+                    yield text
 
         except FileNotFoundError:
             raise
@@ -76,37 +93,6 @@ class OdtProcessor(BaseFileProcessor):
             # Re-raise with context for other errors
             raise Exception(f"Error processing ODT file: {str(e)}") from e
 
-        return " ".join(text_parts)
-
-    def _extract_text_from_element(self, element) -> str:
-        """Recursively extract text from an ODT element.
-
-        Args:
-            element: ODT element to extract text from
-
-        Returns:
-            Extracted text content
-        """
-        text_parts: list[str] = []
-
-        # Get direct text content (for TextNode elements)
-        if hasattr(element, "data") and element.data:
-            text_parts.append(str(element.data))
-
-        # Recursively process child nodes
-        if hasattr(element, "childNodes"):
-            for child in element.childNodes:
-                # Text nodes have data attribute
-                if hasattr(child, "data") and child.data:
-                    text_parts.append(str(child.data))
-                # Element nodes have childNodes
-                elif hasattr(child, "childNodes"):
-                    child_text = self._extract_text_from_element(child)
-                    if child_text:
-                        text_parts.append(child_text)
-
-        return " ".join(text_parts)
-
     @staticmethod
     def can_process(extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
         """Check if this processor can handle ODT files."""
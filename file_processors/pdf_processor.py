@@ -1,17 +1,32 @@
 """PDF file processor using pdfminer.six, with an optional OCR fallback."""
 
 import logging
+import multiprocessing
 import os
+import threading
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 from pdfminer.high_level import extract_pages
 from pdfminer.layout import LTTextContainer
+from pdfminer.pdfpage import PDFPage
 
 from core import constants
 from file_processors.base_processor import BaseFileProcessor
 
 _logger = logging.getLogger(__name__)
 
+try:
+    # Optional: PDFium extracts page text in native code, over an order of
+    # magnitude faster than pdfminer's pure-Python layout analysis.
+    import pypdfium2 as _pdfium
+except ImportError:  # pragma: no cover - depends on installed extras
+    _pdfium = None
+
+# PDFium is not thread-safe, and the scanner extracts several files at once.
+_PDFIUM_LOCK = threading.Lock()
+
 
 def _ocr_language() -> str:
     """Tesseract language string, overridable via the ``PBD_OCR_LANG`` env var."""
@@ -31,6 +46,44 @@ def _ocr_dpi() -> int:
     return constants.OCR_DPI
 
 
+def _pdf_backend() -> str:
+    """Text extraction backend, overridable via the ``PBD_PDF_BACKEND`` env var.
+
+    Returns ``"pdfium"`` only when it is selected and pypdfium2 is installed,
+    ``"pdfminer"`` otherwise.
+    """
+    backend = os.environ.get("PBD_PDF_BACKEND") or constants.PDF_BACKEND
+    backend = backend.strip().lower()
+    if backend == "pdfium":
+        if _pdfium is not None:
+            return "pdfium"
+        _logger.debug("PBD_PDF_BACKEND=pdfium but pypdfium2 is not installed")
+    elif backend != "pdfminer":
+        _logger.debug("Unknown PDF backend %r; using pdfminer", backend)
+    return "pdfminer"
+
+
+def _pdf_workers() -> int:
+    """Worker processes per PDF, overridable via the ``PBD_PDF_WORKERS`` env var.
+
+    A value of 0 (or less) means one worker per CPU.
+    """
+    workers = constants.PDF_WORKERS
+    raw = os.environ.get("PBD_PDF_WORKERS")
+    if raw:
+        try:
+            workers = int(raw)
+        except ValueError:
+            _logger.debug(
+                "Invalid PBD_PDF_WORKERS=%r; using default %d",
+                raw,
+                constants.PDF_WORKERS,
+            )
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
 def _ocr_available() -> bool:
     """Return True when the optional OCR stack (pdf2image + pytesseract) is importable.
 
@@ -79,6 +132,106 @@ def _ocr_page(file_path: str, page_number: int) -> str:
         return ""
 
 
+def _page_count(file_path: str) -> int:
+    """Number of pages in a PDF, read from its page tree without any layout work."""
+    with open(file_path, "rb") as fp:
+        return sum(1 for _ in PDFPage.get_pages(fp))
+
+
+def _iter_page_texts(
+    file_path: str, start: int = 0, stop: int | None = None
+) -> Iterator[str]:
+    """Yield the text of the pages ``start`` to ``stop`` (0-based, exclusive).
+
+    Pages without meaningful text are OCR'd when the OCR stack is installed and
+    skipped otherwise (see ``PdfProcessor._finalize_page``).
+    """
+    ocr_enabled = _ocr_available()
+    page_layouts = extract_pages(
+        file_path,
+        page_numbers=range(start, stop) if stop is not None else None,
+        maxpages=stop or 0,
+    )
+    for page_number, page_layout in enumerate(page_layouts, start=start + 1):
+        page_parts = [
+            element.get_text()
+            for element in page_layout
+            if isinstance(element, LTTextContainer)
+        ]
+        page_text = PdfProcessor._finalize_page(
+            "".join(page_parts),
+            (lambda: _ocr_page(file_path, page_number)) if ocr_enabled else None,
+        )
+        if page_text:
+            yield page_text
+
+
+def _iter_pdfium_page_texts(file_path: str) -> Iterator[str]:
+    """Yield the text of each page, extracted by PDFium.
+
+    Pages are finalized like pdfminer's (see ``PdfProcessor._finalize_page``).
+    The lock is held per page, not across yields, so concurrent scans of other
+    PDFs interleave page by page.
+    """
+    ocr_enabled = _ocr_available()
+    with _PDFIUM_LOCK:
+        pdf = _pdfium.PdfDocument(file_path)
+    try:
+        with _PDFIUM_LOCK:
+            page_count = len(pdf)
+        for index in range(page_count):
+            with _PDFIUM_LOCK:
+                page = pdf[index]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                finally:
+                    page.close()
+            page_number = index + 1
+            page_text = PdfProcessor._finalize_page(
+                # PDFium ends lines with CRLF; match pdfminer's "\n"
+                text.replace("\r\n", "\n"),
+                (lambda: _ocr_page(file_path, page_number)) if ocr_enabled else None,
+            )
+            if page_text:
+                yield page_text
+    finally:
+        with _PDFIUM_LOCK:
+            pdf.close()
+
+
+def _page_range_texts(file_path: str, start: int, stop: int) -> list[str]:
+    """Worker entry point: the page texts of one page range, as a picklable list."""
+    return list(_iter_page_texts(file_path, start, stop))
+
+
+def _iter_page_texts_parallel(
+    file_path: str, page_count: int, workers: int
+) -> Iterator[str]:
+    """Yield page texts in page order, laying the pages out in worker processes.
+
+    The pages are split into a few contiguous ranges per worker so that uneven
+    pages balance out; every range re-opens the document in its worker.
+    """
+    workers = min(workers, page_count)
+    step = -(-page_count // (workers * 4))
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+    # spawn rather than fork: the scanner calls this from one of its threads.
+    pool = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        for texts in pool.map(_page_range_texts, repeat(file_path), starts, stops):
+            yield from texts
+    finally:
+        # Drop the remaining ranges when the caller stops early (per-file timeout)
+        pool.shutdown(cancel_futures=True)
+
+
 class PdfProcessor(BaseFileProcessor):
     """Processor for PDF files.
 
@@ -89,9 +242,19 @@ class PdfProcessor(BaseFileProcessor):
     page is OCR'd as a fallback so scanned PDFs are no longer silently empty.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".pdf"})
+    COALESCE_CHUNKS = True
+
     def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from a PDF file page by page.
 
+        With ``PBD_PDF_BACKEND=pdfium`` and pypdfium2 installed, PDFium extracts
+        the text. Otherwise pdfminer does, and with more than one worker
+        configured (``PBD_PDF_WORKERS``), PDFs of at least
+        ``PDF_PARALLEL_MIN_PAGES`` pages are laid out in worker processes; pages
+        are still yielded in order.
+
         Args:
             file_path: Path to the PDF file
 
@@ -103,19 +266,16 @@ class PdfProcessor(BaseFileProcessor):
             FileNotFoundError: If file does not exist
             Exception: For other PDF processing errors
         """
-        ocr_enabled = _ocr_available()
-        for page_number, page_layout in enumerate(extract_pages(file_path), start=1):
-            page_parts = [
-                element.get_text()
-                for element in page_layout
-                if isinstance(element, LTTextContainer)
-            ]
-            page_text = self._finalize_page(
-                "".join(page_parts),
-                (lambda: _ocr_page(file_path, page_number)) if ocr_enabled else None,
-            )
-            if page_text:
-                yield page_text
+        if _pdf_backend() == "pdfium":
+            yield from _iter_pdfium_page_texts(file_path)
+            return
+        workers = _pdf_workers()
+        if workers > 1:
+            page_count = _page_count(file_path)
+            if page_count >= constants.PDF_PARALLEL_MIN_PAGES:
+                yield from _iter_page_texts_parallel(file_path, page_count, workers)
+                return
+        yield from _iter_page_texts(file_path)
 
     @staticmethod
     def _finalize_page(page_text: str, ocr_callable) -> str:
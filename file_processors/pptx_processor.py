@@ -1,6 +1,7 @@
 """PPTX file processor using python-pptx library."""
 
 import struct
+from collections.abc import Iterator
 
 from file_processors.base_processor import BaseFileProcessor
 
@@ -26,7 +27,11 @@ class PptxProcessor(BaseFileProcessor):
     Extracts text from slides, notes, and comments for PII detection.
     """
 
-    def extract_text(self, file_path: str) -> str:
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".pptx"})
+    COALESCE_CHUNKS = True
+
+    def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from a PPTX file.
 
         Extracts text from:
@@ -37,8 +42,8 @@ class PptxProcessor(BaseFileProcessor):
         Args:
             file_path: Path to the PPTX file
 
-        Returns:
-            Extracted text content from slides, notes, and comments as a string
+        Yields:
+            The text of each shape on the slides and notes pages
 
         Raises:
             ImportError: If python-pptx is not installed
@@ -52,8 +57,6 @@ class PptxProcessor(BaseFileProcessor):
                 "Install it with: pip install python-pptx"
             )
 
-        text_parts: list[str] = []
-
         try:
             # Load presentation
             try:
@@ -70,7 +73,7 @@ class PptxProcessor(BaseFileProcessor):
                 for shape in slide.shapes:
                     shape_text = self._extract_text_from_shape(shape)
                     if shape_text:
-                        text_parts.append(shape_text)
+                        yield shape_text
 
                 # Extract text from notes slide
                 if slide.has_notes_slide:
@@ -78,7 +81,7 @@ class PptxProcessor(BaseFileProcessor):
                     for shape in notes_slide.shapes:
                         shape_text = self._extract_text_from_shape(shape)
                         if shape_text:
-                            text_parts.append(shape_text)
+                            yield shape_text
 
             # Extract text from comments (if available)
             # Note: Comments might not be accessible in all PPTX files
@@ -96,8 +99,6 @@ class PptxProcessor(BaseFileProcessor):
                 raise FileNotFoundError(str(e)) from e
             raise Exception(f"Error processing PPTX file: {str(e)}") from e
 
-        return " ".join(text_parts)
-
     def _extract_text_from_shape(self, shape) -> str:
         """Extract text from a PowerPoint shape.
 
@@ -114,25 +115,20 @@ class PptxProcessor(BaseFileProcessor):
         """
         text_parts: list[str] = []
 
-        # Check if shape has text frame
-        if hasattr(shape, "text_frame") and shape.text_frame:
-            for paragraph in shape.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    if run.text and run.text.strip():
-                        text_parts.append(run.text.strip())
+        # Text boxes and auto shapes: text_frame.text joins the runs of each
+        # paragraph (shape.text is the same string, so it is not read again)
+        if shape.has_text_frame:
+            text = shape.text_frame.text.strip()
+            if text:
+                text_parts.append(text)
 
-        # Check if shape is a table
-        if hasattr(shape, "table") and shape.table:
+        # Tables (graphic frames; .table raises for charts and other frames)
+        if shape.has_table:
             for row in shape.table.rows:
                 for cell in row.cells:
-                    cell_text = cell.text
-                    if cell_text and cell_text.strip():
-                        text_parts.append(cell_text.strip())
-
-        # Also check if shape has direct text attribute
-        if hasattr(shape, "text") and shape.text:
-            if shape.text.strip():
-                text_parts.append(shape.text.strip())
+                    cell_text = cell.text.strip()
+                    if cell_text:
+                        text_parts.append(cell_text)
 
         return " ".join(text_parts)
 
@@ -199,6 +195,9 @@ class PptProcessor(BaseFileProcessor):
     runs are extracted, which is sufficient for PII detection.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".ppt"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from a legacy PPT file.
 
@@ -1,9 +1,70 @@
 """Properties and INI file processor for extracting configuration data."""
 
-import configparser
+import re
 
 from file_processors.base_processor import BaseFileProcessor
 
+# First character of the first line that is neither blank nor an INI comment.
+_FIRST_ENTRY_RE = re.compile(r"^\s*([^\s#;])", re.MULTILINE)
+
+
+def _starts_with_section(content: str) -> bool:
+    """Return True if the first line that is not blank or a comment is a section header."""
+    match = _FIRST_ENTRY_RE.search(content)
+    return match is not None and match.group(1) == "["
+
+
+# One INI entry per match: a [section] header, or a key (up to the first "=" or
+# ":") with its value and any indented continuation lines.
+_INI_ENTRY_RE = re.compile(
+    r"^[ \t]*(?:\[(.+)\]|([^\s=:#;\[][^=:\n]*)[=:](.*(?:\n[ \t]+\S.*)*))",
+    re.MULTILINE,
+)
+
+
+def _extract_ini(content: str) -> str:
+    """Return the section headers and ``key = value`` lines of an INI file.
+
+    Follows configparser's defaults for the parts that matter here: keys are
+    lower-cased, ``#`` and ``;`` start comment lines and indented lines
+    continue the previous value. Unlike configparser, values are returned raw
+    (no ``%(name)s`` interpolation or [DEFAULT] merging), duplicate sections
+    and keys are kept, and lines without a separator are skipped instead of
+    rejecting the whole file.
+    """
+    lines = []
+    for section, key, value in _INI_ENTRY_RE.findall(content):
+        if not key:
+            lines.append(f"[{section}]")
+            continue
+        if "\n" in value:
+            value = "\n".join(part.strip() for part in value.split("\n"))
+        else:
+            value = value.strip()
+        lines.append(f"{key.strip().lower()} = {value}")
+    return "\n".join(lines)
+
+
+def _extract_properties(content: str) -> str:
+    """Return the ``key = value`` lines of a Java properties style file.
+
+    As in Java, the key ends at the first ``=`` or ``:``; lines starting with
+    ``#`` or ``!`` are comments.
+    """
+    lines = []
+    for line in content.split("\n"):
+        line = line.strip()
+        # Skip comments and empty lines
+        if not line or line[0] in "#!":
+            continue
+        key, sep, value = line.partition("=")
+        if not sep or ":" in key:
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+        lines.append(f"{key.strip()} = {value.strip()}")
+    return "\n".join(lines)
+
 
 class PropertiesProcessor(BaseFileProcessor):
     """Processor for Java properties files and INI configuration files.
@@ -12,6 +73,9 @@ class PropertiesProcessor(BaseFileProcessor):
     These files often contain credentials, API keys, and sensitive configuration.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".properties", ".ini", ".cfg", ".conf", ".env"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from properties or INI file.
 
@@ -29,36 +93,13 @@ class PropertiesProcessor(BaseFileProcessor):
         with open(file_path, encoding="utf-8", errors="replace") as f:
             content = f.read()
 
-        # Try to parse as INI first (more structured)
-        try:
-            config = configparser.ConfigParser()
-            config.read_string(content)
-
-            # Extract all key-value pairs
-            lines = []
-            for section in config.sections():
-                lines.append(f"[{section}]")
-                for key, value in config.items(section):
-                    lines.append(f"{key} = {value}")
-
-            return "\n".join(lines)
-        except (configparser.Error, AttributeError):
-            # Fall back to simple properties format (key=value)
-            # Properties files are simpler - just key=value pairs
-            lines = []
-            for line in content.split("\n"):
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith("#") and not line.startswith("!"):
-                    # Handle key=value or key:value
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        lines.append(f"{key.strip()} = {value.strip()}")
-                    elif ":" in line:
-                        key, value = line.split(":", 1)
-                        lines.append(f"{key.strip()} = {value.strip()}")
-
-            return "\n".join(lines)
+        # Only files whose first entry is a [section] header are INI; plain
+        # properties/.env files use the Java-style line scan.
+        if _starts_with_section(content):
+            return _extract_ini(content)
+
+        # Simple properties format (key=value or key:value)
+        return _extract_properties(content)
 
     @staticmethod
     def can_process(extension: str, file_path: str = "", mime_type: str = "") -> bool:
@@ -72,8 +113,7 @@ class PropertiesProcessor(BaseFileProcessor):
         Returns:
             True if file is a properties or INI file, False otherwise
         """
-        ext_lower = extension.lower()
-        if ext_lower in [".properties", ".ini", ".cfg", ".conf", ".env"]:
+        if extension.lower() in PropertiesProcessor.SUPPORTED_EXTENSIONS:
             return True
 
         if mime_type:
@@ -12,22 +12,38 @@ extension (e.g. both a generic text processor and a specialised markdown process
 handle ``.md``), the first registered processor wins.  Specialised processors should
 therefore be registered before generic fallbacks.
 
+Lazy processors
+---------------
+Processors whose modules pull in heavy third-party libraries (pdfminer,
+python-docx, python-pptx, extract-msg, odfpy, ...) are registered as
+``LazyFileProcessor`` stand-ins that declare their extensions up front and only
+import the real module the first time a matching file is extracted. A scan of
+plain-text files then never pays for importing the office stack.
+
 Extension caching
 -----------------
-``get_processor`` caches extension → processor mappings after the first lookup.
-The cache is keyed on extension only (MIME type lookups bypass the cache) so that
-magic-number-detected files are always re-dispatched to the full processor list.
-The cache is cleared whenever a new processor is registered.
+``get_processor`` caches extension → processor mappings. Registration seeds the
+cache with every extension a processor declares in ``SUPPORTED_EXTENSIONS`` (the
+first registered processor wins, as in the dispatch loop), so the common lookup
+is a single dict hit; other extensions are cached after their first lookup.
+The cache is keyed on the extension and the detected MIME type, so scans with
+magic-number detection also resolve each (extension, MIME type) pair once; the
+built-in processors only sniff file contents when no MIME type was detected.
+Misses are cached too (as ``None``), but a miss without a MIME type only for
+lookups without a file path: content-sniffing processors may still claim an
+unknown extension from the file itself. Processors whose ``can_process`` takes a
+file path but no MIME type are never cached. The cache is rebuilt whenever a new
+processor is registered.
 
 Isolation for tests and API/server use
 ---------------------------------------
-``_processors``/``_extension_cache``/``_can_process_meta`` are shared, process-wide
+``_processors``/``_extension_cache`` are shared, process-wide
 state populated once at import time (see ``file_processors/__init__.py``). Calling
 ``register()`` or ``clear()`` directly in a test mutates that shared state for
 every test that runs afterwards in the same process unless the caller manually
 saves and restores it. Use ``FileProcessorRegistry.isolated()`` to scope such
-mutations to a ``with`` block instead; the previous processor list, cache, and
-signature-metadata table are restored on exit even if the block raises.
+mutations to a ``with`` block instead; the previous processor list and cache are
+restored on exit even if the block raises.
 
 Use ``FileProcessorRegistry.snapshot()`` to obtain an independent, read-only view
 of the processors registered at a point in time — useful for a long-lived
@@ -37,31 +53,86 @@ from whatever the global registry looks like by the time the request is served.
 
 from __future__ import annotations
 
+import importlib
+import inspect
 import logging
-from collections.abc import Iterator
+import threading
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
-from dataclasses import dataclass
+from typing import Any
 
 from file_processors.base_processor import BaseFileProcessor
 
 _logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
-class _CanProcessMeta:
-    """Cached metadata about a processor's `can_process` signature.
+# ``can_process`` adapted to always take (extension, file_path, mime_type).
+_CanProcess = Callable[[str, str, str], bool]
 
-    Avoids calling `inspect.signature` in the per-file hot path.
-    """
+# A registered processor with the number of positional arguments (1-3) its
+# ``can_process`` accepts and an adapter passing exactly that many. Both are
+# computed once at registration so the per-file dispatch loop neither calls
+# ``inspect.signature`` nor branches on the signature.
+_Entry = tuple[BaseFileProcessor, int, _CanProcess]
 
-    positional_param_count: int
+# Resolved processors (or ``None`` for a miss), keyed by lower-case extension
+# and detected MIME type ("" when there is none).
+_ExtensionCache = dict[tuple[str, str], BaseFileProcessor | None]
 
 
-def _compute_can_process_meta(processor: BaseFileProcessor) -> _CanProcessMeta:
-    """Compute `can_process` signature metadata once per processor."""
-    try:
-        import inspect
+class LazyFileProcessor(BaseFileProcessor):
+    """Registry entry that imports its processor module on first use.
 
+    Only suitable for processors whose ``can_process`` is a pure extension check,
+    since it answers ``can_process`` from *extensions* without importing anything.
+    ``extract_text`` and every other attribute are forwarded to the real
+    processor, which is imported and instantiated once.
+    """
+
+    def __init__(self, module: str, class_name: str, extensions: tuple[str, ...]):
+        self._module = module
+        self._class_name = class_name
+        self.SUPPORTED_EXTENSIONS = frozenset(extensions)
+        self._processor: BaseFileProcessor | None = None
+        self._load_lock = threading.Lock()
+
+    def can_process(self, extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
+        return extension.lower() in self.SUPPORTED_EXTENSIONS
+
+    def load(self) -> BaseFileProcessor:
+        """Import and instantiate the real processor (once)."""
+        processor = self._processor
+        if processor is None:
+            with self._load_lock:
+                if self._processor is None:
+                    module = importlib.import_module(self._module)
+                    self._processor = getattr(module, self._class_name)()
+                processor = self._processor
+        return processor
+
+    def extract_text(self, file_path: str) -> str | Iterator[str]:
+        return self.load().extract_text(file_path)
+
+    @property
+    def COALESCE_CHUNKS(self) -> bool:  # type: ignore[override]
+        # Defined on BaseFileProcessor, so __getattr__ would never forward it
+        return self.load().COALESCE_CHUNKS
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined here. Private names are not
+        # forwarded, so copy/pickle probing (which may run before __init__)
+        # neither recurses nor triggers an import.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazyFileProcessor {self._module}.{self._class_name}>"
+
+
+def _can_process_arity(processor: BaseFileProcessor) -> int:
+    """Count the positional parameters of `can_process`, clamped to [1..3]."""
+    try:
         sig = inspect.signature(processor.can_process)
         # Count positional params; clamp to [1..3].
         positional = [
@@ -79,20 +150,50 @@ def _compute_can_process_meta(processor: BaseFileProcessor) -> _CanProcessMeta:
             for p in sig.parameters.values()
         ):
             count = 3
-        count = max(1, min(3, count))
-        return _CanProcessMeta(positional_param_count=count)
+        return max(1, min(3, count))
     except Exception as exc:
         # Conservative: assume the most flexible signature.
         _logger.debug(
             "Could not inspect can_process signature for %r: %s", processor, exc
         )
-        return _CanProcessMeta(positional_param_count=3)
+        return 3
+
+
+def _make_entry(processor: BaseFileProcessor) -> _Entry:
+    """Pair *processor* with its ``can_process`` arity and call adapter."""
+    arity = _can_process_arity(processor)
+    can_process: Callable[..., bool] = processor.can_process
+    if arity >= 3:
+        # Already the right shape; no extra call frame.
+        return processor, arity, can_process
+    if arity == 2:
+
+        def adapter(extension: str, file_path: str, mime_type: str) -> bool:
+            return can_process(extension, file_path)
+
+    else:
+
+        def adapter(extension: str, file_path: str, mime_type: str) -> bool:
+            return can_process(extension)
+
+    return processor, arity, adapter
+
+
+_NOT_CACHED = object()
+
+
+def _extension_index(processors: list[_Entry]) -> _ExtensionCache:
+    """Map each declared extension to the first processor declaring it."""
+    index: _ExtensionCache = {}
+    for processor, _, _ in processors:
+        for extension in processor.SUPPORTED_EXTENSIONS:
+            index.setdefault((extension, ""), processor)
+    return index
 
 
 def _find_processor(
-    processors: list[BaseFileProcessor],
-    can_process_meta: dict[BaseFileProcessor, _CanProcessMeta],
-    extension_cache: dict[str, BaseFileProcessor],
+    processors: list[_Entry],
+    extension_cache: _ExtensionCache,
     extension: str,
     file_path: str,
     mime_type: str,
@@ -101,41 +202,53 @@ def _find_processor(
 
     Shared by ``FileProcessorRegistry.get_processor`` and
     ``FileProcessorRegistrySnapshot.get_processor`` so both use identical
-    dispatch/caching logic, differing only in which processor list, metadata
-    table, and cache they read and write. *extension_cache* and
-    *can_process_meta* are mutated in place (cache-fill), which is safe because
-    each caller passes its own independent dict.
+    dispatch/caching logic, differing only in which processor list and cache
+    they read and write. *extension_cache* is mutated in place (cache-fill),
+    which is safe because each caller passes its own independent dict.
     """
-    # Check cache first (only for processors that don't need file_path or mime_type)
-    if extension and extension in extension_cache and not mime_type:
-        return extension_cache[extension]
-
-    # Check each processor
-    for processor in processors:
-        meta = can_process_meta.get(processor)
-        if meta is None:
-            meta = _compute_can_process_meta(processor)
-            can_process_meta[processor] = meta
-
+    # Processors compare lower-case extensions; normalising once here also
+    # keeps ".PDF" and ".pdf" on one cache entry.
+    extension = extension.lower()
+
+    # Without either there is nothing to key on; the processors can only go
+    # by the file itself.
+    cacheable = bool(extension or mime_type)
+    key = (extension, mime_type)
+    if cacheable:
+        cached = extension_cache.get(key, _NOT_CACHED)
+        # A cached miss only holds when the file would not be sniffed: there is
+        # no file_path, or a MIME type was detected (the built-in processors
+        # then decide from it without opening the file). See below for which
+        # misses are stored.
+        if cached is not _NOT_CACHED and (
+            cached is not None or not file_path or mime_type
+        ):
+            return cached  # type: ignore[return-value]
+
+    # Set when a processor was asked with only extension and file_path, whose
+    # answer may depend on the file.
+    path_dependent = False
+    for processor, arity, can_process in processors:
+        if arity == 2 and file_path:
+            path_dependent = True
         try:
-            if meta.positional_param_count >= 3:
-                if processor.can_process(extension, file_path, mime_type):
-                    # Safe to cache only when MIME type is not involved.
-                    if extension and not mime_type:
-                        extension_cache[extension] = processor
-                    return processor
-            elif meta.positional_param_count == 2:
-                if processor.can_process(extension, file_path):
-                    # Don't cache: may depend on file_path.
-                    return processor
-            else:
-                if processor.can_process(extension):
-                    if extension and not mime_type:
-                        extension_cache[extension] = processor
-                    return processor
+            matched = can_process(extension, file_path, mime_type)
         except (TypeError, ValueError):
             continue
-
+        if matched:
+            # Don't cache a two-argument match: it may depend on file_path.
+            if cacheable and arity != 2:
+                extension_cache[key] = processor
+            return processor
+
+    if mime_type:
+        # Stored only when every processor was asked with the file path (or
+        # could not have used it), so the miss also holds for other files.
+        cache_miss = bool(file_path) and not path_dependent
+    else:
+        cache_miss = bool(extension) and not file_path
+    if cache_miss:
+        extension_cache[key] = None
     return None
 
 
@@ -148,14 +261,9 @@ class FileProcessorRegistrySnapshot:
     against the snapshot never populate (or read) the global registry's cache.
     """
 
-    def __init__(
-        self,
-        processors: list[BaseFileProcessor],
-        can_process_meta: dict[BaseFileProcessor, _CanProcessMeta],
-    ):
+    def __init__(self, processors: list[_Entry]):
         self._processors = list(processors)
-        self._can_process_meta = dict(can_process_meta)
-        self._extension_cache: dict[str, BaseFileProcessor] = {}
+        self._extension_cache = _extension_index(self._processors)
 
     def get_processor(
         self, extension: str, file_path: str = "", mime_type: str = ""
@@ -163,7 +271,6 @@ class FileProcessorRegistrySnapshot:
         """Get the appropriate processor for a file extension from this snapshot."""
         return _find_processor(
             self._processors,
-            self._can_process_meta,
             self._extension_cache,
             extension,
             file_path,
@@ -172,7 +279,7 @@ class FileProcessorRegistrySnapshot:
 
     def get_all_processors(self) -> list[BaseFileProcessor]:
         """Get all processors captured in this snapshot."""
-        return list(self._processors)
+        return [processor for processor, _, _ in self._processors]
 
 
 class FileProcessorRegistry:
@@ -189,10 +296,9 @@ class FileProcessorRegistry:
     extension (which happens at most once per extension in practice).
     """
 
-    _processors: list[BaseFileProcessor] = []
-    _extension_cache: dict[str, BaseFileProcessor] = {}
+    _processors: list[_Entry] = []
+    _extension_cache: _ExtensionCache = {}
     _initialized: bool = False
-    _can_process_meta: dict[BaseFileProcessor, _CanProcessMeta] = {}
 
     @classmethod
     def register(cls, processor: BaseFileProcessor) -> None:
@@ -201,11 +307,10 @@ class FileProcessorRegistry:
         Args:
             processor: Processor instance to register
         """
-        if processor not in cls._processors:
-            cls._processors.append(processor)
-            # Clear cache when new processor is registered
-            cls._extension_cache.clear()
-            cls._can_process_meta[processor] = cls._compute_can_process_meta(processor)
+        if all(registered != processor for registered, _, _ in cls._processors):
+            cls._processors.append(_make_entry(processor))
+            # Drop cached lookups and re-seed the declared extensions
+            cls._extension_cache = _extension_index(cls._processors)
 
     @classmethod
     def register_class(cls, processor_class: type[BaseFileProcessor]) -> None:
@@ -217,11 +322,6 @@ class FileProcessorRegistry:
         processor = processor_class()
         cls.register(processor)
 
-    @staticmethod
-    def _compute_can_process_meta(processor: BaseFileProcessor) -> _CanProcessMeta:
-        """Compute `can_process` signature metadata once per processor."""
-        return _compute_can_process_meta(processor)
-
     @classmethod
     def get_processor(
         cls, extension: str, file_path: str = "", mime_type: str = ""
@@ -238,7 +338,6 @@ class FileProcessorRegistry:
         """
         return _find_processor(
             cls._processors,
-            cls._can_process_meta,
             cls._extension_cache,
             extension,
             file_path,
@@ -252,7 +351,7 @@ class FileProcessorRegistry:
         Returns:
             List of all registered processor instances
         """
-        return cls._processors.copy()
+        return [processor for processor, _, _ in cls._processors]
 
     @classmethod
     def clear(cls) -> None:
@@ -260,7 +359,6 @@ class FileProcessorRegistry:
         cls._processors.clear()
         cls._extension_cache.clear()
         cls._initialized = False
-        cls._can_process_meta.clear()
 
     @classmethod
     def snapshot(cls) -> FileProcessorRegistrySnapshot:
@@ -270,16 +368,16 @@ class FileProcessorRegistry:
             A ``FileProcessorRegistrySnapshot`` unaffected by later ``register()``
             or ``clear()`` calls against the global registry.
         """
-        return FileProcessorRegistrySnapshot(cls._processors, cls._can_process_meta)
+        return FileProcessorRegistrySnapshot(cls._processors)
 
     @classmethod
     @contextmanager
     def isolated(cls) -> Iterator[type[FileProcessorRegistry]]:
         """Scope registry mutations to this ``with`` block.
 
-        Saves the current processor list, extension cache, and signature-metadata
-        table; lets the block ``register()``/``clear()`` freely via the normal
-        ``FileProcessorRegistry`` API; and restores all three on exit — including
+        Saves the current processor list and extension cache; lets the block
+        ``register()``/``clear()`` freely via the normal ``FileProcessorRegistry``
+        API; and restores both on exit — including
         when the block raises. Intended for tests that need a fake processor or a
         cleared registry without leaking that state into tests that run afterwards
         in the same process.
@@ -291,17 +389,14 @@ class FileProcessorRegistry:
         """
         previous_processors = cls._processors
         previous_cache = cls._extension_cache
-        previous_meta = cls._can_process_meta
         previous_initialized = cls._initialized
         cls._processors = list(previous_processors)
         cls._extension_cache = dict(previous_cache)
-        cls._can_process_meta = dict(previous_meta)
         try:
             yield cls
         finally:
             cls._processors = previous_processors
             cls._extension_cache = previous_cache
-            cls._can_process_meta = previous_meta
             cls._initialized = previous_initialized
 
     @classmethod
@@ -311,36 +406,8 @@ class FileProcessorRegistry:
         Returns:
             List of supported extensions (e.g., ['.pdf', '.docx', ...])
         """
-        extensions = []
-        for processor in cls._processors:
-            # Try to determine supported extensions from processor
-            # This is a heuristic - processors should ideally expose this
-            if hasattr(processor, "can_process"):
-                # Test common extensions
-                common_extensions = [
-                    ".pdf",
-                    ".docx",
-                    ".html",
-                    ".htm",
-                    ".txt",
-                    ".csv",
-                    ".json",
-                    ".rtf",
-                    ".odt",
-                    ".xlsx",
-                    ".xls",
-                    ".xml",
-                    ".pptx",
-                    ".ppt",
-                    ".eml",
-                    ".msg",
-                    ".ods",
-                    ".yaml",
-                    ".yml",
-                    ".md",
-                ]
-                for ext in common_extensions:
-                    if processor.can_process(ext):
-                        if ext not in extensions:
-                            extensions.append(ext)
-        return sorted(extensions)
+        return sorted(
+            set().union(
+                *(processor.SUPPORTED_EXTENSIONS for processor, _, _ in cls._processors)
+            )
+        )
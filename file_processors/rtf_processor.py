@@ -16,6 +16,9 @@ class RtfProcessor(BaseFileProcessor):
     Removes all RTF formatting codes and extracts plain text content.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".rtf"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from an RTF file.
 
@@ -17,6 +17,9 @@ class SqliteProcessor(BaseFileProcessor):
     Handles text columns and optionally BLOB fields.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".sqlite", ".sqlite3", ".db"})
+
     def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from SQLite database.
 
@@ -158,7 +161,7 @@ class SqliteProcessor(BaseFileProcessor):
         Returns:
             True if file is a SQLite database, False otherwise
         """
-        if extension.lower() in [".sqlite", ".sqlite3", ".db"]:
+        if extension.lower() in SqliteProcessor.SUPPORTED_EXTENSIONS:
             return True
 
         if mime_type:
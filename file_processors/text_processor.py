@@ -12,6 +12,9 @@ class TextProcessor(BaseFileProcessor):
     that have mime type "text/plain".
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".txt"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from a plain text file.
 
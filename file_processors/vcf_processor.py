@@ -14,6 +14,9 @@ class VcfProcessor(BaseFileProcessor):
     vCard files have high PII density (names, phones, emails, addresses).
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".vcf"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from vCard file.
 
@@ -1,12 +1,30 @@
 """XLSX/XLS file processor using openpyxl and xlrd libraries."""
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from itertools import chain
 
 from file_processors.base_processor import BaseFileProcessor
 
 
-def _format_sheet_rows(rows: Iterable[Iterable[object]]) -> list[str]:
-    """Turn raw sheet rows into context-preserving text lines.
+def _iter_sheet_rows(rows: Iterable[Iterable[object]]) -> Iterator[str]:
+    """Turn raw sheet rows into context-preserving text lines, one row at a time.
+
+    Cells are converted with ``str()`` (``None`` becomes empty) and stripped, then
+    formatted by :func:`_iter_text_rows`.
+
+    Args:
+        rows: Iterable of rows; each row is an iterable of cell values (may be None).
+
+    Yields:
+        Text lines (one per non-empty row), header first when detected.
+    """
+    return _iter_text_rows(
+        ["" if v is None else str(v).strip() for v in row] for row in rows
+    )
+
+
+def _iter_text_rows(rows: Iterable[list[str]]) -> Iterator[str]:
+    """Format rows of already stripped string cells as text lines.
 
     The first row is treated as a header when it has at least two non-empty cells
     and the sheet has more than one row.  Each subsequent data cell is then emitted
@@ -15,46 +33,45 @@ def _format_sheet_rows(rows: Iterable[Iterable[object]]) -> list[str]:
     being flattened into an undifferentiated bag of words.  One line per row preserves
     record boundaries so entities from different records do not fuse.
 
+    Only one row of lookahead is held (to decide whether the first row is a
+    header), so arbitrarily long sheets stream in constant memory.
+
     Args:
-        rows: Iterable of rows; each row is an iterable of cell values (may be None).
+        rows: Iterable of rows; each row is a list of stripped cell strings.
 
-    Returns:
-        List of text lines (one per non-empty row), header first when detected.
+    Yields:
+        Text lines (one per non-empty row), header first when detected.
     """
-    norm: list[list[str]] = []
-    for row in rows:
-        cells = ["" if v is None else str(v).strip() for v in row]
-        if any(cells):
-            norm.append(cells)
-
-    if not norm:
-        return []
-
-    header: list[str] | None = None
-    first = norm[0]
-    if len(norm) > 1 and sum(1 for c in first if c) >= 2:
-        header = first
-        data_rows = norm[1:]
-    else:
-        data_rows = norm
-
-    lines: list[str] = []
-    if header is not None:
-        lines.append(" | ".join(c for c in header if c))
-
-    for cells in data_rows:
+    norm = filter(any, rows)
+    first = next(norm, None)
+    if first is None:
+        return
+    second = next(norm, None)
+    if second is None:
+        yield " | ".join(filter(None, first))
+        return
+    if sum(1 for c in first if c) < 2:
+        for cells in chain((first, second), norm):
+            yield " | ".join(filter(None, cells))
+        return
+
+    header = first
+    yield " | ".join(filter(None, header))
+    for cells in chain((second,), norm):
         pairs: list[str] = []
         for i, val in enumerate(cells):
             if not val:
                 continue
-            if header is not None and i < len(header) and header[i]:
+            if i < len(header) and header[i]:
                 pairs.append(f"{header[i]}: {val}")
             else:
                 pairs.append(val)
-        if pairs:
-            lines.append(" | ".join(pairs))
+        yield " | ".join(pairs)
 
-    return lines
+
+def _format_sheet_rows(rows: Iterable[Iterable[object]]) -> list[str]:
+    """Return :func:`_iter_sheet_rows` output as a list of lines."""
+    return list(_iter_sheet_rows(rows))
 
 
 class XlsxProcessor(BaseFileProcessor):
@@ -62,9 +79,12 @@ class XlsxProcessor(BaseFileProcessor):
 
     Extracts text from XLSX files using openpyxl library.
     Extracts all cell values from all sheets for PII detection, preserving the
-    column-header context of each value (see :func:`_format_sheet_rows`).
+    column-header context of each value (see :func:`_iter_sheet_rows`).
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".xlsx"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from an XLSX file.
 
@@ -118,9 +138,12 @@ class XlsProcessor(BaseFileProcessor):
 
     Extracts text from older XLS files using xlrd library.
     Extracts all cell values from all sheets for PII detection, preserving the
-    column-header context of each value (see :func:`_format_sheet_rows`).
+    column-header context of each value (see :func:`_iter_sheet_rows`).
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".xls"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from an XLS file.
 
@@ -1,9 +1,12 @@
 """XML file processor using defusedxml for secure XML parsing."""
 
+import logging
 from xml.etree.ElementTree import Element
 
 from file_processors.base_processor import BaseFileProcessor
 
+_logger = logging.getLogger(__name__)
+
 _defusedxml_import_error: ImportError | None = None
 try:
     from defusedxml.ElementTree import ParseError as SafeParseError
@@ -37,6 +40,8 @@ class XmlProcessor(BaseFileProcessor):
     Handles both small and large XML files.
     """
 
+    __slots__ = ()
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from an XML file.
 
@@ -71,9 +76,7 @@ class XmlProcessor(BaseFileProcessor):
             # Do NOT fall back to regex-based extraction — that would bypass
             # the security guarantees of defusedxml (XXE, billion-laughs, etc.).
             # Let the caller handle the parse error via its standard error path.
-            import logging
-
-            logging.getLogger(__name__).warning(
+            _logger.warning(
                 "Skipping malformed XML file (defusedxml rejected it): %s",
                 file_path,
             )
@@ -96,18 +99,21 @@ class XmlProcessor(BaseFileProcessor):
             text_parts: List to accumulate extracted strings
         """
         # Extract text directly in this element (before first child)
-        if element.text and element.text.strip():
-            text_parts.append(element.text.strip())
+        text = element.text.strip() if element.text else ""
+        if text:
+            text_parts.append(text)
 
         # Extract attribute values
-        for attr_name, attr_value in element.attrib.items():
-            if attr_value and attr_value.strip():
-                text_parts.append(attr_value.strip())
+        for attr_value in element.attrib.values():
+            attr_value = attr_value.strip()
+            if attr_value:
+                text_parts.append(attr_value)
 
         # Recursively process child elements
         for child in element:
             self._extract_text_from_element(child, text_parts)
 
             # Extract tail text (text after the element, before next sibling)
-            if child.tail and child.tail.strip():
-                text_parts.append(child.tail.strip())
+            tail = child.tail.strip() if child.tail else ""
+            if tail:
+                text_parts.append(tail)
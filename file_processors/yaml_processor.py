@@ -1,6 +1,7 @@
 """YAML file processor using PyYAML library."""
 
 import logging
+import re
 from typing import Any
 
 from file_processors.base_processor import BaseFileProcessor
@@ -12,6 +13,9 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     yaml = None
 
+# Quoted strings in malformed YAML, e.g. key: "value" or key: 'value'
+_QUOTED_STRING_RE = re.compile(r'["\']([^"\']+)["\']')
+
 
 class YamlProcessor(BaseFileProcessor):
     """Processor for YAML files.
@@ -21,6 +25,9 @@ class YamlProcessor(BaseFileProcessor):
     Handles nested structures, arrays, and objects.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".yaml", ".yml"})
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from a YAML file.
 
@@ -73,13 +80,7 @@ class YamlProcessor(BaseFileProcessor):
                     yamlfile.seek(0)
                     content = yamlfile.read()
                     # Extract potential string values using simple heuristics
-                    # Look for patterns like key: "value" or key: 'value'
-                    import re
-
-                    # Match quoted strings (both single and double quotes)
-                    string_pattern = r'["\']([^"\']+)["\']'
-                    matches = re.findall(string_pattern, content)
-                    text_parts.extend(matches)
+                    text_parts.extend(_QUOTED_STRING_RE.findall(content))
 
         except FileNotFoundError:
             raise
@@ -103,8 +104,10 @@ class YamlProcessor(BaseFileProcessor):
         if isinstance(obj, dict):
             for key, value in obj.items():
                 # Extract key if it's a string
-                if isinstance(key, str) and key.strip():
-                    text_parts.append(key.strip())
+                if isinstance(key, str):
+                    key = key.strip()
+                    if key:
+                        text_parts.append(key)
                 # Recursively process value
                 self._extract_strings(value, text_parts)
         elif isinstance(obj, list):
@@ -112,11 +115,12 @@ class YamlProcessor(BaseFileProcessor):
                 self._extract_strings(item, text_parts)
         elif isinstance(obj, str):
             # Extract string value
-            if obj.strip():
-                text_parts.append(obj.strip())
+            obj = obj.strip()
+            if obj:
+                text_parts.append(obj)
         # Numbers, booleans, None are ignored as they're not useful for PII detection
 
     @staticmethod
     def can_process(extension: str) -> bool:  # type: ignore[override]  # registry inspects arity; see base_processor.can_process
         """Check if this processor can handle YAML files."""
-        return extension.lower() in [".yaml", ".yml"]
+        return extension.lower() in YamlProcessor.SUPPORTED_EXTENSIONS
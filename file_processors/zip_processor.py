@@ -29,6 +29,9 @@ class ZipProcessor(BaseFileProcessor):
     Handles nested archives and password-protected archives.
     """
 
+    __slots__ = ()
+    SUPPORTED_EXTENSIONS = frozenset({".zip"})
+
     def extract_text(self, file_path: str) -> Iterator[str]:
         """Extract text from all files in ZIP archive.
 
@@ -99,6 +99,10 @@ def mock_config():
     config.use_magic_detection = False
     config.magic_detection_fallback = True
     config.max_pending_futures = 512
+    config.walk_workers = 1
+    config.prefer_warm_files = False
+    config.extraction_prefetch_chunks = 4
+    config.chunk_coalesce_chars = 1500
 
     # Tuning limits
     config.dedup_max_entries = 500_000
@@ -119,6 +123,8 @@ def mock_config():
         use_magic_detection=config.use_magic_detection,
         magic_detection_fallback=config.magic_detection_fallback,
         max_pending_futures=config.max_pending_futures,
+        walk_workers=config.walk_workers,
+        prefer_warm_files=config.prefer_warm_files,
         max_file_size_mb=config.max_file_size_mb,
         max_processing_time_seconds=config.max_processing_time_seconds,
         exclude_patterns=[],
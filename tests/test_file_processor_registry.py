@@ -1,6 +1,6 @@
 """Tests for FileProcessorRegistry."""
 
-from file_processors import FileProcessorRegistry
+from file_processors import FileProcessorRegistry, LazyFileProcessor
 from file_processors.base_processor import BaseFileProcessor
 
 
@@ -73,6 +73,31 @@ class TestFileProcessorRegistryOtherMethods:
         assert ".txt" in extensions
         assert extensions == sorted(extensions)
 
+    def test_declared_extensions_dispatch_like_the_processor_scan(self):
+        """The extension index picks the first processor claiming an extension."""
+        processors = FileProcessorRegistry.get_all_processors()
+        for ext in FileProcessorRegistry.get_supported_extensions():
+            first = next(p for p in processors if p.can_process(ext))
+            assert FileProcessorRegistry.get_processor(ext) is first, ext
+            snapshot = FileProcessorRegistry.snapshot()
+            assert snapshot.get_processor(ext.upper()) is first, ext
+
+    def test_supported_extensions_match_can_process(self):
+        """Every declared extension is claimed, and lazy entries match their class."""
+        for processor in FileProcessorRegistry.get_all_processors():
+            for ext in processor.SUPPORTED_EXTENSIONS:
+                assert processor.can_process(ext), (processor, ext)
+            if isinstance(processor, LazyFileProcessor):
+                real = processor.load()
+                assert processor.SUPPORTED_EXTENSIONS == real.SUPPORTED_EXTENSIONS
+
+    def test_processors_have_no_instance_dict(self):
+        """Built-in processors declare __slots__ all the way down."""
+        for processor in FileProcessorRegistry.get_all_processors():
+            if isinstance(processor, LazyFileProcessor):
+                processor = processor.load()
+            assert not hasattr(processor, "__dict__"), type(processor).__name__
+
     def test_register_class_and_clear(self):
         """Test register_class and clear, then restore registry."""
 
@@ -163,3 +188,158 @@ class TestFileProcessorRegistryIsolation:
         assert len(snapshot.get_all_processors()) == len(
             FileProcessorRegistry.get_all_processors()
         )
+
+
+class TestLazyFileProcessor:
+    """Tests for lazily imported processors."""
+
+    def test_package_import_skips_heavy_processor_modules(self):
+        """Importing file_processors does not import the office/PDF stacks."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, file_processors\n"
+            "heavy = ['pdfminer', 'docx', 'pptx', 'extract_msg', 'odf', 'bs4']\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_declared_extensions_match_real_processors(self):
+        """Each lazy entry claims exactly what its real processor claims."""
+        import importlib
+
+        import file_processors
+
+        probe = {
+            ext for _, exts in file_processors._LAZY_PROCESSORS.values() for ext in exts
+        } | {".txt", ".xyz", ""}
+        for name, (module, extensions) in file_processors._LAZY_PROCESSORS.items():
+            real = getattr(importlib.import_module(module), name)()
+            lazy = file_processors.LazyFileProcessor(module, name, extensions)
+            for ext in probe:
+                assert lazy.can_process(ext) == real.can_process(ext), (name, ext)
+                assert lazy.can_process(ext.upper()) == real.can_process(ext.upper())
+
+    def test_lazy_processor_reports_the_real_coalesce_flag(self):
+        """COALESCE_CHUNKS is read from the real processor, not the base default."""
+        import importlib
+
+        import file_processors
+
+        for name, (module, extensions) in file_processors._LAZY_PROCESSORS.items():
+            real_cls = getattr(importlib.import_module(module), name)
+            lazy = file_processors.LazyFileProcessor(module, name, extensions)
+            assert lazy.COALESCE_CHUNKS is real_cls.COALESCE_CHUNKS, name
+
+    def test_lazy_processor_loads_once_and_delegates(self, tmp_path):
+        from file_processors import LazyFileProcessor, YamlProcessor
+
+        lazy = LazyFileProcessor(
+            "file_processors.yaml_processor", "YamlProcessor", (".yaml", ".yml")
+        )
+        path = tmp_path / "a.yaml"
+        path.write_text("name: Jane Doe\n", encoding="utf-8")
+
+        text = lazy.extract_text(str(path))
+        assert "Jane Doe" in "".join(text)
+        assert isinstance(lazy.load(), YamlProcessor)
+        assert lazy.load() is lazy.load()
+
+
+class TestExtensionCache:
+    """Tests for the registry's extension cache."""
+
+    def test_misses_are_cached_only_without_file_path(self, tmp_path):
+        calls = []
+
+        class SniffingProcessor(BaseFileProcessor):
+            def extract_text(self, file_path: str):
+                return ""
+
+            @staticmethod
+            def can_process(extension: str, file_path: str = "", mime_type: str = ""):
+                calls.append(extension)
+                return bool(file_path) and file_path.endswith("sniff.log")
+
+        with FileProcessorRegistry.isolated() as registry:
+            registry.clear()
+            registry.register_class(SniffingProcessor)
+
+            assert registry.get_processor(".log") is None
+            assert registry.get_processor(".log") is None
+            assert calls == [".log"]
+
+            # The cached miss does not hide a processor that sniffs the file.
+            sniffed = tmp_path / "sniff.log"
+            assert isinstance(
+                registry.get_processor(".log", str(sniffed)), SniffingProcessor
+            )
+
+    def test_mime_type_lookups_are_cached_per_pair(self, tmp_path):
+        calls = []
+
+        class MimeProcessor(BaseFileProcessor):
+            def extract_text(self, file_path: str):
+                return ""
+
+            @staticmethod
+            def can_process(extension: str, file_path: str = "", mime_type: str = ""):
+                calls.append((extension, mime_type))
+                return mime_type == "text/x-mime"
+
+        path = str(tmp_path / "a.dat")
+        with FileProcessorRegistry.isolated() as registry:
+            registry.clear()
+            registry.register_class(MimeProcessor)
+
+            for _ in range(2):
+                assert isinstance(
+                    registry.get_processor(".dat", path, "text/x-mime"), MimeProcessor
+                )
+                assert registry.get_processor(".dat", path, "text/x-other") is None
+            assert calls == [(".dat", "text/x-mime"), (".dat", "text/x-other")]
+
+    def test_mime_type_misses_are_not_cached_for_path_only_processors(self, tmp_path):
+        class SniffingProcessor(BaseFileProcessor):
+            def extract_text(self, file_path: str):
+                return ""
+
+            @staticmethod
+            def can_process(extension: str, file_path: str = "") -> bool:  # type: ignore[override]
+                return file_path.endswith("sniff.log")
+
+        with FileProcessorRegistry.isolated() as registry:
+            registry.clear()
+            registry.register_class(SniffingProcessor)
+
+            other = str(tmp_path / "other.log")
+            sniffed = str(tmp_path / "sniff.log")
+            assert registry.get_processor(".log", other, "text/plain") is None
+            assert isinstance(
+                registry.get_processor(".log", sniffed, "text/plain"),
+                SniffingProcessor,
+            )
+
+    def test_extension_is_lowercased_once_for_all_processors(self):
+        calls = []
+
+        class PickyProcessor(BaseFileProcessor):
+            def extract_text(self, file_path: str):
+                return ""
+
+            @staticmethod
+            def can_process(extension: str) -> bool:  # type: ignore[override]
+                calls.append(extension)
+                return extension == ".pick"
+
+        with FileProcessorRegistry.isolated() as registry:
+            registry.clear()
+            registry.register_class(PickyProcessor)
+
+            assert isinstance(registry.get_processor(".PICK"), PickyProcessor)
+            assert isinstance(registry.get_processor(".pick"), PickyProcessor)
+            assert calls == [".pick"]
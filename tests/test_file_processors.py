@@ -3,12 +3,14 @@
 import os
 import sqlite3
 import struct
+import sys
 import zipfile
 from unittest.mock import patch
 
 import pytest
 
 from file_processors import (
+    CorruptedFileError,
     CsvProcessor,
     DocxProcessor,
     EmlProcessor,
@@ -36,6 +38,41 @@ from file_processors import (
 )
 
 
+def _write_text_pdf(path, page_texts):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    page_ids = [4 + 2 * i for i in range(len(page_texts))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % pid for pid in page_ids), len(page_ids)),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for pid, text in zip(page_ids, page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode("latin-1")
+        objects[pid] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (pid + 1)
+        )
+        objects[pid + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (
+            len(stream),
+            stream,
+        )
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, objects[num])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offsets[num] for num in sorted(objects))
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    with open(path, "wb") as f:
+        f.write(out)
+
+
 class TestPdfProcessor:
     """Tests for PDF processor."""
 
@@ -89,6 +126,55 @@ class TestPdfProcessor:
         assert PdfProcessor._finalize_page(page, ocr_callable=ocr) == page
         assert calls == []  # OCR must not run when embedded text is sufficient
 
+    def test_extract_text_in_worker_processes_keeps_page_order(
+        self, temp_dir, monkeypatch
+    ):
+        """With several workers, pages are laid out in parallel but yielded in order."""
+        pdf_path = os.path.join(temp_dir, "pages.pdf")
+        pages = [f"Page {n} contact user{n}@example.com" for n in range(1, 7)]
+        _write_text_pdf(pdf_path, pages)
+
+        sequential = [text.strip() for text in PdfProcessor().extract_text(pdf_path)]
+        assert sequential == pages
+
+        monkeypatch.setenv("PBD_PDF_WORKERS", "2")
+        parallel = [text.strip() for text in PdfProcessor().extract_text(pdf_path)]
+        assert parallel == pages
+
+    def test_extract_text_with_pdfium_backend(self, temp_dir, monkeypatch):
+        """PBD_PDF_BACKEND=pdfium extracts the same pages through PDFium."""
+        pytest.importorskip("pypdfium2")
+        pdf_path = os.path.join(temp_dir, "pages.pdf")
+        pages = ["Page one user@example.com", "", "Page three DE89 3704 0044"]
+        _write_text_pdf(pdf_path, pages)
+
+        monkeypatch.setenv("PBD_PDF_BACKEND", "pdfium")
+        texts = [text.strip() for text in PdfProcessor().extract_text(pdf_path)]
+        assert texts == [pages[0], pages[2]]
+
+    def test_pdf_backend_falls_back_to_pdfminer(self, monkeypatch):
+        """pdfium is only used when installed; unknown names mean pdfminer."""
+        from file_processors import pdf_processor
+
+        monkeypatch.setenv("PBD_PDF_BACKEND", "pdfium")
+        monkeypatch.setattr(pdf_processor, "_pdfium", None)
+        assert pdf_processor._pdf_backend() == "pdfminer"
+        monkeypatch.setenv("PBD_PDF_BACKEND", "poppler")
+        assert pdf_processor._pdf_backend() == "pdfminer"
+        monkeypatch.delenv("PBD_PDF_BACKEND")
+        assert pdf_processor._pdf_backend() == "pdfminer"
+
+    def test_pdf_workers_env_override(self, monkeypatch):
+        """PBD_PDF_WORKERS overrides the default; 0 means one worker per CPU."""
+        from file_processors.pdf_processor import _pdf_workers
+
+        monkeypatch.setenv("PBD_PDF_WORKERS", "3")
+        assert _pdf_workers() == 3
+        monkeypatch.setenv("PBD_PDF_WORKERS", "0")
+        assert _pdf_workers() == (os.cpu_count() or 1)
+        monkeypatch.setenv("PBD_PDF_WORKERS", "many")
+        assert _pdf_workers() == 1
+
     def test_ocr_available_returns_bool(self):
         """The OCR availability probe never raises and returns a bool."""
         from file_processors.pdf_processor import _ocr_available
@@ -179,6 +265,15 @@ class TestDocxProcessor:
         assert not processor.can_process(".pdf")
         assert not processor.can_process(".txt")
 
+    def test_empty_docx_raises_corrupted_file_error(self, temp_dir):
+        """python-docx's PackageNotFoundError surfaces as a project exception."""
+        pytest.importorskip("docx")
+        path = os.path.join(temp_dir, "empty.docx")
+        open(path, "wb").close()
+
+        with pytest.raises(CorruptedFileError, match="DOCX Empty Or Protected"):
+            DocxProcessor().extract_text(path)
+
     def test_extract_paragraphs_tables_headers(self, temp_dir):
         """Paragraphs, table cells and header/footer text are all extracted."""
         docx = pytest.importorskip("docx")
@@ -208,6 +303,29 @@ class TestDocxProcessor:
         assert "Vertraulich Kopfzeile" in text
         assert "Seite Fusszeile" in text
 
+    def test_paragraph_text_matches_python_docx(self, temp_dir):
+        """Reading paragraph XML directly yields python-docx's Paragraph.text."""
+        docx = pytest.importorskip("docx")
+        from docx.enum.text import WD_BREAK
+
+        from file_processors.docx_processor import _paragraph_text
+
+        path = os.path.join(temp_dir, "runs.docx")
+        document = docx.Document()
+        paragraph = document.add_paragraph("Name:\tMax")
+        run = paragraph.add_run(" Mustermann")
+        run.add_break()
+        run.add_text("Zeile 2")
+        run.add_break(WD_BREAK.PAGE)
+        document.add_paragraph("")
+        document.save(path)
+
+        document = docx.Document(path)
+        assert [_paragraph_text(p._p) for p in document.paragraphs] == [
+            p.text for p in document.paragraphs
+        ]
+        assert "Name:\tMax Mustermann\nZeile 2" in DocxProcessor().extract_text(path)
+
 
 class TestHtmlProcessor:
     """Tests for HTML processor."""
@@ -231,6 +349,49 @@ class TestHtmlProcessor:
         assert "<p>" not in text
         assert "<" not in text and ">" not in text
 
+    @pytest.fixture(params=["selectolax", "lxml", "html.parser"])
+    def html_backend(self, request, monkeypatch):
+        """Run with selectolax and with both BeautifulSoup parsers."""
+        if request.param == "selectolax":
+            pytest.importorskip("selectolax")
+            return request.param
+        if request.param == "lxml":
+            pytest.importorskip("lxml")
+        monkeypatch.setattr("file_processors._html_utils._LexborHTMLParser", None)
+        monkeypatch.setattr("file_processors._html_utils._PARSER", request.param)
+        return request.param
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (
+                '<html><head><meta charset="windows-1252"></head>'
+                "<body><p>Jürgen Müller</p></body></html>".encode("cp1252"),
+                "Jürgen Müller",
+            ),
+            ("<p>Grüße, max@example.de</p>".encode(), "Grüße, max@example.de"),
+        ],
+    )
+    def test_detects_document_encoding(self, temp_dir, html_backend, raw, expected):
+        """Raw bytes are decoded per the document, with every backend."""
+        file_path = os.path.join(temp_dir, "enc.html")
+        with open(file_path, "wb") as f:
+            f.write(raw)
+
+        assert expected in HtmlProcessor().extract_text(file_path)
+
+    def test_backends_extract_the_same_text(self, temp_dir, html_backend):
+        file_path = os.path.join(temp_dir, "page.html")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(
+                "<html><head><title>T</title><style>p{color:red}</style>"
+                '<script>var a = "x";</script></head>'
+                "<body><!-- note --><p>Hi <b>max</b>@x.de</p>"
+                "<table><tr><td>a</td><td>b</td></tr></table>&amp; end</body></html>"
+            )
+
+        assert HtmlProcessor().extract_text(file_path) == "THi max@x.deab& end"
+
 
 class TestTextProcessor:
     """Tests for text processor."""
@@ -278,7 +439,7 @@ class TestCsvProcessor:
             f.write("Jane Smith,jane@example.com,098-765-4321\n")
 
         processor = CsvProcessor()
-        text = processor.extract_text(file_path)
+        text = "\n".join(processor.extract_text(file_path))
         assert "John Doe" in text
         assert "john@example.com" in text
         assert "Jane Smith" in text
@@ -293,7 +454,7 @@ class TestCsvProcessor:
             f.write("John Doe;john@example.com;123-456-7890\n")
 
         processor = CsvProcessor()
-        text = processor.extract_text(file_path)
+        text = "\n".join(processor.extract_text(file_path))
         assert "John Doe" in text
         assert "john@example.com" in text
 
@@ -305,10 +466,27 @@ class TestCsvProcessor:
             f.write("John Doe\tjohn@example.com\t123-456-7890\n")
 
         processor = CsvProcessor()
-        text = processor.extract_text(file_path)
+        text = "\n".join(processor.extract_text(file_path))
         assert "John Doe" in text
         assert "john@example.com" in text
 
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("Name|Email\nJohn Doe|john@example.com\n", "Email: john@example.com"),
+            # Equal counts keep the earlier candidate (comma beats semicolon).
+            ("a,b;c\n", "a | b;c"),
+            # No candidate at all: the whole line is one comma-separated cell.
+            ("John Doe\n", "John Doe"),
+        ],
+    )
+    def test_delimiter_detection(self, temp_dir, content, expected):
+        file_path = os.path.join(temp_dir, "delim.csv")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        assert expected in "\n".join(CsvProcessor().extract_text(file_path))
+
     def test_extract_preserves_column_context(self, temp_dir):
         """Each value is paired with its column header and rows stay separated."""
         file_path = os.path.join(temp_dir, "context.csv")
@@ -317,18 +495,66 @@ class TestCsvProcessor:
             f.write("Max Mustermann,DE89 3704 0044 0532 0130 00\n")
             f.write("Erika Beispiel,DE02 1203 0000 0000 2020 51\n")
 
-        text = CsvProcessor().extract_text(file_path)
+        text = "\n".join(CsvProcessor().extract_text(file_path))
         assert "IBAN: DE89 3704 0044 0532 0130 00" in text
         assert "Name: Max Mustermann" in text
         # Two data records -> two separate lines (plus the header line).
         assert len(text.splitlines()) == 3
 
+    def test_legacy_encoding_is_read_from_disk_once(self, temp_dir):
+        """A cp1252 file falls back in memory and keeps text-mode newlines."""
+        file_path = os.path.join(temp_dir, "legacy.csv")
+        with open(file_path, "wb") as f:
+            f.write("Name;Straße\r\nJürgen Müller;Hauptstraße 1\r\n".encode("cp1252"))
+
+        real_open = open
+        opened = []
+
+        def counting_open(path, *args, **kwargs):
+            if path == file_path:
+                opened.append(path)
+            return real_open(path, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=counting_open):
+            text = "\n".join(CsvProcessor().extract_text(file_path))
+
+        assert "Name: Jürgen Müller" in text
+        assert "Straße: Hauptstraße 1" in text
+        assert "\r" not in text
+        assert len(opened) == 1
+
+    def test_extract_text_streams_lines(self, temp_dir):
+        """Rows are yielded one line at a time instead of one joined string."""
+        file_path = os.path.join(temp_dir, "stream.csv")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("Name,Email\n")
+            f.write("John Doe,john@example.com\n")
+            f.write(",\n")
+            f.write("Jane Smith,\n")
+
+        lines = CsvProcessor().extract_text(file_path)
+        assert not isinstance(lines, str)
+        assert list(lines) == [
+            "Name | Email",
+            "Name: John Doe | Email: john@example.com",
+            "Name: Jane Smith",
+        ]
+
+    def test_single_row_is_not_a_header(self, temp_dir):
+        file_path = os.path.join(temp_dir, "single.csv")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("\nJohn Doe,john@example.com\n\n")
+
+        assert list(CsvProcessor().extract_text(file_path)) == [
+            "John Doe | john@example.com"
+        ]
+
     def test_file_not_found(self, temp_dir):
         """Test that FileNotFoundError is raised for non-existent file."""
         processor = CsvProcessor()
         non_existent = os.path.join(temp_dir, "nonexistent.csv")
         with pytest.raises(FileNotFoundError):
-            processor.extract_text(non_existent)
+            list(processor.extract_text(non_existent))
 
 
 class TestJsonProcessor:
@@ -411,6 +637,32 @@ class TestJsonProcessor:
         # Should still extract string values using regex fallback
         assert "John Doe" in text or "john@example.com" in text
 
+    def test_extract_text_with_invalid_utf8_keeps_structure(self, temp_dir):
+        """Undecodable bytes are replaced instead of dropping to the regex fallback."""
+        file_path = os.path.join(temp_dir, "latin1.json")
+        with open(file_path, "wb") as f:
+            f.write(b'{"name": "J\xfcrgen", "email": "j@example.com", "n": 1}')
+
+        text = JsonProcessor().extract_text(file_path)
+        assert text == "name J�rgen email j@example.com n"
+
+    def test_extract_strings_keeps_document_order(self):
+        data = {"a": [" x ", {"b": "y", "c": [1, None, "z"]}], "": "  ", "d": True}
+        text_parts: list[str] = []
+        JsonProcessor()._extract_strings(data, text_parts)
+        assert text_parts == ["a", "x", "b", "y", "c", "z", "d"]
+
+    def test_extract_strings_handles_nesting_beyond_recursion_limit(self):
+        data: list = ["outer"]
+        inner = data
+        for _ in range(sys.getrecursionlimit() * 2):
+            inner.append([])
+            inner = inner[-1]
+        inner.append("deep")
+        text_parts: list[str] = []
+        JsonProcessor()._extract_strings(data, text_parts)
+        assert text_parts == ["outer", "deep"]
+
     def test_file_not_found(self, temp_dir):
         """Test that FileNotFoundError is raised for non-existent file."""
         processor = JsonProcessor()
@@ -469,7 +721,7 @@ class TestOdtProcessor:
         processor = OdtProcessor()
         non_existent = os.path.join(temp_dir, "nonexistent.odt")
         with pytest.raises(FileNotFoundError):
-            processor.extract_text(non_existent)
+            list(processor.extract_text(non_existent))
 
     def test_extract_text_from_odt(self, temp_dir):
         """Test text extraction from ODT file (requires odfpy)."""
@@ -483,10 +735,50 @@ class TestOdtProcessor:
         doc.save(odt_path)
 
         processor = OdtProcessor()
-        text = processor.extract_text(odt_path)
+        text = "\n".join(processor.extract_text(odt_path))
         assert "John Doe" in text
         assert "john@example.com" in text
 
+    def test_extract_text_in_document_order_without_duplicates(self, temp_dir):
+        """Headings, paragraphs and cells come once each, in document order."""
+        pytest.importorskip("odf.opendocument")
+        from odf.opendocument import OpenDocumentText
+        from odf.table import Table, TableCell, TableRow
+        from odf.text import H, P
+
+        odt_path = os.path.join(temp_dir, "ordered.odt")
+        doc = OpenDocumentText()
+        doc.text.addElement(H(outlinelevel=1, text="Employees"))
+        table = Table()
+        row = TableRow()
+        for value in ("Jane Roe", "jane@example.com"):
+            cell = TableCell()
+            cell.addElement(P(text=value))
+            row.addElement(cell)
+        table.addElement(row)
+        doc.text.addElement(table)
+        doc.text.addElement(P(text="End of list"))
+        doc.save(odt_path)
+
+        processor = OdtProcessor()
+        assert list(processor.extract_text(odt_path)) == [
+            "Employees",
+            "Jane Roe",
+            "jane@example.com",
+            "End of list",
+        ]
+
+
+@pytest.fixture(params=["selectolax", "regex"])
+def email_html_backend(request, monkeypatch):
+    """Run with selectolax and with the regex fallback (never BeautifulSoup)."""
+    if request.param == "selectolax":
+        pytest.importorskip("selectolax")
+    else:
+        monkeypatch.setattr("file_processors._html_utils._LexborHTMLParser", None)
+        monkeypatch.setitem(sys.modules, "bs4", None)
+    return request.param
+
 
 class TestEmlProcessor:
     """Tests for EML processor."""
@@ -526,6 +818,42 @@ class TestEmlProcessor:
         # Attachment is run through the CSV processor -> column context preserved.
         assert "IBAN: DE89 3704 0044 0532 0130 00" in text
 
+    def test_nested_eml_attachments_stop_at_depth_limit(self, temp_dir):
+        """Nested .eml attachments resolved through the lazy registry keep the depth limit."""
+        from email.message import EmailMessage
+
+        from file_processors import FileProcessorRegistry, LazyFileProcessor
+        from file_processors.eml_processor import _MAX_ATTACHMENT_DEPTH
+
+        assert isinstance(
+            FileProcessorRegistry.get_processor(".eml"), LazyFileProcessor
+        )
+
+        levels = _MAX_ATTACHMENT_DEPTH + 2
+        inner = b""
+        for level in reversed(range(levels)):
+            msg = EmailMessage()
+            msg["Subject"] = f"Level {level}"
+            msg.set_content(f"BODY-LEVEL-{level}")
+            if inner:
+                msg.add_attachment(
+                    inner,
+                    maintype="application",
+                    subtype="octet-stream",
+                    filename=f"level{level + 1}.eml",
+                )
+            inner = msg.as_bytes()
+
+        file_path = os.path.join(temp_dir, "nested.eml")
+        with open(file_path, "wb") as f:
+            f.write(inner)
+
+        text = EmlProcessor().extract_text(file_path)
+        for level in range(_MAX_ATTACHMENT_DEPTH + 1):
+            assert f"BODY-LEVEL-{level}" in text
+        for level in range(_MAX_ATTACHMENT_DEPTH + 1, levels):
+            assert f"BODY-LEVEL-{level}" not in text
+
     def test_extract_text_from_eml(self, temp_dir):
         """Test text extraction from EML file."""
         file_path = os.path.join(temp_dir, "test.eml")
@@ -610,6 +938,68 @@ Content-Type: text/html; charset=utf-8
         text = EmlProcessor().extract_text(file_path)
         assert "contact@example.com" in text
 
+    def test_html_alternative_is_skipped_when_plain_text_exists(self, temp_dir):
+        """Only the text/plain rendering of a multipart/alternative is extracted."""
+        file_path = os.path.join(temp_dir, "alternative.eml")
+        eml_content = (
+            "From: sender@example.com\n"
+            "Subject: Alt\n"
+            "MIME-Version: 1.0\n"
+            'Content-Type: multipart/mixed; boundary="outer"\n'
+            "\n"
+            "--outer\n"
+            'Content-Type: multipart/alternative; boundary="alt"\n'
+            "\n"
+            "--alt\n"
+            "Content-Type: text/plain; charset=utf-8\n"
+            "\n"
+            "plain body max@example.de\n"
+            "--alt\n"
+            "Content-Type: text/html; charset=utf-8\n"
+            "\n"
+            "<p>html rendering</p>\n"
+            "--alt--\n"
+            "--outer\n"
+            "Content-Type: text/html; charset=utf-8\n"
+            "\n"
+            "<p>separate html part</p>\n"
+            "--outer--\n"
+        )
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(eml_content)
+
+        text = EmlProcessor().extract_text(file_path)
+        assert "plain body max@example.de" in text
+        assert "html rendering" not in text
+        assert "separate html part" in text
+
+    def test_html_part_drops_script_and_style_and_decodes_entities(
+        self, temp_dir, email_html_backend
+    ):
+        file_path = os.path.join(temp_dir, "html_only.eml")
+        eml_content = (
+            "From: sender@example.com\n"
+            "Subject: HTML\n"
+            "MIME-Version: 1.0\n"
+            'Content-Type: multipart/alternative; boundary="b"\n'
+            "\n"
+            "--b\n"
+            "Content-Type: text/html; charset=utf-8\n"
+            "\n"
+            "<html><head><style>p {color: red}</style></head><body>"
+            "<script>var secret = 1;</script><p>M&uuml;ller</p><p>max@example.de</p>"
+            "</body></html>\n"
+            "\n"
+            "--b--\n"
+        )
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(eml_content)
+
+        text = EmlProcessor().extract_text(file_path)
+        assert "Müller max@example.de" in text
+        assert "secret" not in text
+        assert "color" not in text
+
     def test_file_not_found(self, temp_dir):
         """Test that FileNotFoundError is raised for non-existent file."""
         processor = EmlProcessor()
@@ -644,7 +1034,7 @@ class TestMsgProcessor:
             f.write("dummy")
 
         with pytest.raises(ImportError) as exc_info:
-            processor.extract_text(file_path)
+            list(processor.extract_text(file_path))
         assert "extract-msg is required" in str(exc_info.value)
 
     def test_file_not_found(self, temp_dir):
@@ -655,11 +1045,69 @@ class TestMsgProcessor:
         # or FileNotFoundError if it is installed. We test both cases.
         try:
             with pytest.raises((FileNotFoundError, ImportError)):
-                processor.extract_text(non_existent)
+                list(processor.extract_text(non_existent))
         except ImportError:
             # If extract-msg is not installed, that's expected
             pass
 
+    def test_extract_text_streams_parts_and_closes_message(self, mocker):
+        """Parts are yielded one by one and the message is closed on early exit."""
+        attachment = mocker.Mock(
+            spec=["longFilename", "shortFilename", "displayName"],
+            longFilename=None,
+            shortFilename="CV_JANE.PDF",
+            displayName="",
+        )
+        message = mocker.Mock(
+            spec=[
+                "subject",
+                "to",
+                "body",
+                "htmlBody",
+                "attachments",
+                "senderEmail",
+                "close",
+            ],
+            subject="Invoice",
+            to=["a@example.com", "", "b@example.com"],
+            body="  Dear John Doe  ",
+            htmlBody=b"<p>IBAN&nbsp;DE89</p>",
+            attachments=[attachment],
+            senderEmail="jane@example.com",
+        )
+        mocker.patch(
+            "file_processors.msg_processor.extract_msg"
+        ).Message.return_value = message
+
+        parts = MsgProcessor().extract_text("mail.msg")
+        assert next(parts) == "a@example.com"
+        parts.close()
+        message.close.assert_called_once()
+
+        message.close.reset_mock()
+        assert list(MsgProcessor().extract_text("mail.msg")) == [
+            "a@example.com",
+            "b@example.com",
+            "Invoice",
+            "Dear John Doe",
+            "IBAN DE89",
+            "CV_JANE.PDF",
+            "jane@example.com",
+        ]
+        message.close.assert_called_once()
+
+    def test_extract_text_from_html_decodes_entities(self):
+        """HTML bodies lose their tags and have all entities decoded."""
+        processor = MsgProcessor()
+        html = (
+            "<p>M&uuml;ller&nbsp;&amp; Co</p><br/>"
+            "<a href='mailto:x'>user&#64;example.com</a> &lt;tag&gt;"
+        )
+        assert (
+            processor._extract_text_from_html(html)
+            == "Müller & Co user@example.com <tag>"
+        )
+
     # Note: Testing actual MSG extraction would require creating a valid MSG file
     # which is complex and requires Outlook or specialized tools. The can_process test
     # and error handling tests verify the basic functionality. Full integration tests
@@ -683,7 +1131,7 @@ class TestOdsProcessor:
         processor = OdsProcessor()
         non_existent = os.path.join(temp_dir, "nonexistent.ods")
         with pytest.raises(FileNotFoundError):
-            processor.extract_text(non_existent)
+            list(processor.extract_text(non_existent))
 
     def test_extract_text_from_ods(self, temp_dir):
         """Test text extraction from ODS file (requires odfpy)."""
@@ -705,10 +1153,60 @@ class TestOdsProcessor:
         doc.save(ods_path)
 
         processor = OdsProcessor()
-        text = processor.extract_text(ods_path)
+        text = "\n".join(processor.extract_text(ods_path))
         assert "John Doe" in text
         assert "john@example.com" in text
 
+    def test_repeated_cells_and_rows_are_not_expanded(self, temp_dir):
+        """Repeat counts are not multiplied out; repeated text is yielded once."""
+        pytest.importorskip("odf.opendocument")
+        from odf.opendocument import OpenDocumentSpreadsheet
+        from odf.table import Table, TableCell, TableRow
+        from odf.text import P
+
+        ods_path = os.path.join(temp_dir, "repeated.ods")
+        doc = OpenDocumentSpreadsheet()
+        table = Table(name="Sheet1")
+        row = TableRow()
+        cell = TableCell(numbercolumnsrepeated=3)
+        cell.addElement(P(text="john@example.com"))
+        row.addElement(cell)
+        row.addElement(TableCell(numbercolumnsrepeated=16_381))
+        table.addElement(row)
+        blank_row = TableRow(numberrowsrepeated=1_048_575)
+        blank_row.addElement(TableCell(numbercolumnsrepeated=16_384))
+        table.addElement(blank_row)
+        doc.spreadsheet.addElement(table)
+        doc.save(ods_path)
+
+        assert list(OdsProcessor().extract_text(ods_path)) == ["john@example.com"]
+
+    def test_extract_text_joins_nested_cell_text_in_order(self, temp_dir):
+        """Text nested in spans and links is collected in document order."""
+        pytest.importorskip("odf.opendocument")
+        from odf.opendocument import OpenDocumentSpreadsheet
+        from odf.table import Table, TableCell, TableRow
+        from odf.text import A, P, Span
+
+        ods_path = os.path.join(temp_dir, "nested.ods")
+        doc = OpenDocumentSpreadsheet()
+        table = Table(name="Sheet1")
+        row = TableRow()
+        cell = TableCell()
+        paragraph = P(text="Name:")
+        span = Span(text="John")
+        span.addElement(A(href="mailto:john@example.com", text="Doe"))
+        paragraph.addElement(span)
+        paragraph.addText("end")
+        cell.addElement(paragraph)
+        row.addElement(cell)
+        row.addElement(TableCell())
+        table.addElement(row)
+        doc.spreadsheet.addElement(table)
+        doc.save(ods_path)
+
+        assert list(OdsProcessor().extract_text(ods_path)) == ["Name: John Doe end"]
+
 
 class TestXlsxProcessor:
     """Tests for XLSX processor."""
@@ -874,7 +1372,7 @@ class TestPptxProcessor:
             f.write("dummy")
 
         with pytest.raises(ImportError) as exc_info:
-            processor.extract_text(file_path)
+            list(processor.extract_text(file_path))
         assert "python-pptx is required" in str(exc_info.value)
 
     def test_file_not_found(self, temp_dir):
@@ -885,7 +1383,7 @@ class TestPptxProcessor:
         # or FileNotFoundError if it is installed. We test both cases.
         try:
             with pytest.raises((FileNotFoundError, ImportError)):
-                processor.extract_text(non_existent)
+                list(processor.extract_text(non_existent))
         except ImportError:
             # If python-pptx is not installed, that's expected
             pass
@@ -905,10 +1403,50 @@ class TestPptxProcessor:
         prs.save(pptx_path)
 
         processor = PptxProcessor()
-        text = processor.extract_text(pptx_path)
+        text = "\n".join(processor.extract_text(pptx_path))
         assert "John Doe" in text
         assert "john@example.com" in text
 
+    def test_shape_text_is_extracted_once_and_charts_are_skipped(self, temp_dir):
+        """Runs are joined without duplicates; tables are read; charts don't fail."""
+        pytest.importorskip("pptx")
+        from pptx import Presentation
+        from pptx.chart.data import CategoryChartData
+        from pptx.enum.chart import XL_CHART_TYPE
+        from pptx.util import Inches
+
+        pptx_path = os.path.join(temp_dir, "shapes.pptx")
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+        frame = slide.shapes.add_textbox(
+            Inches(1), Inches(1), Inches(5), Inches(1)
+        ).text_frame
+        paragraph = frame.paragraphs[0]
+        paragraph.add_run().text = "Jo"
+        paragraph.add_run().text = "hn Doe"
+        table = slide.shapes.add_table(
+            1, 2, Inches(1), Inches(3), Inches(4), Inches(1)
+        ).table
+        table.cell(0, 0).text = "IBAN"
+        table.cell(0, 1).text = "DE89 3704 0044 0532 0130 00"
+        chart_data = CategoryChartData()
+        chart_data.categories = ["Q1"]
+        chart_data.add_series("Sales", (1.0,))
+        slide.shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED,
+            Inches(1),
+            Inches(5),
+            Inches(4),
+            Inches(2),
+            chart_data,
+        )
+        prs.save(pptx_path)
+
+        assert list(PptxProcessor().extract_text(pptx_path)) == [
+            "John Doe",
+            "IBAN DE89 3704 0044 0532 0130 00",
+        ]
+
 
 def _build_minimal_ppt(texts: list[str]) -> bytes:
     """Hand-build a minimal, real OLE2 (CFBF) file with a "PowerPoint Document"
@@ -1226,6 +1764,58 @@ class TestMarkdownProcessor:
         assert "john@example.com" in text
         assert "Header" in text
 
+    def test_extract_text_strips_inline_and_line_markup(self, temp_dir):
+        """Markup is removed in one pass, including nested and line-level syntax."""
+        file_path = os.path.join(temp_dir, "markup.md")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(
+                "## Contact **[Jane](mailto:jane@example.com)**\n"
+                "* first item\n"
+                "* second _item_\n"
+                "1. ![photo](me.png) and <b>bold</b>\n"
+                "> quoted `a*b*`\n"
+                "***\n"
+            )
+        processor = MarkdownProcessor()
+        text = processor.extract_text(file_path)
+        assert text == (
+            "Contact Jane mailto:jane@example.com\n"
+            "first item\n"
+            "second item\n"
+            "photo me.png and bold\n"
+            "quoted a*b*"
+        )
+
+    def test_extract_text_keeps_code_blocks_verbatim(self, temp_dir):
+        """Fenced code blocks survive unchanged, markup around them is stripped."""
+        file_path = os.path.join(temp_dir, "code.md")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(
+                "**Before**\n"
+                "```\nuser_email = 'john@example.com'  # **not bold**\n```\n"
+                "between _text_\n"
+                "~~~\n- not a list\n~~~\n"
+                "*after*\n"
+            )
+        processor = MarkdownProcessor()
+        text = processor.extract_text(file_path)
+        assert text == (
+            "Before\n\n"
+            "```\nuser_email = 'john@example.com'  # **not bold**\n```\n\n"
+            "between text\n\n"
+            "~~~\n- not a list\n~~~\n\n"
+            "after"
+        )
+
+    def test_extract_text_strips_triple_emphasis(self, temp_dir):
+        """Bold italic markers are removed completely, not just the outer pair."""
+        file_path = os.path.join(temp_dir, "emphasis.md")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("Name: ***Max Mustermann***\nAlias: ___Max___\n")
+        processor = MarkdownProcessor()
+        text = processor.extract_text(file_path)
+        assert text == "Name: Max Mustermann\nAlias: Max"
+
 
 class TestSqliteProcessor:
     """Tests for SQLite processor."""
@@ -1406,6 +1996,57 @@ class TestIcalProcessor:
         assert "john@example.com" in text
         assert "Room 123" in text
 
+    def test_extract_text_unfolds_lines_and_keeps_parameters(self, temp_dir):
+        """Folded lines (CRLF + space) are joined and CN names are kept."""
+        file_path = os.path.join(temp_dir, "folded.ics")
+        with open(file_path, "wb") as f:
+            f.write(
+                b"BEGIN:VCALENDAR\r\n"
+                b"BEGIN:VEVENT\r\n"
+                b"SUMMARY:Budget review;\r\n"
+                b"DESCRIPTION:Call Jane Doe\\, +49 30 1234\r\n"
+                b" 5678\\nBring the contract\r\n"
+                b"ORGANIZER;CN=Jane Doe:mailto:jane@example.com\r\n"
+                b"location:Room 1\\; Building 2\r\n"
+                b"DTSTART:20240101T090000Z\r\n"
+                b"END:VEVENT\r\n"
+                b"END:VCALENDAR\r\n"
+            )
+
+        text = IcalProcessor().extract_text(file_path)
+
+        assert text == (
+            "SUMMARY: Budget review;\n"
+            "DESCRIPTION: Call Jane Doe, +49 30 12345678\nBring the contract\n"
+            "ORGANIZER: Jane Doe mailto:jane@example.com\n"
+            "LOCATION: Room 1; Building 2"
+        )
+
+    def test_extract_text_keeps_unquoted_cn(self, temp_dir):
+        """An unquoted CN parameter is emitted with the property value."""
+        file_path = os.path.join(temp_dir, "organizer.ics")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("ORGANIZER;CN=Erika Musterfrau:mailto:erika@example.de\n")
+
+        text = IcalProcessor().extract_text(file_path)
+
+        assert text == "ORGANIZER: Erika Musterfrau mailto:erika@example.de"
+
+    def test_extract_text_splits_after_quoted_parameter_values(self, temp_dir):
+        """A ':' inside a quoted CN does not end the parameter list."""
+        file_path = os.path.join(temp_dir, "attendee.ics")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(
+                'ATTENDEE;CN="Mustermann: Max";ROLE=REQ-PARTICIPANT;'
+                'SENT-BY="mailto:sek@example.de":mailto:max@example.de\n'
+            )
+
+        text = IcalProcessor().extract_text(file_path)
+
+        assert text == (
+            "ATTENDEE: Mustermann: Max mailto:sek@example.de mailto:max@example.de"
+        )
+
 
 class TestPropertiesProcessor:
     """Tests for Properties processor."""
@@ -1428,6 +2069,52 @@ class TestPropertiesProcessor:
         assert "John Doe" in text
         assert "secret123" in text
 
+    def test_properties_key_ends_at_first_separator(self, temp_dir):
+        """As in Java, the key ends at whichever of '=' and ':' comes first."""
+        file_path = os.path.join(temp_dir, "app.properties")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(
+                "# settings\n! legacy comment\n\n"
+                "db.url: jdbc:pg://host/db?user=admin\n"
+                "mail.from = Jane Doe <jane@example.com>\n"
+                "no separator here\n"
+            )
+        text = PropertiesProcessor().extract_text(file_path)
+        assert text == (
+            "db.url = jdbc:pg://host/db?user=admin\n"
+            "mail.from = Jane Doe <jane@example.com>"
+        )
+
+    def test_extract_text_from_ini_sections(self, temp_dir):
+        """Files whose first entry is a section header are parsed as INI."""
+        file_path = os.path.join(temp_dir, "app.ini")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("; comment\n\n[database]\nUser = admin\npassword: hunter2\n")
+        text = PropertiesProcessor().extract_text(file_path)
+        assert text == "[database]\nuser = admin\npassword = hunter2"
+
+    def test_ini_values_are_raw_and_duplicates_kept(self, temp_dir):
+        """INI entries configparser would reject or rewrite come through as written."""
+        file_path = os.path.join(temp_dir, "app.ini")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(
+                "[mail]\n"
+                "from = Jane Doe <jane@example.com>\n"
+                "signature = Regards,\n"
+                "    Jane Doe\n"
+                "stray line\n"
+                "[mail]\n"
+                "Rate = 100%(total)s\n"
+            )
+        text = PropertiesProcessor().extract_text(file_path)
+        assert text == (
+            "[mail]\n"
+            "from = Jane Doe <jane@example.com>\n"
+            "signature = Regards,\nJane Doe\n"
+            "[mail]\n"
+            "rate = 100%(total)s"
+        )
+
 
 class TestMboxProcessor:
     """Tests for MBOX processor."""
@@ -1458,6 +2145,94 @@ class TestMboxProcessor:
         assert "recipient@example.com" in text
         assert "contact@example.com" in text
 
+    def test_splits_messages_on_from_lines(self, temp_dir):
+        """Each "From " line starts a message; a preamble is its own chunk."""
+        file_path = os.path.join(temp_dir, "multi.mbox")
+        with open(file_path, "wb") as f:
+            f.write(
+                b"stray preamble\n"
+                b"From a@example.com Mon Jan 01 00:00:00 2024\n"
+                b"Subject: One\n\nfirst body\n>From quoted line\n\n"
+                b"From b@example.com Mon Jan 01 00:00:00 2024\n"
+                b"Subject: Two\n\nsecond body"
+            )
+
+        chunks = list(MboxProcessor().extract_text(file_path))
+
+        assert len(chunks) == 3
+        assert "stray preamble" in chunks[0]
+        assert "Subject: One" in chunks[1] and ">From quoted line" in chunks[1]
+        assert "Subject: Two" in chunks[2] and "second body" in chunks[2]
+
+    def test_html_alternative_is_skipped_when_plain_text_exists(self, temp_dir):
+        file_path = os.path.join(temp_dir, "alternative.mbox")
+        with open(file_path, "wb") as f:
+            f.write(
+                b"From a@example.com Mon Jan 01 00:00:00 2024\n"
+                b"Subject: Alt\n"
+                b"MIME-Version: 1.0\n"
+                b'Content-Type: multipart/alternative; boundary="b"\n'
+                b"\n"
+                b"--b\n"
+                b"Content-Type: text/plain; charset=utf-8\n"
+                b"\n"
+                b"plain body\n"
+                b"--b\n"
+                b"Content-Type: text/html; charset=utf-8\n"
+                b"\n"
+                b"<p>html rendering</p>\n"
+                b"--b--\n"
+            )
+
+        text = " ".join(MboxProcessor().extract_text(file_path))
+        assert "plain body" in text
+        assert "html rendering" not in text
+
+    def test_part_with_unknown_charset_falls_back_to_utf8(self, temp_dir):
+        file_path = os.path.join(temp_dir, "charset.mbox")
+        with open(file_path, "wb") as f:
+            f.write(
+                b"From a@example.com Mon Jan 01 00:00:00 2024\n"
+                b"MIME-Version: 1.0\n"
+                b'Content-Type: multipart/mixed; boundary="b"\n'
+                b"\n"
+                b"--b\n"
+                b"Content-Type: text/plain; charset=not-a-charset\n"
+                b"\n"
+                b"J\xc3\xbcrgen, j@example.com\n"
+                b"--b--\n"
+            )
+
+        text = " ".join(MboxProcessor().extract_text(file_path))
+        assert "J\u00fcrgen, j@example.com" in text
+
+    def test_html_part_is_converted_to_text(self, temp_dir, email_html_backend):
+        file_path = os.path.join(temp_dir, "html.mbox")
+        with open(file_path, "wb") as f:
+            f.write(
+                b"From a@example.com Mon Jan 01 00:00:00 2024\n"
+                b"Subject: HTML\n"
+                b"MIME-Version: 1.0\n"
+                b'Content-Type: multipart/alternative; boundary="b"\n'
+                b"\n"
+                b"--b\n"
+                b"Content-Type: text/html; charset=utf-8\n"
+                b"\n"
+                b"<p>Call<br>+49&nbsp;30 123456</p><SCRIPT type=x>var x;</SCRIPT >\n"
+                b"--b--\n"
+            )
+
+        text = " ".join(MboxProcessor().extract_text(file_path))
+        assert "Call +49\u00a030 123456" in text
+        assert "<p>" not in text
+        assert "var x" not in text
+
+    def test_empty_mbox_yields_nothing(self, temp_dir):
+        file_path = os.path.join(temp_dir, "empty.mbox")
+        open(file_path, "wb").close()
+
+        assert list(MboxProcessor().extract_text(file_path)) == []
+
     def test_can_process_logs_instead_of_silently_swallowing_read_errors(
         self, temp_dir, caplog
     ):
@@ -0,0 +1,61 @@
+"""Tests for core.file_stat."""
+
+import os
+
+import pytest
+
+from core import file_stat
+from core.file_stat import regular_file_size
+
+
+@pytest.fixture(params=["statx", "stat"])
+def lookup(request, monkeypatch):
+    """Run each test through the statx path (where available) and the fallback."""
+    if request.param == "stat":
+        monkeypatch.setattr(file_stat, "_statx", None)
+    elif file_stat._statx is None:
+        pytest.skip("statx not available on this platform")
+    return regular_file_size
+
+
+def test_regular_file_size(lookup, temp_dir):
+    path = os.path.join(temp_dir, "data.bin")
+    with open(path, "wb") as f:
+        f.write(b"x" * 1234)
+
+    assert lookup(path) == 1234
+
+
+def test_follows_symlinks(lookup, temp_dir):
+    target = os.path.join(temp_dir, "target.txt")
+    with open(target, "wb") as f:
+        f.write(b"abc")
+    link = os.path.join(temp_dir, "link.txt")
+    try:
+        os.symlink(target, link)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+
+    assert lookup(link) == 3
+
+
+def test_directory_and_missing_path_return_none(lookup, temp_dir):
+    assert lookup(temp_dir) is None
+    assert lookup(os.path.join(temp_dir, "missing.txt")) is None
+
+
+def test_page_cache_residency_of_recently_read_file(temp_dir):
+    path = os.path.join(temp_dir, "warm.bin")
+    with open(path, "wb") as f:
+        f.write(b"x" * 10_000)
+    with open(path, "rb") as f:
+        f.read()
+
+    residency = file_stat.page_cache_residency(path, 10_000)
+
+    # None where cachestat(2) is unavailable (non-Linux, kernels before 6.5).
+    assert residency is None or residency == 1.0
+
+
+def test_page_cache_residency_missing_file(temp_dir):
+    assert file_stat.page_cache_residency(os.path.join(temp_dir, "nope"), 10) is None
@@ -1,5 +1,6 @@
 """Tests for image processor."""
 
+import base64
 from pathlib import Path
 
 from file_processors.image_processor import ImageProcessor
@@ -56,6 +57,10 @@ class TestImageProcessor:
         assert processor.get_image_mime_type("test.tiff") == "image/tiff"
         assert processor.get_image_mime_type("test.webp") == "image/webp"
         assert processor.get_image_mime_type("test.unknown") is None
+        assert processor.get_image_mime_type("/a/b/PHOTO.JPG") == "image/jpeg"
+        assert processor.get_image_mime_type("/scans.2024/page.tif") == "image/tiff"
+        assert processor.get_image_mime_type("/scans.png/page") is None
+        assert processor.get_image_mime_type("png") is None
 
     def test_extract_text_returns_empty(self, temp_dir):
         """Test extract_text returns empty string for images."""
@@ -84,3 +89,22 @@ class TestImageProcessor:
         assert isinstance(result, str)
         # Base64 encoded data should be a string
         assert len(result) > 0
+
+    def test_get_image_base64_bytes_matches_string_variant(self, temp_dir):
+        """The bytes variant returns the same base64 text, as ASCII bytes."""
+        processor = ImageProcessor()
+        test_file = Path(temp_dir) / "test.png"
+        test_file.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)))
+
+        result = processor.get_image_base64_bytes(str(test_file))
+        assert result == base64.b64encode(test_file.read_bytes())
+        assert processor.get_image_base64(str(test_file)) == result.decode("ascii")
+
+    def test_get_image_base64_empty_file(self, temp_dir):
+        """An empty file encodes to an empty string instead of failing."""
+        processor = ImageProcessor()
+        test_file = Path(temp_dir) / "empty.jpg"
+        test_file.write_bytes(b"")
+
+        assert processor.get_image_base64_bytes(str(test_file)) == b""
+        assert processor.get_image_base64(str(test_file)) == ""
@@ -28,6 +28,13 @@ class TestPiiMatch:
         )
         assert match.ner_score == 0.95
 
+    def test_pii_match_is_slotted(self):
+        """PiiMatch instances carry no per-instance __dict__."""
+        match = PiiMatch(text="a", file="/f", type="REGEX_EMAIL")
+        assert not hasattr(match, "__dict__")
+        with pytest.raises(AttributeError):
+            match.extra = 1
+
 
 class TestPiiMatchContainer:
     """Tests for PiiMatchContainer."""
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import gzip
+import io
 import json
 import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -15,6 +18,7 @@ from core.writers import (
     JsonlWriter,
     JsonWriter,
     PrivacyStatisticsWriter,
+    XlsxWriter,
     create_output_writer,
 )
 
@@ -42,6 +46,85 @@ def test_csv_writer_write_and_finalize(tmp_path):
     assert writer.supports_streaming is True
 
 
+def test_csv_writer_flush_every(tmp_path):
+    """flush_every pushes rows to disk, including rows from get_writer()."""
+    buffered = CsvWriter(str(tmp_path / "buffered.csv"))
+    buffered.get_writer().writerow(["a@example.com", "/tmp/a.txt"])
+    assert (tmp_path / "buffered.csv").read_text(encoding="utf-8") == ""
+    buffered.finalize()
+
+    out = tmp_path / "flushed.csv"
+    writer = CsvWriter(str(out), flush_every=1)
+    writer.get_writer().writerow(["a@example.com", "/tmp/a.txt"])
+    writer.write_match(
+        PiiMatch(
+            text="b@example.com",
+            file="/tmp/b.txt",
+            type="REGEX_EMAIL",
+            ner_score=None,
+            engine="regex",
+            metadata={},
+        )
+    )
+    content = out.read_text(encoding="utf-8")
+    assert "a@example.com" in content
+    assert "b@example.com" in content
+    writer.finalize()
+
+
+def test_csv_writer_batches_write_match_rows(tmp_path, monkeypatch):
+    """write_match rows are written in batches and flushed in order on finalize."""
+    import core.writers as writers_module
+
+    monkeypatch.setattr(writers_module, "_CSV_BATCH_ROWS", 2)
+    out = tmp_path / "findings.csv"
+    writer = CsvWriter(str(out), include_header=False)
+
+    for i in range(5):
+        writer.write_match(
+            PiiMatch(
+                text=f"user{i}@example.com",
+                file="/tmp/a.txt",
+                type="REGEX_EMAIL",
+                ner_score=None,
+                engine="regex",
+                metadata={},
+            )
+        )
+    writer.file_handle.flush()
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 4
+
+    writer.finalize()
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [line.split(",")[0] for line in lines] == [
+        f"user{i}@example.com" for i in range(5)
+    ]
+
+
+def test_csv_writer_quotes_special_characters(tmp_path):
+    """Fields with delimiters, quotes or newlines round-trip through csv.reader."""
+    import csv
+
+    out = tmp_path / "findings.csv"
+    writer = CsvWriter(str(out))
+    text = 'Doe, "John"\nline two\r'
+    writer.write_match(
+        PiiMatch(
+            text=text,
+            file="/tmp/a,b.txt",
+            type="NER_PERSON",
+            ner_score=0.25,
+            engine="gliner",
+            metadata={},
+        )
+    )
+    writer.finalize()
+
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[1] == [text, "/tmp/a,b.txt", "NER_PERSON", "0.25", "gliner", ""]
+
+
 def test_json_writer_write_and_finalize(tmp_path):
     """Test JsonWriter writes matches and finalizes correctly."""
     out = tmp_path / "findings.json"
@@ -162,7 +245,17 @@ def test_jsonl_writer_streams_and_appends_metadata(tmp_path):
     assert last["_metadata"]["k"] == "v"
 
 
-def test_xlsx_writer_streams_rows(tmp_path):
+@pytest.fixture(params=["xlsxwriter", "openpyxl"])
+def xlsx_backend(request, monkeypatch):
+    """Run XLSX tests with xlsxwriter and with the openpyxl fallback."""
+    if request.param == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    else:
+        monkeypatch.setitem(sys.modules, "xlsxwriter", None)
+    return request.param
+
+
+def test_xlsx_writer_streams_rows(tmp_path, xlsx_backend):
     out = tmp_path / "findings.xlsx"
     writer = create_output_writer("xlsx", str(out))
 
@@ -190,6 +283,72 @@ def test_xlsx_writer_streams_rows(tmp_path):
     assert "Metadata" in wb.sheetnames
 
 
+def test_xlsx_writer_rotates_sheets_every_chunk_rows(tmp_path, xlsx_backend):
+    out = tmp_path / "findings.xlsx"
+    writer = XlsxWriter(str(out), chunk_rows=2)
+    for i in range(5):
+        writer.write_match(
+            PiiMatch(
+                text=f"m{i}",
+                file="/tmp/a.txt",
+                type="REGEX_EMAIL",
+                ner_score=None,
+                engine="regex",
+            )
+        )
+    writer.finalize()
+
+    import openpyxl
+
+    wb = openpyxl.load_workbook(str(out), read_only=True, data_only=True)
+    assert wb.sheetnames == ["Findings", "Findings 2", "Findings 3"]
+    texts = []
+    for name in wb.sheetnames:
+        rows = list(wb[name].iter_rows(values_only=True))
+        assert rows[0][0] == "Match"
+        texts.extend(row[0] for row in rows[1:])
+    assert texts == ["m0", "m1", "m2", "m3", "m4"]
+
+
+def test_xlsx_writer_metadata_sheet_serializes_nested_values(tmp_path, xlsx_backend):
+    out = tmp_path / "findings.xlsx"
+    writer = create_output_writer("xlsx", str(out))
+    writer.finalize(metadata={"scan": "id", "count": 2, "errors": {"Größe": [1]}})
+
+    import openpyxl
+
+    wb = openpyxl.load_workbook(str(out), read_only=True, data_only=True)
+    rows = {row[0]: row[1] for row in wb["Metadata"].iter_rows(values_only=True)}
+    assert rows["scan"] == "id"
+    assert rows["count"] == 2
+    assert json.loads(rows["errors"]) == {"Größe": [1]}
+    assert "Größe" in rows["errors"]
+
+
+def test_xlsx_writer_keeps_formula_like_text_as_string(tmp_path):
+    """With xlsxwriter, matched text starting with '=' is stored as a string."""
+    pytest.importorskip("xlsxwriter")
+    out = tmp_path / "findings.xlsx"
+    writer = XlsxWriter(str(out), include_header=False)
+    writer.write_match(
+        PiiMatch(
+            text='=HYPERLINK("http://x")',
+            file="/tmp/a.txt",
+            type="REGEX_EMAIL",
+            ner_score=None,
+            engine="regex",
+            metadata={},
+        )
+    )
+    writer.finalize()
+
+    import openpyxl
+
+    ws = openpyxl.load_workbook(str(out))["Findings"]
+    assert ws["A1"].data_type == "s"
+    assert ws["A1"].value == '=HYPERLINK("http://x")'
+
+
 def test_create_output_writer_csv(tmp_path):
     """Test create_output_writer returns CsvWriter for csv format."""
     out = tmp_path / "out.csv"
@@ -260,3 +419,245 @@ def test_privacy_statistics_writer(tmp_path):
     assert "statistics_by_dimension" in data
     assert "summary" in data
     assert "metadata" in data
+
+
+def test_jsonl_writer_keeps_non_ascii_text(tmp_path):
+    """Findings are written as UTF-8 without \\u escapes."""
+    out = tmp_path / "findings.jsonl"
+    writer = JsonlWriter(str(out))
+    writer.write_match(
+        PiiMatch(
+            text="Jürgen Müller",
+            file="/tmp/ä.txt",
+            type="NER_PERSON",
+            ner_score=0.8,
+            engine="gliner",
+            metadata={},
+        )
+    )
+    writer.finalize()
+
+    raw = out.read_text(encoding="utf-8")
+    assert "Jürgen Müller" in raw
+    assert json.loads(raw)["file"] == "/tmp/ä.txt"
+
+
+def test_jsonl_writer_batches_lines_until_threshold(tmp_path, monkeypatch):
+    """Lines are held back until the flush threshold, then written together."""
+    import core.writers as writers_module
+
+    monkeypatch.setattr(writers_module, "_JSONL_FLUSH_BYTES", 300)
+    out = tmp_path / "findings.jsonl"
+    writer = JsonlWriter(str(out))
+
+    def write(i: int) -> None:
+        writer.write_match(
+            PiiMatch(
+                text=f"user{i}@example.com",
+                file="/tmp/a.txt",
+                type="REGEX_EMAIL",
+                ner_score=None,
+                engine="regex",
+                metadata={},
+            )
+        )
+
+    write(0)
+    writer.file_handle.flush()
+    assert out.read_bytes() == b""
+
+    for i in range(1, 5):
+        write(i)
+    writer.file_handle.flush()
+    assert out.read_bytes().count(b"\n") >= 2
+
+    writer.finalize(metadata={"k": "v"})
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["text"] for line in lines[:-1]] == [
+        f"user{i}@example.com" for i in range(5)
+    ]
+    assert json.loads(lines[-1]) == {"_metadata": {"k": "v"}}
+
+
+def test_html_writer_streams_rows_to_temp_file(tmp_path):
+    """HtmlWriter keeps no match list; rows are merged into the page on finalize."""
+    out = tmp_path / "report.html"
+    writer = create_output_writer("html", str(out))
+    assert not hasattr(writer, "matches")
+
+    writer.write_match(
+        PiiMatch(
+            text="<b>Jane</b>",
+            file="/tmp/a.txt",
+            type="NER_PERSON",
+            ner_score=0.9,
+            engine="gliner",
+            metadata={},
+            severity="HIGH",
+        )
+    )
+    rows_path = str(out) + ".rows.tmp"
+    assert os.path.isfile(rows_path)
+
+    writer.finalize(metadata={"files_scanned": 1})
+
+    assert not os.path.exists(rows_path)
+    page = out.read_text(encoding="utf-8")
+    assert "&lt;b&gt;Jane&lt;/b&gt;" in page
+    assert "<span>Total findings: 1</span>" in page
+    assert '<div class="count">1</div><div class="label">HIGH</div>' in page
+    assert page.endswith("</script></body></html>")
+
+
+@pytest.mark.parametrize("copy_file_range", ["native", "failing", "missing"])
+def test_json_writer_merge_copy_paths(tmp_path, monkeypatch, copy_file_range):
+    """The body merge produces the same JSON with or without copy_file_range."""
+    if copy_file_range == "native" and not hasattr(os, "copy_file_range"):
+        pytest.skip("os.copy_file_range is not available")
+    if copy_file_range == "failing":
+
+        def fail(*args):
+            raise OSError(18, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "copy_file_range", fail, raising=False)
+    elif copy_file_range == "missing":
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+
+    out = tmp_path / "findings.json"
+    writer = JsonWriter(str(out))
+    for i in range(300):
+        writer.write_match(
+            PiiMatch(
+                text=f"user{i}@example.com",
+                file="/tmp/a.txt",
+                type="REGEX_EMAIL",
+                ner_score=None,
+                engine="regex",
+                metadata={},
+            )
+        )
+    writer.finalize(metadata={"scan_id": "merge"})
+
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert [f["text"] for f in data["findings"]] == [
+        f"user{i}@example.com" for i in range(300)
+    ]
+    assert data["metadata"]["scan_id"] == "merge"
+
+
+def test_json_writers_share_match_payload(tmp_path):
+    """JSON and JSONL findings use the same keys, with context fields when set."""
+    match = PiiMatch(
+        text="John Doe",
+        file="/tmp/a.txt",
+        type="NER_PERSON",
+        ner_score=0.9,
+        engine="gliner",
+        metadata={"k": 1},
+        severity="HIGH",
+        context_before="Name: ",
+        char_offset=6,
+    )
+    expected = {
+        "text": "John Doe",
+        "file": "/tmp/a.txt",
+        "type": "NER_PERSON",
+        "score": 0.9,
+        "engine": "gliner",
+        "severity": "HIGH",
+        "metadata": {"k": 1},
+        "context_before": "Name: ",
+        "char_offset": 6,
+    }
+    for fmt in ("json", "streaming-json", "jsonl"):
+        out = tmp_path / f"findings.{fmt}"
+        writer = create_output_writer(fmt, str(out))
+        writer.write_match(match)
+        writer.finalize()
+        raw = out.read_text(encoding="utf-8")
+        if fmt == "jsonl":
+            record = json.loads(raw.splitlines()[0])
+        else:
+            record = json.loads(raw)["findings"][0]
+        assert record == expected, fmt
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_writers_indent_only_when_pretty(tmp_path, pretty):
+    match = PiiMatch(
+        text="a@b.de", file="/a.txt", type="REGEX", ner_score=None, engine="regex"
+    )
+    findings = tmp_path / "findings.json"
+    writer = JsonWriter(str(findings), pretty=pretty)
+    writer.write_match(match)
+    writer.finalize(metadata={"total": 1})
+    stats = tmp_path / "stats.json"
+    stats_writer = PrivacyStatisticsWriter(str(stats), pretty=pretty)
+    stats_writer.finalize(metadata={"statistics": {"summary": {"total": 1}}})
+
+    for path in (findings, stats):
+        raw = path.read_text(encoding="utf-8")
+        assert ("\n  " in raw) is pretty
+        json.loads(raw)
+
+
+def test_privacy_statistics_writer_msgpack(tmp_path):
+    msgpack = pytest.importorskip("msgpack")
+    out = tmp_path / "stats.msgpack"
+    writer = create_output_writer("statistics-msgpack", str(out))
+    writer.finalize(metadata={"statistics": {"summary": {"total": 3}}})
+
+    data = msgpack.unpackb(out.read_bytes())
+    assert data["summary"] == {"total": 3}
+    assert data["metadata"] == {}
+
+
+def test_privacy_statistics_writer_msgpack_missing(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    with pytest.raises(OutputError, match="msgpack is required"):
+        PrivacyStatisticsWriter(str(tmp_path / "stats.msgpack"), use_msgpack=True)
+
+
+def _stream_match() -> PiiMatch:
+    return PiiMatch(
+        text="a@b.de", file="/a.txt", type="REGEX", ner_score=None, engine="regex"
+    )
+
+
+def test_csv_writer_accepts_open_stream():
+    stream = io.StringIO()
+    writer = CsvWriter(stream)
+    writer.write_match(_stream_match())
+    writer.finalize()
+
+    assert not stream.closed
+    assert stream.getvalue().splitlines()[1] == "a@b.de,/a.txt,REGEX,,regex,"
+    assert writer.file_path == "<stream>"
+
+
+def test_jsonl_writer_accepts_gzip_stream(tmp_path):
+    out = tmp_path / "findings.jsonl.gz"
+    with gzip.open(out, "wb") as gz:
+        writer = JsonlWriter(gz)
+        writer.write_match(_stream_match())
+        writer.finalize(metadata={"total": 1})
+        assert not gz.closed
+
+    lines = gzip.decompress(out.read_bytes()).decode("utf-8").splitlines()
+    assert json.loads(lines[0])["text"] == "a@b.de"
+    assert json.loads(lines[1]) == {"_metadata": {"total": 1}}
+
+
+def test_xlsx_writer_accepts_binary_stream(xlsx_backend):
+    import openpyxl
+
+    stream = io.BytesIO()
+    writer = XlsxWriter(stream)
+    writer.write_match(_stream_match())
+    writer.finalize()
+
+    assert not stream.closed
+    stream.seek(0)
+    wb = openpyxl.load_workbook(stream, read_only=True)
+    rows = list(wb["Findings"].iter_rows(values_only=True))
+    assert rows[1][0] == "a@b.de"
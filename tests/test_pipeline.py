@@ -0,0 +1,91 @@
+"""Tests for the extracted-chunk pipeline helpers (core.pipeline)."""
+
+import threading
+
+import pytest
+
+from core import skip_counters
+from core.pipeline import coalesce, prefetch
+
+
+class TestPrefetch:
+    """Tests for prefetch()."""
+
+    def test_yields_items_in_order(self):
+        assert list(prefetch(iter(range(50)), maxsize=3)) == list(range(50))
+
+    def test_zero_maxsize_iterates_inline(self):
+        seen_threads = []
+
+        def gen():
+            seen_threads.append(threading.current_thread())
+            yield "a"
+
+        assert list(prefetch(gen(), maxsize=0)) == ["a"]
+        assert seen_threads == [threading.current_thread()]
+
+    def test_produces_on_background_thread(self):
+        seen_threads = []
+
+        def gen():
+            seen_threads.append(threading.current_thread())
+            yield "a"
+
+        assert list(prefetch(gen(), maxsize=2)) == ["a"]
+        assert seen_threads[0] is not threading.current_thread()
+
+    def test_reraises_producer_error_after_earlier_items(self):
+        def gen():
+            yield "first"
+            raise PermissionError("denied")
+
+        received = []
+        with pytest.raises(PermissionError, match="denied"):
+            for item in prefetch(gen(), maxsize=2):
+                received.append(item)
+        assert received == ["first"]
+
+    def test_early_close_stops_and_closes_producer(self):
+        closed = threading.Event()
+
+        def gen():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        chunks = prefetch(gen(), maxsize=1)
+        assert next(chunks) == 0
+        chunks.close()
+        assert closed.is_set()
+
+    def test_transfers_skip_counts_to_consumer_thread(self):
+        skip_counters.drain()
+
+        def gen():
+            skip_counters.record_skip("zip_member_unreadable", 2)
+            yield "a"
+
+        assert list(prefetch(gen(), maxsize=2)) == ["a"]
+        assert skip_counters.drain() == {"zip_member_unreadable": 2}
+
+
+class TestCoalesce:
+    """Tests for coalesce()."""
+
+    def test_merges_short_chunks_up_to_limit(self):
+        chunks = ["aaaa", "bbbb", "cccc"]
+        assert list(coalesce(chunks, max_chars=9)) == ["aaaa\nbbbb", "cccc"]
+
+    def test_long_chunk_is_yielded_alone_and_not_split(self):
+        chunks = ["aa", "x" * 20, "bb"]
+        assert list(coalesce(chunks, max_chars=10)) == ["aa", "x" * 20, "bb"]
+
+    def test_drops_blank_chunks(self):
+        assert list(coalesce(["", "  \n", "a", "\t"], max_chars=100)) == ["a"]
+
+    def test_zero_limit_disables_merging(self):
+        assert list(coalesce(["a", "b"], max_chars=0)) == ["a", "b"]
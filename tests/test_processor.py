@@ -65,6 +65,18 @@ class TestTextProcessor:
         processor.process_text("   \n\t  ", "/test/file.txt")
         assert len(pmc.pii_matches) == 0
 
+    def test_process_text_without_engines_skips_cleanup(self, mock_config):
+        """No enabled engine means nothing consumes the text: skip the cleanup pass."""
+        pmc = PiiMatchContainer()
+        processor = TextProcessor(mock_config, pmc)
+        assert processor.engines == []
+
+        with patch("core.processor._ASCII_CONTROL_RE") as control_re:
+            processor.process_text("Contact\x00 test@example.com", "/test/file.txt")
+
+        control_re.search.assert_not_called()
+        assert len(pmc.pii_matches) == 0
+
     @patch("core.processor.time.time")
     def test_process_text_with_ner(self, mock_time, mock_config):
         """Test processing text with NER detection."""
@@ -90,6 +102,22 @@ class TestTextProcessor:
         # Should have found NER match
         assert len(pmc.pii_matches) > 0
         assert mock_config.ner_stats.total_chunks_processed == 1
+        assert (
+            sum(mock_config.ner_stats.entities_by_type.values())
+            == mock_config.ner_stats.total_entities_found
+        )
+
+    def test_ner_stats_shared_with_statistics(self, mock_config):
+        """Config and Statistics share one NerStats so results are booked once."""
+        from core.statistics import Statistics
+
+        statistics = Statistics()
+        processor = TextProcessor(mock_config, PiiMatchContainer(), statistics)
+
+        assert mock_config.ner_stats is statistics.ner_stats
+
+        processor._handle_engine_error("gliner", "/test/file.txt", RuntimeError("x"))
+        assert statistics.ner_stats.errors == 1
 
     def test_process_text_ner_error_handling(self, mock_config):
         """Test NER error handling."""
@@ -224,6 +252,28 @@ class TestTextProcessor:
         # The thread-local counter is drained, not left for the next file.
         assert skip_counters.drain() == {}
 
+    def test_process_file_reuses_processor_from_file_info(self, mock_config, temp_dir):
+        """A processor resolved by the scanner is used without a registry lookup."""
+        from pathlib import Path
+
+        from core.scanner import FileInfo
+
+        processor = TextProcessor(mock_config, PiiMatchContainer())
+        test_file = Path(temp_dir) / "test.txt"
+        test_file.write_text("nothing interesting here")
+
+        fake_file_processor = Mock()
+        fake_file_processor.extract_text = Mock(return_value="some text")
+        file_info = FileInfo(
+            path=str(test_file), extension=".txt", processor=fake_file_processor
+        )
+
+        with patch("core.processor.FileProcessorRegistry.get_processor") as lookup:
+            assert processor.process_file(file_info) is True
+
+        lookup.assert_not_called()
+        fake_file_processor.extract_text.assert_called_once_with(str(test_file))
+
 
 class TestTextChunking:
     """Tests for the _split_into_chunks helper."""
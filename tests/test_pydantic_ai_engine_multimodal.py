@@ -263,3 +263,22 @@ def test_convert_results_no_source_text_keeps_offset_none(minimal_config):
     results = engine._convert_results(response)
 
     assert results[0].offset is None
+
+
+def test_multimodal_unknown_image_type_is_not_read(
+    tmp_path, minimal_config, monkeypatch
+):
+    """The MIME type is checked before the image is read and encoded."""
+    from file_processors.image_processor import ImageProcessor
+
+    img_path = tmp_path / "scan.heic"
+    img_path.write_bytes(b"FAKEHEIC")
+
+    reads = []
+    monkeypatch.setattr(
+        ImageProcessor, "get_image_base64_bytes", lambda self, path: reads.append(path)
+    )
+
+    engine = PydanticAIEngine(minimal_config)
+    assert engine.detect("", labels=["PERSON"], image_path=str(img_path)) == []
+    assert reads == []
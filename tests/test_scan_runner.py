@@ -11,11 +11,14 @@ from __future__ import annotations
 import argparse
 import concurrent.futures as _real_concurrent_futures
 import logging
+import os
 import sys
 
-from core import constants
+from core import constants, scan_runner
 from core.config import Config
+from core.file_type_detector import FileTypeDetector
 from core.scan_runner import ScanRequest, ScanRunner
+from core.statistics_aggregator import StatisticsAggregator
 
 
 def _make_regex_config(path: str, logger: logging.Logger) -> Config:
@@ -116,6 +119,79 @@ def test_fail_on_severity_gate_sets_exit_code(tmp_path):
     assert result.exit_code == constants.EXIT_FINDINGS_ABOVE_THRESHOLD
 
 
+def test_statistics_file_type_ignores_inferred_extension(tmp_path, monkeypatch):
+    """Files and matches land in the same file-type bucket when magic detection
+    infers an extension the path does not have."""
+    scan_dir = tmp_path / "data"
+    scan_dir.mkdir()
+    (scan_dir / "contact").write_text("Email: jane.doe@example.com\n")
+    (scan_dir / "notes.txt").write_text("Email: john.doe@example.com\n")
+
+    monkeypatch.setattr(FileTypeDetector, "_init_magic", lambda self: None)
+    monkeypatch.setattr(
+        FileTypeDetector, "detect_type", lambda self, path: "text/plain"
+    )
+    aggregators: list[StatisticsAggregator] = []
+
+    class _RecordingAggregator(StatisticsAggregator):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            aggregators.append(self)
+
+    monkeypatch.setattr(scan_runner, "StatisticsAggregator", _RecordingAggregator)
+
+    logger = logging.getLogger("test.scan_runner")
+    config = _make_regex_config(str(scan_dir), logger)
+    config.use_magic_detection = True
+    request = ScanRequest(
+        config=config,
+        logger=logger,
+        statistics_mode=True,
+        statistics_output=str(tmp_path / "stats.json"),
+    )
+    result = ScanRunner().run(request)
+
+    assert result.files_processed == 2
+    by_file_type = aggregators[0].get_statistics()["statistics_by_file_type"]
+    # "contact" was analyzed as .txt, but its suffix (none) decides the bucket
+    # for both the file and its match, so .txt only holds notes.txt.
+    assert by_file_type[".txt"]["files_analyzed"] == 1
+    assert by_file_type[".txt"]["matches_found"] == 1
+
+
+def test_context_check_does_not_cross_mbox_messages(tmp_path):
+    """A BIC is not accepted because of a bank keyword in the previous e-mail."""
+    scan_dir = tmp_path / "data"
+    scan_dir.mkdir()
+    (scan_dir / "mail.mbox").write_bytes(
+        b"From a@example.com Mon Jan 01 00:00:00 2024\n"
+        b"Subject: Hi\n"
+        b"\n"
+        b"Please call your bank\n"
+        b"\n"
+        b"From b@example.com Mon Jan 01 00:00:00 2024\n"
+        b"Subject: Re\n"
+        b"\n"
+        b"COBADEFFXXX\n"
+    )
+    (scan_dir / "same.mbox").write_bytes(
+        b"From a@example.com Mon Jan 01 00:00:00 2024\n"
+        b"Subject: Hi\n"
+        b"\n"
+        b"Please call your bank COBADEFFXXX\n"
+    )
+
+    result = _run(str(scan_dir))
+
+    bic_files = {
+        os.path.basename(match.file)
+        for matches in result.matches_by_file.values()
+        for match in matches
+        if match.type == "REGEX_BIC"
+    }
+    assert bic_files == {"same.mbox"}
+
+
 def test_run_writes_output_file(tmp_path):
     """With an output writer the runner streams findings to the target file."""
     from core.writers import create_output_writer
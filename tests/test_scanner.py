@@ -1,10 +1,14 @@
 """Tests for file scanner."""
 
 import concurrent.futures
+import os
+import time
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
-from core.scanner import FileInfo, FileScanner, ScanResult
+from core.scanner import FileInfo, FileScanner, ScanResult, _extension_of
+from file_processors import FileProcessorRegistry
 
 
 class TestFileScanner:
@@ -66,6 +70,40 @@ class TestFileScanner:
         assert str(test_file) in processed_files
         assert result.files_processed == 1
 
+    def test_file_info_carries_resolved_processor(self, mock_config, temp_dir):
+        """The processor picked during the walk is handed on with the file."""
+        (Path(temp_dir) / "test.txt").write_text("test content")
+
+        infos = []
+        FileScanner(mock_config).scan(temp_dir, file_callback=infos.append)
+
+        assert len(infos) == 1
+        assert infos[0].processor is FileProcessorRegistry.get_processor(".txt")
+
+    def test_unsupported_files_are_not_stat_for_size(self, mock_config, temp_dir):
+        """File size is only looked up for files that will actually be processed."""
+        entries = []
+        for name in ("notes.txt", "image.unknownext"):
+            entry = Mock(path=str(Path(temp_dir) / name))
+            entry.name = name
+            entries.append(entry)
+        supported, unsupported = entries
+
+        infos = []
+        scanner = FileScanner(mock_config)
+        with (
+            patch.object(scanner, "_iter_files", return_value=iter(entries)),
+            patch(
+                "core.scanner.regular_file_size", return_value=1024 * 1024
+            ) as file_size,
+        ):
+            result = scanner.scan(temp_dir, file_callback=infos.append)
+
+        file_size.assert_called_once_with(supported.path)
+        assert [info.size_mb for info in infos] == [1.0]
+        assert result.extension_counts == {".txt": 1, ".unknownext": 1}
+        assert result.files_processed == 1
+
     def test_scan_with_stop_count(self, mock_config, temp_dir):
         """Test scanning with stop_count limit."""
         # Create multiple test files
@@ -127,6 +165,9 @@ class TestFileScanner:
         assert result.total_files_found == 2
         assert len(result.errors) > 0
         assert "Path traversal" in str(list(result.errors.keys())[0])
+        # Plain dicts in the result: looking up an unknown key must not add it.
+        assert type(result.errors) is dict
+        assert type(result.extension_counts) is dict
 
     def test_scan_with_subdirectory(self, mock_config, temp_dir):
         """Test scanning directory with subdirectories."""
@@ -141,6 +182,151 @@ class TestFileScanner:
         assert result.total_files_found == 2
         assert result.extension_counts[".txt"] == 2
 
+    def test_iter_files_matches_os_walk_order(self, mock_config, temp_dir):
+        """The scandir walker visits files in os.walk's top-down order."""
+        import os
+
+        root = Path(temp_dir)
+        for rel in ("a.txt", "b/c.txt", "b/d/e.txt", "f/g.txt"):
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_text("x")
+        # Directory symlinks are listed but not descended into, like os.walk.
+        os.symlink(root / "b", root / "link_to_b")
+
+        scanner = FileScanner(mock_config)
+        walked = [entry.path for entry in scanner._iter_files(temp_dir)]
+
+        expected = [
+            os.path.join(dirpath, name)
+            for dirpath, _dirs, files in os.walk(temp_dir)
+            for name in files
+        ]
+        assert walked == expected
+        assert len(walked) == 4
+
+    def test_parallel_walk_finds_same_files(self, mock_config, temp_dir):
+        """walk_workers > 1 lists directories concurrently but misses nothing."""
+        root = Path(temp_dir)
+        expected = set()
+        for d in range(6):
+            for f in range(5):
+                path = root / f"dir{d}" / f"sub{f % 2}" / f"file{f}.txt"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("x")
+                expected.add(str(path))
+        (root / "skipme").mkdir()
+        (root / "skipme" / "hidden.txt").write_text("x")
+        mock_config.scan.exclude_patterns = ["skipme"]
+        mock_config.scan.walk_workers = 4
+
+        scanner = FileScanner(mock_config)
+        walked = [entry.path for entry in scanner._iter_files(temp_dir)]
+
+        assert sorted(walked) == sorted(expected)
+
+    def test_parallel_walk_honours_stop_count(self, mock_config, temp_dir):
+        """Stopping early shuts the walk workers down cleanly."""
+        for d in range(10):
+            sub = Path(temp_dir) / f"dir{d}"
+            sub.mkdir()
+            for f in range(10):
+                (sub / f"file{f}.txt").write_text("x")
+        mock_config.scan.walk_workers = 4
+
+        scanner = FileScanner(mock_config)
+        result = scanner.scan(temp_dir, stop_count=3)
+
+        assert result.files_processed == 3
+
+    def test_extension_support_is_looked_up_once(self, mock_config):
+        """Unsupported extensions are not re-dispatched for every file."""
+        scanner = FileScanner(mock_config)
+        with patch(
+            "core.scanner.FileProcessorRegistry.get_processor", return_value=None
+        ) as get_processor:
+            assert scanner._is_supported_extension(".xyz") is False
+            assert scanner._is_supported_extension(".xyz") is False
+        get_processor.assert_called_once_with(".xyz")
+
+    def test_extension_of_matches_splitext(self):
+        """_extension_of agrees with os.path.splitext on file names."""
+        names = [
+            "a.txt",
+            "A.PDF",
+            "archive.tar.gz",
+            "noext",
+            ".bashrc",
+            "..a",
+            ".a.b",
+            "a.",
+            "",
+        ]
+        for name in names:
+            assert _extension_of(name) == os.path.splitext(name)[1].lower(), name
+
+    def test_progress_postfix_is_refreshed_in_batches(self, mock_config, temp_dir):
+        """The verbose progress bar postfix is not reformatted for every file."""
+        for i in range(300):
+            (Path(temp_dir) / f"file{i}.txt").write_text("x")
+        mock_config.runtime.verbose = True
+
+        scanner = FileScanner(mock_config)
+        with patch.object(
+            scanner, "_set_progress_postfix", wraps=scanner._set_progress_postfix
+        ) as set_postfix:
+            result = scanner.scan(temp_dir)
+
+        assert result.files_processed == 300
+        # Once at file 256, once more when the bar is closed.
+        assert set_postfix.call_count == 2
+
+    def test_progress_estimate_sets_total_in_background(self, mock_config, temp_dir):
+        """The opt-in file count fills in the progress bar total asynchronously."""
+        (Path(temp_dir) / "sub").mkdir()
+        for name in ("a.txt", "b.bin", "sub/c.txt"):
+            (Path(temp_dir) / name).write_text("x")
+        progress_bar = SimpleNamespace(total=None)
+
+        scanner = FileScanner(mock_config)
+        scanner._start_progress_estimate(temp_dir, progress_bar)
+
+        deadline = time.monotonic() + 5
+        while progress_bar.total is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert progress_bar.total == 3
+
+    def test_prefer_warm_files_defers_cold_files(self, mock_config, temp_dir):
+        """With prefer_warm_files, uncached files are processed after the walk."""
+        for name in ("a_cold.txt", "b_warm.txt", "c_cold.txt", "d_warm.txt"):
+            (Path(temp_dir) / name).write_text("content")
+        mock_config.scan.prefer_warm_files = True
+
+        def residency(path, size):
+            return 0.0 if "cold" in path else 1.0
+
+        processed = []
+        scanner = FileScanner(mock_config)
+        with patch("core.scanner.page_cache_residency", side_effect=residency):
+            result = scanner.scan(
+                temp_dir, file_callback=lambda info: processed.append(info.path)
+            )
+
+        names = [os.path.basename(p) for p in processed]
+        assert sorted(names[:2]) == ["b_warm.txt", "d_warm.txt"]
+        assert sorted(names[2:]) == ["a_cold.txt", "c_cold.txt"]
+        assert result.files_processed == 4
+
+    def test_verbose_file_log_is_lazily_formatted(self, mock_config, temp_dir):
+        """Per-file debug records pass %-style args instead of prebuilt strings."""
+        (Path(temp_dir) / "a.txt").write_text("content")
+        mock_config.runtime.verbose = True
+        mock_config.logger.isEnabledFor.return_value = True
+
+        FileScanner(mock_config).scan(temp_dir)
+
+        formats = [c.args[0] for c in mock_config.logger.debug.call_args_list]
+        assert "Processing file %d: %s (%.2f MB)" in formats
+
     def test_file_info_creation(self):
         """Test FileInfo dataclass."""
         file_info = FileInfo(path="/test/file.txt", extension=".txt", size_mb=1.5)
@@ -148,6 +334,8 @@ class TestFileScanner:
         assert file_info.path == "/test/file.txt"
         assert file_info.extension == ".txt"
         assert file_info.size_mb == 1.5
+        # Slotted: no per-instance __dict__ on the one-per-file object.
+        assert not hasattr(file_info, "__dict__")
 
     def test_scan_result_creation(self):
         """Test ScanResult dataclass."""
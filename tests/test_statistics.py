@@ -193,6 +193,9 @@ class TestStatistics:
         assert stats.extension_counts[".pdf"] == 5
         assert stats.extension_counts[".txt"] == 3
         assert stats.extension_counts[".docx"] == 2
+        # A copy: later changes to the scan result do not leak in.
+        extension_counts[".pdf"] = 99
+        assert stats.extension_counts[".pdf"] == 5
         assert stats.total_errors == 3  # 2 + 1
         assert stats.errors_by_type["Permission denied"] == 2
         assert stats.errors_by_type["File not found"] == 1
@@ -249,6 +252,15 @@ class TestStatistics:
             "mbox_message_unparseable": 1,
         }
 
+    def test_get_summary_dict_orders_extensions_by_count(self):
+        """file_extensions is ordered by count; ties keep first-seen order."""
+        stats = Statistics()
+        stats.extension_counts = {".txt": 1, ".pdf": 4, ".csv": 1, ".docx": 2}
+
+        summary = stats.get_summary_dict()
+
+        assert list(summary["file_extensions"]) == [".pdf", ".docx", ".txt", ".csv"]
+
 
 class TestNerStats:
     """Tests for NerStats class."""
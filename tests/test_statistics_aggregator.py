@@ -173,3 +173,119 @@ def test_aggregator_file_scanned():
     assert stats["statistics_by_file_type"][".pdf"]["files_analyzed"] == 1
     assert stats["statistics_by_file_type"][".docx"]["files_scanned"] == 1
     assert stats["statistics_by_file_type"][".docx"]["files_analyzed"] == 1
+
+
+def test_aggregator_reports_only_seen_dimensions():
+    """Dimensions without matches are not reported; seen ones carry a sensitivity."""
+    agg = StatisticsAggregator()
+    agg.add_match(create_test_match("x", "/path/file1.txt", "REGEX_EMAIL"))
+    agg.add_match(create_test_match("y", "/path/file1.txt", "SOMETHING_UNKNOWN"))
+
+    by_dimension = agg.get_statistics()["statistics_by_dimension"]
+
+    assert set(by_dimension) == {"contact_information", "other"}
+    assert by_dimension["contact_information"]["sensitivity_level"] == "medium"
+    assert by_dimension["other"]["sensitivity_level"] == "variable"
+    assert type(by_dimension["other"]["by_type"]) is dict
+
+
+def test_aggregator_types_and_top_dimensions():
+    """Distinct types per module and per-file-type dimensions are reported."""
+    agg = StatisticsAggregator()
+    for detection_type in ("REGEX_EMAIL", "REGEX_EMAIL", "REGEX_IBAN", "REGEX_PHONE"):
+        agg.add_match(create_test_match("x", "/path/file1.pdf", detection_type))
+    agg.add_match(create_test_match("y", "/path/file2.txt", "REGEX_IBAN"))
+
+    stats = agg.get_statistics()
+
+    assert stats["statistics_by_module"]["regex"]["types_detected"] == 3
+    assert stats["statistics_by_file_type"][".pdf"]["top_dimensions"] == [
+        "contact_information",
+        "financial",
+    ]
+    assert stats["statistics_by_file_type"][".txt"]["top_dimensions"] == ["financial"]
+
+
+def test_aggregator_confidence_bucket_edges():
+    """Bucket edges are inclusive on the left."""
+    agg = StatisticsAggregator()
+    for score in (0.0, 0.49, 0.5, 0.7, 0.89, 0.9, 1.0):
+        agg.add_match(
+            create_test_match("x", "/path/f.txt", "NER_PERSON", "gliner", score)
+        )
+
+    dist = agg.get_statistics()["statistics_by_module"]["gliner"][
+        "confidence_distribution"
+    ]
+
+    assert dist == {"0.0-0.5": 2, "0.5-0.7": 1, "0.7-0.9": 2, "0.9-1.0": 2}
+
+
+def test_aggregator_file_type_with_interleaved_files():
+    """Per-file-type counts stay correct when matches alternate between files."""
+    agg = StatisticsAggregator()
+    for path in ("/a/one.pdf", "/a/one.pdf", "/a/two.TXT", "/a/one.pdf"):
+        agg.add_match(create_test_match("x", path, "REGEX_EMAIL"))
+    agg.add_file_scanned("/a/three.eml", was_analyzed=True)
+
+    by_file_type = agg.get_statistics()["statistics_by_file_type"]
+
+    assert by_file_type[".pdf"]["matches_found"] == 3
+    assert by_file_type[".txt"]["matches_found"] == 1
+    assert by_file_type[".eml"]["files_analyzed"] == 1
+
+
+def test_aggregator_unique_file_counts_across_many_files():
+    """Unique-file counts stay exact beyond a handful of files."""
+    agg = StatisticsAggregator()
+    for i in range(1000):
+        agg.add_match(create_test_match("x", f"/path/file{i % 300}.txt", "REGEX_EMAIL"))
+        agg.add_match(create_test_match("y", f"/path/file{i % 7}.txt", "REGEX_IBAN"))
+
+    stats = agg.get_statistics()
+
+    assert stats["summary"]["unique_files_with_matches"] == 300
+    assert (
+        stats["statistics_by_dimension"]["contact_information"]["files_affected"] == 300
+    )
+    assert stats["statistics_by_dimension"]["financial"]["files_affected"] == 7
+    assert stats["statistics_by_module"]["regex"]["files_with_matches"] == 300
+
+
+def test_aggregator_strict_mode_keeps_no_paths():
+    """Strict mode reports file-unique metrics as None."""
+    agg = StatisticsAggregator(strict=True)
+    agg.add_match(create_test_match("x", "/path/file1.txt", "REGEX_EMAIL"))
+
+    stats = agg.get_statistics()
+
+    assert stats["summary"]["unique_files_with_matches"] is None
+    assert (
+        stats["statistics_by_dimension"]["contact_information"]["files_affected"]
+        is None
+    )
+    assert agg._file_ids is None
+
+
+def test_aggregator_highest_risk_dimension_tie_keeps_first_seen():
+    """On equal counts the first very-high dimension seen stays the highest risk."""
+    agg = StatisticsAggregator()
+    agg.add_match(create_test_match("x", "/p/a.txt", "NER_HEALTH", "gliner"))
+    agg.add_match(create_test_match("x", "/p/a.txt", "NER_BIOMETRIC", "gliner"))
+    agg.add_match(create_test_match("x", "/p/a.txt", "NER_BIOMETRIC", "gliner"))
+    agg.add_match(create_test_match("x", "/p/a.txt", "NER_HEALTH", "gliner"))
+    agg.add_match(create_test_match("x", "/p/a.txt", "REGEX_EMAIL"))
+
+    summary = agg.get_statistics()["summary"]
+
+    assert summary["highest_risk_dimension"] == "health"
+    assert summary["total_matches"] == 5
+    assert summary["risk_assessment"] == {
+        "very_high_risk_count": 4,
+        "high_risk_count": 0,
+        "medium_risk_count": 1,
+        "low_risk_count": 0,
+    }
+
+    agg.add_match(create_test_match("x", "/p/a.txt", "NER_BIOMETRIC", "gliner"))
+    assert agg.get_statistics()["summary"]["highest_risk_dimension"] == "biometric"